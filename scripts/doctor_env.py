@@ -503,6 +503,10 @@ def main() -> None:
         "pytesseract",
         # Optional: overlay polygon extraction helpers (scripts/extract_overlay_polygons.py).
         "skimage",
+        # Optional: faster JSON for API responses/evidence (eia-gen[fast-json]).
+        "orjson",
+        # Optional: HTTP/2 for the shared API client (eia-gen[http2]).
+        "h2",
     ]:
         checks.append(_check_import(mod))
 
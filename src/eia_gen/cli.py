@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from pathlib import Path
 from enum import Enum
 import json
@@ -2037,6 +2038,33 @@ class VerifyKeysMode(str, Enum):
     presence = "presence"
 
 
+@dataclass(frozen=True, slots=True)
+class _KeySnapshot:
+    """Stripped API keys resolved once per `verify-keys` run (values are never printed)."""
+
+    kma: str | None
+    datago: str | None
+    airkorea: str | None
+    safemap: str | None
+    kosis: str | None
+    vworld: str | None
+
+    @classmethod
+    def from_settings(cls) -> "_KeySnapshot":
+        def _v(raw: str | None) -> str | None:
+            return (raw or "").strip() or None
+
+        datago = _v(settings.data_go_kr_service_key)
+        return cls(
+            kma=_v(settings.kma_api_key) or datago,
+            datago=datago,
+            airkorea=_v(settings.airkorea_api_key) or datago,
+            safemap=_v(settings.safemap_api_key),
+            kosis=_v(settings.kosis_api_key),
+            vworld=_v(settings.vworld_api_key),
+        )
+
+
 @app.command("verify-keys")
 def verify_keys(
     mode: VerifyKeysMode = typer.Option(
@@ -2076,20 +2104,7 @@ def verify_keys(
     from eia_gen.services.data_requests.sanitize import redact_text
     from eia_gen.services.data_requests.wms import fetch_wms
 
-    def _present(env: str) -> bool:
-        import os
-
-        return bool(os.environ.get(env, "").strip())
-
-    def _kma_key() -> str:
-        import os
-
-        return (os.environ.get("KMA_API_KEY") or os.environ.get("DATA_GO_KR_SERVICE_KEY") or "").strip()
-
-    def _airkorea_key() -> str:
-        import os
-
-        return (os.environ.get("AIRKOREA_API_KEY") or os.environ.get("DATA_GO_KR_SERVICE_KEY") or "").strip()
+    keys = _KeySnapshot.from_settings()
 
     def _wms_bbox_3857(lon: float, lat: float, radius_m: int) -> tuple[float, float, float, float]:
         t = Transformer.from_crs(CRS.from_epsg(4326), CRS.from_epsg(3857), always_xy=True)
@@ -2138,7 +2153,7 @@ def verify_keys(
     console.print("[bold]Key/Endpoint Checks[/bold]")
 
     if mode == VerifyKeysMode.presence:
-        key_datago = _kma_key()
+        key_datago = keys.kma or ""
         if not key_datago:
             _print_status(
                 "KMA ASOS (data.go.kr)",
@@ -2149,7 +2164,7 @@ def verify_keys(
         else:
             _print_status("KMA ASOS (data.go.kr)", True, "key present (network skipped)", category="present")
 
-        key_air = _airkorea_key()
+        key_air = keys.airkorea or ""
         if not key_air:
             _print_status(
                 "AirKorea (data.go.kr)",
@@ -2160,13 +2175,13 @@ def verify_keys(
         else:
             _print_status("AirKorea (data.go.kr)", True, "key present (network skipped)", category="present")
 
-        if not _present("SAFEMAP_API_KEY"):
+        if not keys.safemap:
             _print_status("SAFEMAP WMS", False, "missing `SAFEMAP_API_KEY`", category="missing_key")
         else:
             _print_status("SAFEMAP WMS", True, "key present (network skipped)", category="present")
 
         # --- KOSIS ---
-        if _present("KOSIS_API_KEY"):
+        if keys.kosis:
             msg = "key present (note: DATA_REQUESTS에 orgId/tblId/itmId 등 query_params가 필요)"
             console.print(f"- KOSIS: [green]OK[/green] {msg}")
             _record("KOSIS", "ok", msg, category="present")
@@ -2174,7 +2189,7 @@ def verify_keys(
             _print_skip("KOSIS", "missing `KOSIS_API_KEY` (통계 자동수집은 선택)", category="missing_key_optional")
 
         # --- VWORLD (optional) ---
-        if _present("VWORLD_API_KEY"):
+        if keys.vworld:
             msg = "key present (geocode quality improves)"
             console.print(f"- VWORLD: [green]OK[/green] {msg}")
             _record("VWORLD", "ok", msg, category="present")
@@ -2208,7 +2223,7 @@ def verify_keys(
         return
 
     # --- data.go.kr / KMA ASOS ---
-    key_datago = _kma_key()
+    key_datago = keys.kma or ""
     if not key_datago:
         _print_status(
             "KMA ASOS (data.go.kr)",
@@ -2278,7 +2293,7 @@ def verify_keys(
             console.print("  hint: data.go.kr에서 해당 API 활용신청/승인 여부 및 'Decoding(일반)' 키 사용 여부를 확인하세요.")
 
     # --- AirKorea (data.go.kr) ---
-    key_air = _airkorea_key()
+    key_air = keys.airkorea or ""
     if not key_air:
         _print_status(
             "AirKorea (data.go.kr)",
@@ -2399,7 +2414,7 @@ def verify_keys(
             console.print("  hint: 공공데이터포털 '생태자연도 서비스'는 별도 활용신청/승인이 필요할 수 있습니다(403=승인/권한).")
 
     # --- SAFEMAP WMS ---
-    if not _present("SAFEMAP_API_KEY"):
+    if not keys.safemap:
         _print_status("SAFEMAP WMS", False, "missing `SAFEMAP_API_KEY`", category="missing_key")
     else:
         bbox = _wms_bbox_3857(float(center_lon), float(center_lat), int(wms_radius_m))
@@ -2438,7 +2453,7 @@ def verify_keys(
                 console.print("  hint: 생활안전지도 OpenAPI 키는 서비스별 승인/제한이 있을 수 있습니다.")
 
     # --- KOSIS ---
-    if not _present("KOSIS_API_KEY"):
+    if not keys.kosis:
         _print_skip("KOSIS", "missing `KOSIS_API_KEY` (통계 자동수집은 선택)", category="missing_key_optional")
     elif mode == VerifyKeysMode.presence:
         msg = "key present"
@@ -2448,9 +2463,7 @@ def verify_keys(
         # Quick smoke check (no user inputs): 전국(00) + 총인구(T100) 1개 셀만 조회해
         # 키/엔드포인트/응답 형태를 확인한다.
         try:
-            import os
-
-            key_kosis = os.environ.get("KOSIS_API_KEY", "").strip()
+            key_kosis = keys.kosis or ""
             base_url = "https://kosis.kr/openapi/Param/statisticsParameterData.do"
             params = {
                 "method": "getList",
@@ -2479,7 +2492,7 @@ def verify_keys(
             console.print("  hint: KOSIS는 `openapi/Param/statisticsParameterData.do` 엔드포인트가 필요합니다(SSOT: config/kosis_datasets.yaml).")
 
     # --- VWORLD (optional) ---
-    if _present("VWORLD_API_KEY"):
+    if keys.vworld:
         msg = "key present (geocode quality improves)"
         console.print(f"- VWORLD: [green]OK[/green] {msg}")
         _record("VWORLD", "ok", msg, category="present")
@@ -2540,10 +2553,24 @@ def fetch_kma_asos_stations(
 
         console.print(f"[red]ERROR[/red] fetch-kma-asos-stations failed: {redact_text(str(e))}")
         raise typer.Exit(code=1)
-    write_asos_station_catalog_csv(out, cat.stations)
+    import os
 
+    # Write both files to sibling tmp paths first, then swap them in, so a crash never
+    # leaves a CSV without matching evidence (or a half-written CSV).
     ev_path = out.with_suffix(".evidence.json")
-    ev_path.write_bytes(evidence_bytes(cat.evidence_json))
+    tmp_out = out.with_name(out.name + ".tmp")
+    tmp_ev = ev_path.with_name(ev_path.name + ".tmp")
+    try:
+        write_asos_station_catalog_csv(tmp_out, cat.stations)
+        with tmp_ev.open("wb", buffering=1 << 20) as fh:
+            fh.write(evidence_bytes(cat.evidence_json))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_ev, ev_path)
+        os.replace(tmp_out, out)
+    finally:
+        tmp_out.unlink(missing_ok=True)
+        tmp_ev.unlink(missing_ok=True)
 
     console.print(f"[green]OK[/green] wrote {out} (stations={len(cat.stations)})")
     console.print(f"[green]OK[/green] wrote {ev_path}")
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from eia_gen.models.fields import QuantityField, TextField
 
@@ -14,15 +15,26 @@ class ScopingClass(str, Enum):
     EXCLUDE = "EXCLUDE"
 
 
+_FOCUS_KEYWORDS = frozenset({"FOCUS", "중점", "중점평가", "중점평가항목"})
+_BASELINE_KEYWORDS = frozenset({"BASELINE", "현황", "현황조사", "현황조사항목"})
+_EXCLUDE_KEYWORDS = frozenset({"EXCLUDE", "제외", "평가제외", "평가제외항목"})
+
+# keyword -> class (one hash lookup instead of three set probes)
+_SCOPING_CLASS_BY_KEYWORD: dict[str, ScopingClass] = {
+    **dict.fromkeys(_FOCUS_KEYWORDS, ScopingClass.FOCUS),
+    **dict.fromkeys(_BASELINE_KEYWORDS, ScopingClass.BASELINE),
+    **dict.fromkeys(_EXCLUDE_KEYWORDS, ScopingClass.EXCLUDE),
+}
+
+
+# Keyed by the raw category text (not cached per item), so edits to `category` stay visible.
+@lru_cache(maxsize=256)
 def _normalize_scoping_class(value: str) -> ScopingClass:
-    v = (value or "").strip().upper()
-    if v in {"FOCUS", "중점", "중점평가", "중점평가항목"}:
-        return ScopingClass.FOCUS
-    if v in {"BASELINE", "현황", "현황조사", "현황조사항목"}:
-        return ScopingClass.BASELINE
-    if v in {"EXCLUDE", "제외", "평가제외", "평가제외항목"}:
-        return ScopingClass.EXCLUDE
-    raise ValueError(f"invalid scoping class: {value!r}")
+    # Korean keywords are unaffected by upper().
+    cls = _SCOPING_CLASS_BY_KEYWORD.get((value or "").strip().upper())
+    if cls is None:
+        raise ValueError(f"invalid scoping class: {value!r}")
+    return cls
 
 
 class Meta(BaseModel):
@@ -187,7 +199,9 @@ class PriorAssessments(BaseModel):
 class InfluenceArea(BaseModel):
     model_config = ConfigDict(extra="allow")
 
-    radius_m: QuantityField = Field(default_factory=lambda: QuantityField(v=500.0, u="m"))
+    radius_m: QuantityField = Field(
+        default_factory=lambda: QuantityField.model_construct(v=500.0, u="m")
+    )
     justification: TextField = Field(default_factory=TextField)
 
 
@@ -402,16 +416,34 @@ class Case(BaseModel):
     resident_opinion: ResidentOpinion = Field(default_factory=ResidentOpinion)
     assets: list[Asset] = Field(default_factory=list)
 
+    # item_id -> ScopingItem, built during validation. It is stamped with the identity and
+    # length of `scoping_matrix` and rebuilt lazily when those change (reassignment, append,
+    # model_copy); in-place item_id edits still need `reindex_scoping()`.
+    _scoping_index: dict[str, ScopingItem] = PrivateAttr(default_factory=dict)
+    _scoping_stamp: tuple[int, int] = PrivateAttr(default=(0, -1))
+
     @model_validator(mode="after")
     def _validate_scoping(self) -> "Case":
-        seen: set[str] = set()
+        seen: dict[str, ScopingItem] = {}
         for item in self.scoping_matrix:
             if item.item_id in seen:
                 raise ValueError(f"duplicate scoping item_id: {item.item_id}")
-            seen.add(item.item_id)
+            seen[item.item_id] = item
             if item.scoping_class == ScopingClass.EXCLUDE and item.exclude_reason.is_empty():
                 raise ValueError(
                     f"scoping item {item.item_id} is EXCLUDE but exclude_reason is empty"
                 )
+        self._scoping_index = seen
+        self._scoping_stamp = (id(self.scoping_matrix), len(self.scoping_matrix))
         return self
 
+    def scoping_by_id(self, item_id: str) -> ScopingItem | None:
+        if self._scoping_stamp != (id(self.scoping_matrix), len(self.scoping_matrix)):
+            self.reindex_scoping()
+        return self._scoping_index.get(item_id)
+
+    def reindex_scoping(self) -> None:
+        """Rebuild the item_id index after scoping ids are edited in place (e.g. canonicalize)."""
+        self._scoping_index = {item.item_id: item for item in self.scoping_matrix}
+        self._scoping_stamp = (id(self.scoping_matrix), len(self.scoping_matrix))
+
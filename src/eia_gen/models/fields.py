@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidatorFunctionWrapHandler, model_validator
 
 
 class TextField(BaseModel):
@@ -13,6 +13,8 @@ class TextField(BaseModel):
     - dict: {"t": "...", "src": [...], "note": "...", "confidential": true}
     """
 
+    # extra="ignore" keeps `__pydantic_extra__` unallocated. Not frozen: figure generators
+    # update `caption.t` in place.
     model_config = ConfigDict(extra="ignore")
 
     t: str = ""
@@ -20,25 +22,32 @@ class TextField(BaseModel):
     note: str | None = None
     confidential: bool | None = None
 
-    @model_validator(mode="before")
+    @model_validator(mode="wrap")
     @classmethod
-    def _coerce(cls, v: Any) -> Any:
-        if v is None:
-            return {"t": ""}
+    def _coerce(cls, v: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+        # Scalars (the bulk of case.yaml/xlsx values) need no validation beyond the
+        # coercion itself, so build them directly and skip the dict->model pass.
         if isinstance(v, str):
-            return {"t": v}
+            return cls.model_construct(t=v)
+        if v is None:
+            return cls.model_construct(t="")
         if isinstance(v, dict):
-            # allow either "t" or "text"
+            # allow either "t" or "text" (copy only when the alias is actually used)
             if "t" not in v and "text" in v:
-                v = {**v, "t": v.get("text", "")}
-            return v
-        return {"t": str(v)}
+                v = dict(v)
+                v["t"] = v.pop("text")
+            return handler(v)
+        if isinstance(v, cls):
+            return handler(v)
+        return cls.model_construct(t=str(v))
 
     def is_empty(self) -> bool:
-        return self.t.strip() == ""
+        # `isspace()` scans without allocating a stripped copy.
+        return not self.t or self.t.isspace()
 
     def text_or_placeholder(self, placeholder: str = "【작성자 기입 필요】") -> str:
-        return self.t.strip() if self.t.strip() else placeholder
+        s = self.t.strip() if self.t else ""
+        return s if s else placeholder
 
 
 class QuantityField(BaseModel):
@@ -56,23 +65,27 @@ class QuantityField(BaseModel):
     src: list[str] = Field(default_factory=list)
     note: str | None = None
 
-    @model_validator(mode="before")
+    @model_validator(mode="wrap")
     @classmethod
-    def _coerce(cls, v: Any) -> Any:
+    def _coerce(cls, v: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+        # Scalars need no validation beyond the coercion itself (see TextField._coerce).
         if v is None:
-            return {"v": None}
+            return cls.model_construct(v=None)
         if isinstance(v, (int, float)):
-            return {"v": float(v)}
+            return cls.model_construct(v=float(v))
         if isinstance(v, dict):
-            # allow either "v" or "value"
+            # allow either "v" or "value" (copy only when the alias is actually used)
             if "v" not in v and "value" in v:
-                v = {**v, "v": v.get("value")}
-            return v
+                v = dict(v)
+                v["v"] = v.pop("value")
+            return handler(v)
+        if isinstance(v, cls):
+            return handler(v)
         # best effort
         try:
-            return {"v": float(v)}
+            return cls.model_construct(v=float(v))
         except Exception:
-            return {"v": None, "note": f"non-numeric: {v!r}"}
+            return cls.model_construct(v=None, note=f"non-numeric: {v!r}")
 
     def is_empty(self) -> bool:
         return self.v is None
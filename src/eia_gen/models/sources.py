@@ -2,38 +2,61 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import AliasChoices, BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+# Accepted legacy/v2 key names per field, in precedence order (the field name itself wins).
+_SOURCE_ENTRY_ALIASES: dict[str, tuple[str, ...]] = {
+    # v1 `id` / v2 `source_id`
+    "id": ("source_id",),
+    # v1 `type` / v2 `kind`
+    "type": ("kind",),
+    # v2 commonly uses issued_date / published_date.
+    "date": ("issued_date", "published_date", "published_at", "issued_at"),
+    "access_date": ("accessed_date", "accessed_at"),
+    "file_path": ("local_file",),
+    "file_or_url": ("url",),
+}
+_SOURCE_ENTRY_ALIAS_KEYS = frozenset(k for keys in _SOURCE_ENTRY_ALIASES.values() for k in keys)
 
 
 class SourceEntry(BaseModel):
     model_config = ConfigDict(extra="allow")
 
-    # Accept both v1 (`id`) and v2 (`source_id`) keys.
-    id: str = Field(validation_alias=AliasChoices("id", "source_id"))
-    # Accept both v1 (`type`) and v2 (`kind`) naming.
-    type: str | None = Field(default=None, validation_alias=AliasChoices("type", "kind"))
+    id: str
+    type: str | None = None
     title: str | None = None
     publisher: str | None = None
-    # v2 commonly uses issued_date / published_date.
-    date: str | None = Field(
-        default=None,
-        validation_alias=AliasChoices("date", "issued_date", "published_date", "published_at", "issued_at"),
-    )
+    date: str | None = None
     pages: str | None = None
-    access_date: str | None = Field(
-        default=None, validation_alias=AliasChoices("access_date", "accessed_date", "accessed_at")
-    )
+    access_date: str | None = None
     period: str | None = None
     station_name: str | None = None
     station_coord: dict[str, float | None] | None = None
     station_distance_km: float | None = None
-    file_path: str | None = Field(default=None, validation_alias=AliasChoices("file_path", "local_file"))
-    file_or_url: str | None = Field(default=None, validation_alias=AliasChoices("file_or_url", "url"))
+    file_path: str | None = None
+    file_or_url: str | None = None
     coverage: str | None = None
     note: str | None = None
     notes: str | None = None
     confidential: bool | None = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def _rename_aliases(cls, v: Any) -> Any:
+        # One rename pass per entry instead of per-field AliasChoices probing.
+        # Unused alias keys (e.g. both `id` and `source_id` given) stay in model_extra.
+        if not isinstance(v, dict) or _SOURCE_ENTRY_ALIAS_KEYS.isdisjoint(v):
+            return v
+        out = dict(v)
+        for field, aliases in _SOURCE_ENTRY_ALIASES.items():
+            if field in out:
+                continue
+            for alias in aliases:
+                if alias in out:
+                    out[field] = out.pop(alias)
+                    break
+        return out
+
 
 class SourceRegistry(BaseModel):
     # v2 sources.yaml commonly includes top-level metadata (version/project/etc).
@@ -42,6 +65,11 @@ class SourceRegistry(BaseModel):
 
     sources: list[SourceEntry] = Field(default_factory=list)
 
+    # id -> entry, built during validation. It is stamped with the identity and length of
+    # `sources` and rebuilt on lookup when those change (reassignment, append, model_copy).
+    _index: dict[str, SourceEntry] = PrivateAttr(default_factory=dict)
+    _index_stamp: tuple[int, int] = PrivateAttr(default=(0, -1))
+
     @model_validator(mode="before")
     @classmethod
     def _coerce(cls, v: Any) -> Any:
@@ -66,18 +94,26 @@ class SourceRegistry(BaseModel):
 
     @model_validator(mode="after")
     def _validate_unique_ids(self) -> "SourceRegistry":
-        seen: set[str] = set()
+        seen: dict[str, SourceEntry] = {}
         for s in self.sources:
             if s.id in seen:
                 raise ValueError(f"duplicate source id: {s.id}")
-            seen.add(s.id)
+            seen[s.id] = s
+        self._index = seen
+        self._index_stamp = (id(self.sources), len(self.sources))
         return self
 
+    def _lookup(self) -> dict[str, SourceEntry]:
+        if self._index_stamp != (id(self.sources), len(self.sources)):
+            index: dict[str, SourceEntry] = {}
+            for s in self.sources:
+                index.setdefault(s.id, s)  # first entry wins, like the old linear scan
+            self._index = index
+            self._index_stamp = (id(self.sources), len(self.sources))
+        return self._index
+
     def has(self, source_id: str) -> bool:
-        return any(s.id == source_id for s in self.sources)
+        return source_id in self._lookup()
 
     def get(self, source_id: str) -> SourceEntry | None:
-        for s in self.sources:
-            if s.id == source_id:
-                return s
-        return None
+        return self._lookup().get(source_id)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from itertools import chain
+
 from eia_gen.models.case import Case
 from eia_gen.models.fields import QuantityField, TextField
 
@@ -17,99 +19,113 @@ ITEM_ID_ALIASES: dict[str, str] = {
 }
 
 
+_ALIAS_GET = ITEM_ID_ALIASES.get
+
+
 def canonicalize_item_id(item_id: str) -> str:
-    return ITEM_ID_ALIASES.get(item_id, item_id)
+    return _ALIAS_GET(item_id, item_id)
 
 
 def canonicalize_case(case: Case) -> Case:
+    # Derived fields below are built from already-validated values, so they use
+    # `model_construct` (no validators) instead of the coercing constructors. Pass only the
+    # fields the constructors used to set, so `model_fields_set` (exclude_unset dumps) matches.
     # scoping_matrix
     for item in case.scoping_matrix:
-        item.item_id = canonicalize_item_id(item.item_id)
+        item.item_id = _ALIAS_GET(item.item_id, item.item_id)
+    case.reindex_scoping()
 
     # mitigation.related_impacts
     for m in case.mitigation.measures:
-        m.related_impacts = [canonicalize_item_id(i) for i in m.related_impacts]
+        m.related_impacts = [_ALIAS_GET(i, i) for i in m.related_impacts]
 
     # project_overview.area: compute derived fields (best-effort)
     area = case.project_overview.area
 
-    # (1) total_area_m2: if missing, sum parcels
-    if area.total_area_m2.v is None:
-        total = 0.0
-        srcs: list[str] = []
-        has_any = False
-        for p in area.parcels:
-            if p.area_m2.v is None:
-                continue
-            has_any = True
-            total += float(p.area_m2.v)
-            for sid in (p.area_m2.src or []) + (p.jibun.src or []) + (p.zoning.src or []):
-                s = (sid or "").strip()
-                if s and s not in srcs:
-                    srcs.append(s)
-        if has_any:
-            area.total_area_m2 = QuantityField(v=total, u=area.total_area_m2.u or "m2", src=srcs)
-
-    # (2) zoning_area_m2: if empty, aggregate by parcel zoning
-    if not area.zoning_area_m2:
-        grouped: dict[str, tuple[float, list[str]]] = {}
+    ll = case.baseline.landuse_landscape
+    need_total = area.total_area_m2.v is None
+    need_zoning = not area.zoning_area_m2
+    need_landcover = ll.current_landcover_summary.is_empty()
+
+    # Single pass over parcels feeding every derived field below. Source ids are
+    # deduplicated with dict keys (insertion order = first-seen order).
+    total = 0.0
+    has_any = False
+    total_srcs: dict[str, None] = {}
+    zoning_sums: dict[str, float] = {}
+    zoning_srcs: dict[str, dict[str, None]] = {}
+    cat_counts: dict[str, int] = {}
+    cat_srcs: dict[str, None] = {}
+    if need_total or need_zoning or need_landcover:
         for p in area.parcels:
-            zoning = (p.zoning.t or "").strip()
-            if not zoning:
-                continue
-            if p.area_m2.v is None:
-                continue
-            cur_v, cur_srcs = grouped.get(zoning, (0.0, []))
-            cur_v += float(p.area_m2.v)
-            for sid in (p.area_m2.src or []) + (p.zoning.src or []) + (p.jibun.src or []):
-                s = (sid or "").strip()
-                if s and s not in cur_srcs:
-                    cur_srcs.append(s)
-            grouped[zoning] = (cur_v, cur_srcs)
-        if grouped:
-            area.zoning_area_m2 = {
-                k: QuantityField(v=v, u="m2", src=srcs) for k, (v, srcs) in grouped.items()
-            }
+            area_src = p.area_m2.src or ()
+            jibun_src = p.jibun.src or ()
+            v = p.area_m2.v
+            if v is not None:
+                zoning_src = p.zoning.src or ()
+                # (1) total_area_m2: if missing, sum parcels
+                if need_total:
+                    has_any = True
+                    total += v
+                    for sid in chain(area_src, jibun_src, zoning_src):
+                        s = (sid or "").strip()
+                        if s:
+                            total_srcs[s] = None
+                # (2) zoning_area_m2: if empty, aggregate by parcel zoning
+                zoning = (p.zoning.t or "").strip() if need_zoning else ""
+                if zoning:
+                    zoning_sums[zoning] = zoning_sums.get(zoning, 0.0) + v
+                    cur_srcs = zoning_srcs.setdefault(zoning, {})
+                    for sid in chain(area_src, zoning_src, jibun_src):
+                        s = (sid or "").strip()
+                        if s:
+                            cur_srcs[s] = None
+            # (3) land category distribution (for the landcover summary)
+            if need_landcover:
+                k = (p.land_category.t or "").strip()
+                if k:
+                    cat_counts[k] = cat_counts.get(k, 0) + 1
+                for sid in chain(p.land_category.src or (), area_src, jibun_src):
+                    s = (sid or "").strip()
+                    if s:
+                        cat_srcs[s] = None
+
+    if has_any:
+        area.total_area_m2 = QuantityField.model_construct(
+            v=total, u=area.total_area_m2.u or "m2", src=list(total_srcs)
+        )
+    if zoning_sums:
+        area.zoning_area_m2 = {
+            k: QuantityField.model_construct(v=v, u="m2", src=list(zoning_srcs[k]))
+            for k, v in zoning_sums.items()
+        }
 
     # baseline.landuse_landscape: best-effort summaries from parcels
-    ll = case.baseline.landuse_landscape
-    if ll.current_landcover_summary.is_empty():
+    if need_landcover:
         # Prefer parcel land category distribution when available.
-        from collections import Counter
-
-        landcats = [(p.land_category.t or "").strip() for p in area.parcels]
-        landcats = [x for x in landcats if x]
-        counts = Counter(landcats)
         total_m2 = area.total_area_m2.v
         parcel_count = len(area.parcels)
 
         summary = ""
-        if counts and parcel_count and total_m2 is not None:
-            items = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
-            joined = ", ".join([f"{k} {v}필지" for k, v in items])
-            summary = (
-                f"대상지 지번({parcel_count}필지)은 지목 기준 {joined}로 구성되며, "
-                f"총 면적은 {int(total_m2):,}m²이다."
-            )
-        elif counts and parcel_count:
-            items = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        if cat_counts and parcel_count:
+            items = sorted(cat_counts.items(), key=lambda kv: (-kv[1], kv[0]))
             joined = ", ".join([f"{k} {v}필지" for k, v in items])
-            summary = f"대상지 지번({parcel_count}필지)은 지목 기준 {joined}로 구성된다."
+            if total_m2 is not None:
+                summary = (
+                    f"대상지 지번({parcel_count}필지)은 지목 기준 {joined}로 구성되며, "
+                    f"총 면적은 {int(total_m2):,}m²이다."
+                )
+            else:
+                summary = f"대상지 지번({parcel_count}필지)은 지목 기준 {joined}로 구성된다."
         elif parcel_count and total_m2 is not None:
             summary = f"대상지 총 면적은 {int(total_m2):,}m²이다."
 
         if summary:
-            srcs: list[str] = []
-            for p in area.parcels:
-                for sid in (p.land_category.src or []) + (p.area_m2.src or []) + (p.jibun.src or []):
-                    s = (sid or "").strip()
-                    if s and s not in srcs:
-                        srcs.append(s)
             for sid in area.total_area_m2.src or []:
                 s = (sid or "").strip()
-                if s and s not in srcs:
-                    srcs.append(s)
-            ll.current_landcover_summary = TextField(t=summary, src=srcs)
+                if s:
+                    cat_srcs[s] = None
+            ll.current_landcover_summary = TextField.model_construct(t=summary, src=list(cat_srcs))
 
     # baseline.population_traffic: best-effort nearest_village from address/admin
     pt = case.baseline.population_traffic
@@ -119,6 +135,6 @@ def canonicalize_case(case: Case) -> Case:
         if addr.endswith("일원"):
             addr = addr[: -len("일원")].strip()
         if addr:
-            pt.nearest_village = TextField(t=addr, src=addr_src)
+            pt.nearest_village = TextField.model_construct(t=addr, src=addr_src)
 
     return case
@@ -4,6 +4,9 @@ import re
 
 
 _CITATION_RE = re.compile(r"〔[^〕]+〕")
+# Same blocks as `_CITATION_RE`, but capturing only the inner token list.
+_CITATION_INNER_RE = re.compile(r"〔([^〕]+)〕")
+_TBD_IDS = frozenset({"S-TBD", "SRC-TBD"})
 
 
 def normalize_ids(ids: list[str]) -> list[str]:
@@ -24,23 +27,16 @@ def format_citations(ids: list[str] | None) -> str:
     ids2 = normalize_ids(ids or [])
     if not ids2:
         ids2 = ["SRC-TBD"]
-    prefixed: list[str] = []
-    for s in ids2:
-        s2 = s.strip()
-        if not s2:
-            continue
-        if s2 in {"S-TBD", "SRC-TBD"}:
-            prefixed.append("SRC-TBD")
-            continue
-        if s2.upper().startswith("SRC:"):
-            prefixed.append(s2)
-        else:
-            prefixed.append(f"SRC:{s2}")
+    # `normalize_ids` already yields stripped, non-empty, unique tokens.
+    prefixed = [
+        "SRC-TBD" if s in _TBD_IDS else s if s[:4].upper() == "SRC:" else f"SRC:{s}" for s in ids2
+    ]
     return f"〔{','.join(prefixed)}〕"
 
 
 def has_citation(text: str) -> bool:
-    return bool(_CITATION_RE.search(text))
+    # Cheap substring probe first: most paragraphs carry no citation block at all.
+    return "〔" in text and bool(_CITATION_RE.search(text))
 
 
 def ensure_citation(text: str, ids: list[str] | None = None) -> str:
@@ -53,6 +49,8 @@ def strip_citations(text: str) -> str:
     """Remove inline citation blocks like `〔SRC:...〕` from text for layout-sensitive outputs."""
     if not text:
         return ""
+    if "〔" not in text:
+        return text.strip()
     return _CITATION_RE.sub("", text).strip()
 
 
@@ -63,18 +61,15 @@ def extract_citation_ids(text: str) -> list[str]:
     - `〔SRC:S-01,SRC:S-02〕`
     - `〔SRC-TBD〕`
     """
-    if not text:
+    if not text or "〔" not in text:
         return []
     ids: list[str] = []
-    for block in _CITATION_RE.findall(text):
-        inner = str(block).strip()
-        if inner.startswith("〔") and inner.endswith("〕"):
-            inner = inner[1:-1]
+    for inner in _CITATION_INNER_RE.findall(text):
         for token in inner.split(","):
             t = token.strip()
             if not t:
                 continue
-            if t.upper().startswith("SRC:"):
+            if t[:4].upper() == "SRC:":
                 t = t[4:].strip()
             if t.upper() == "SRC-TBD":
                 t = "S-TBD"
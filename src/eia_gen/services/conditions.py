@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from eia_gen.services.tables.path import resolve_path
@@ -22,6 +23,14 @@ def _truthy(v: Any) -> bool:
     return s in {"true", "t", "yes", "y", "1"}
 
 
+@lru_cache(maxsize=2048)
+def _parse_condition(expr: str) -> tuple[str, bool] | None:
+    m = _COND_RE.match(expr)
+    if not m:
+        return None
+    return m.group(1), m.group(2).lower() == "true"
+
+
 def eval_condition(obj: Any, expr: str | None) -> bool:
     """Evaluate simple boolean conditions used in spec.
 
@@ -31,12 +40,11 @@ def eval_condition(obj: Any, expr: str | None) -> bool:
 
     if not expr:
         return True
-    m = _COND_RE.match(expr)
-    if not m:
+    parsed = _parse_condition(expr)
+    if parsed is None:
         # Unknown expression -> be safe: treat as False (forces explicit)
         return False
-    path, tf = m.group(1), m.group(2).lower()
-    expected = tf == "true"
+    path, expected = parsed
     v = resolve_path(obj, path)
     # unwrap TextField-like
     if hasattr(v, "t"):
@@ -1,19 +1,36 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import httpx
-from pyproj import CRS, Transformer
+from pyproj import Transformer
 
-from eia_gen.services.data_requests.sanitize import strip_secrets_from_params
 from eia_gen.services.data_requests.data_go_kr import build_url
+from eia_gen.services.data_requests.fast_json import dumps_pretty
+from eia_gen.services.data_requests.fast_json import loads as json_loads
+from eia_gen.services.data_requests.http_client import get_client, rate_limit
 
+AIRKOREA_BASE = "https://apis.data.go.kr/B552584"
 
-AIRKOREA_BASE = "http://apis.data.go.kr/B552584"
+# returnType=json is a query param, but some data.go.kr gateways still fall back to XML
+# (notably on error pages) unless the Accept header asks for JSON too.
+_JSON_HEADERS = {"Accept": "application/json"}
+
+# AirKorea refreshes hourly; within a short window an identical request (same url, params and
+# key) returns the same payload, so successful parsed responses are reused instead of re-requested.
+_MEAS_TTL_SEC = 300.0
+_MEAS_CACHE_MAX = 512
+_MeasCacheKey = tuple[str, str, tuple[tuple[str, str], ...]]
+_meas_cache: dict[_MeasCacheKey, tuple[float, dict[str, Any], bytes]] = {}
+_meas_lock = threading.Lock()
 
 
 def _now_iso() -> str:
@@ -29,40 +46,164 @@ def _service_key() -> str:
     return ""
 
 
+_MISSING_TOKENS = frozenset({"-", "NA", "N/A"})
+
+
 def _as_float(v: Any) -> float | None:
+    # Hot path (called per item x pollutant): numbers and numeric strings succeed on the first
+    # float(); placeholders like "-" fall through to the slow path.
     if v is None:
         return None
-    if isinstance(v, (int, float)):
+    try:
         return float(v)
+    except (TypeError, ValueError):
+        pass
     s = str(v).strip()
-    if not s or s in {"-", "NA", "N/A"}:
+    if not s or s in _MISSING_TOKENS:
         return None
     try:
         return float(s)
-    except Exception:
+    except ValueError:
         return None
 
 
-def _parse_dt(s: str) -> datetime | None:
-    s = (s or "").strip()
-    if not s:
-        return None
-    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S"):
-        try:
-            return datetime.strptime(s, fmt)
-        except Exception:
-            continue
-    return None
+@lru_cache(maxsize=1)
+def _tm5181_transformer() -> Transformer:
+    # PROJ setup costs milliseconds; the CRS pair is fixed, so build it once (lazily).
+    return Transformer.from_crs(4326, 5181, always_xy=True)
 
 
 def _to_tm5181(lon: float, lat: float) -> tuple[float, float]:
     # AirKorea `getNearbyMsrstnList` expects "TM" coordinates (commonly used by Kakao/Daum),
     # which correspond to EPSG:5181 in most practical conversions.
-    t = Transformer.from_crs(CRS.from_epsg(4326), CRS.from_epsg(5181), always_xy=True)
-    x, y = t.transform(lon, lat)
+    x, y = _tm5181_transformer().transform(lon, lat)
     return float(x), float(y)
 
 
+def _response_summary(resp: dict[str, Any], raw: bytes) -> dict[str, Any]:
+    body = ((resp or {}).get("response") or {}).get("body") or {}
+    items = body.get("items") or []
+    if not isinstance(items, list):
+        items = []
+    return {
+        "item_count": len(items),
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "sample": items[:2],
+    }
+
+
+@lru_cache(maxsize=1024)
+def _nearest_station(
+    lon_r: float, lat_r: float, key: str, timeout_sec: int
+) -> tuple[str, float | None, dict[str, Any], dict[str, Any], bytes]:
+    """Resolve the nearest station for rounded (lon, lat).
+
+    Returns (station_name, distance_km, sanitized request, response, raw body). Failures raise
+    and are therefore not cached. Callers must not mutate the returned request/response.
+    """
+    tm_x, tm_y = _to_tm5181(lon_r, lat_r)
+    # The key never enters the params: build_url injects it, so the dict is already evidence-safe.
+    station_params = {
+        "returnType": "json",
+        "tmX": f"{tm_x:.3f}",
+        "tmY": f"{tm_y:.3f}",
+    }
+    station_req = {
+        "url": f"{AIRKOREA_BASE}/MsrstnInfoInqireSvc/getNearbyMsrstnList",
+        "params": station_params,
+    }
+    try:
+        url = build_url(
+            base_url=station_req["url"],
+            service_key=key,
+            params=station_req["params"],
+            key_param="serviceKey",
+        )
+        rate_limit(url)
+        r = get_client().get(url, headers=_JSON_HEADERS, timeout=timeout_sec)
+        r.raise_for_status()
+        station_raw = r.content
+        station_resp = json_loads(station_raw)
+    except httpx.HTTPStatusError as e:
+        status = e.response.status_code
+        raise ValueError(f"AirKorea station request failed: HTTP {status}") from None
+    except httpx.HTTPError:
+        raise ValueError("AirKorea station request failed") from None
+
+    items = ((station_resp or {}).get("response") or {}).get("body") or {}
+    items = items.get("items") or []
+    if not items:
+        raise ValueError("AirKorea: getNearbyMsrstnList returned no stations")
+    first = items[0] or {}
+    station_name = str(first.get("stationName") or "").strip()
+    station_distance_km = _as_float(first.get("tm"))  # typically km
+    if not station_name:
+        raise ValueError("AirKorea: stationName missing in nearest station response")
+    return station_name, station_distance_km, station_req, station_resp, station_raw
+
+
+def _is_cacheable_response(resp: Any) -> bool:
+    # Only successful envelopes with data: error envelopes (quota/key errors, resultCode != "00")
+    # and empty item lists are often transient and must not be replayed to other callers.
+    if not isinstance(resp, dict):
+        return False
+    root = resp.get("response") or {}
+    header = root.get("header") or {}
+    if str(header.get("resultCode") or "").strip() != "00":
+        return False
+    items = (root.get("body") or {}).get("items")
+    return isinstance(items, list) and bool(items)
+
+
+def _meas_cache_key(meas_req: dict[str, Any], key: str) -> _MeasCacheKey:
+    # Params are already sanitized (build_url injects the key); the key enters as a digest only.
+    key_digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    params = tuple(sorted((str(k), str(v)) for k, v in meas_req["params"].items()))
+    return str(meas_req["url"]), key_digest, params
+
+
+def _fetch_measurements(
+    meas_req: dict[str, Any], *, key: str, timeout_sec: int
+) -> tuple[dict[str, Any], bytes]:
+    """GET the measurement endpoint, reusing a parsed response younger than _MEAS_TTL_SEC.
+
+    Only successful responses that contain items are cached. Callers must not mutate the
+    returned response (it may be shared with other callers).
+    """
+    p = meas_req["params"]
+    cache_key = _meas_cache_key(meas_req, key)
+    now = time.monotonic()
+    with _meas_lock:
+        hit = _meas_cache.get(cache_key)
+    if hit is not None and now - hit[0] < _MEAS_TTL_SEC:
+        return hit[1], hit[2]
+
+    # Same host as the station lookup: the pooled client reuses that connection.
+    try:
+        url = build_url(base_url=meas_req["url"], service_key=key, params=p, key_param="serviceKey")
+        rate_limit(url)
+        r = get_client().get(url, headers=_JSON_HEADERS, timeout=timeout_sec)
+        r.raise_for_status()
+        meas_raw = r.content
+        meas_resp = json_loads(meas_raw)
+    except httpx.HTTPStatusError as e:
+        status = e.response.status_code
+        raise ValueError(f"AirKorea measurement request failed: HTTP {status}") from None
+    except httpx.HTTPError:
+        raise ValueError("AirKorea measurement request failed") from None
+
+    if not _is_cacheable_response(meas_resp):
+        return meas_resp, meas_raw
+    with _meas_lock:
+        if len(_meas_cache) >= _MEAS_CACHE_MAX:
+            for k in [k for k, (ts, _, _) in _meas_cache.items() if now - ts >= _MEAS_TTL_SEC]:
+                del _meas_cache[k]
+            if len(_meas_cache) >= _MEAS_CACHE_MAX:
+                _meas_cache.pop(next(iter(_meas_cache)))
+        _meas_cache[cache_key] = (time.monotonic(), meas_resp, meas_raw)
+    return meas_resp, meas_raw
+
+
 @dataclass(frozen=True)
 class AirBaseline:
     station_name: str
@@ -81,6 +222,7 @@ def fetch_air_baseline(
     data_term: str = "MONTH",
     num_rows: int = 200,
     timeout_sec: int = 20,
+    include_raw_responses: bool = True,
 ) -> AirBaseline:
     """Fetch a best-effort baseline from AirKorea public API.
 
@@ -92,6 +234,8 @@ def fetch_air_baseline(
     Notes:
     - This is not an "annual official report" aggregator; it is a reproducible automatic baseline
       with stored evidence to be refined later.
+    - `include_raw_responses=False` stores a summary (item count, sha256 of the raw body, first
+      items) instead of the full API responses, which keeps evidence files small.
     """
     key = _service_key()
     if not key:
@@ -102,41 +246,15 @@ def fetch_air_baseline(
 
     station_req: dict[str, Any] = {}
     station_resp: dict[str, Any] | None = None
+    station_raw = b""
     if not station_name:
-        tm_x, tm_y = _to_tm5181(center_lon, center_lat)
-        station_params = {
-            "serviceKey": key,
-            "returnType": "json",
-            "tmX": f"{tm_x:.3f}",
-            "tmY": f"{tm_y:.3f}",
-        }
-        station_req = {
-            "url": f"{AIRKOREA_BASE}/MsrstnInfoInqireSvc/getNearbyMsrstnList",
-            "params": strip_secrets_from_params(station_params),
-        }
-        with httpx.Client(timeout=timeout_sec, follow_redirects=True) as client:
-            try:
-                url = build_url(base_url=station_req["url"], service_key=key, params=station_req["params"], key_param="serviceKey")
-                r = client.get(url)
-                r.raise_for_status()
-                station_resp = r.json()
-            except httpx.HTTPStatusError as e:
-                raise ValueError(f"AirKorea station request failed: HTTP {e.response.status_code}") from None
-            except httpx.HTTPError:
-                raise ValueError("AirKorea station request failed") from None
-
-        items = ((station_resp or {}).get("response") or {}).get("body") or {}
-        items = items.get("items") or []
-        if not items:
-            raise ValueError("AirKorea: getNearbyMsrstnList returned no stations")
-        first = items[0] or {}
-        station_name = str(first.get("stationName") or "").strip()
-        station_distance_km = _as_float(first.get("tm"))  # typically km
-        if not station_name:
-            raise ValueError("AirKorea: stationName missing in nearest station response")
+        # Nearest-station answers are stable at ~100 m, so lookups are cached on rounded coords.
+        nearest = _nearest_station(
+            round(float(center_lon), 3), round(float(center_lat), 3), key, timeout_sec
+        )
+        station_name, station_distance_km, station_req, station_resp, station_raw = nearest
 
     meas_params = {
-        "serviceKey": key,
         "returnType": "json",
         "numOfRows": int(num_rows),
         "pageNo": 1,
@@ -146,52 +264,54 @@ def fetch_air_baseline(
     }
     meas_req = {
         "url": f"{AIRKOREA_BASE}/ArpltnInforInqireSvc/getMsrstnAcctoRltmMesureDnsty",
-        "params": strip_secrets_from_params(meas_params),
+        "params": meas_params,
     }
 
-    with httpx.Client(timeout=timeout_sec, follow_redirects=True) as client:
-        try:
-            url = build_url(base_url=meas_req["url"], service_key=key, params=meas_req["params"], key_param="serviceKey")
-            r = client.get(url)
-            r.raise_for_status()
-            meas_resp = r.json()
-        except httpx.HTTPStatusError as e:
-            raise ValueError(f"AirKorea measurement request failed: HTTP {e.response.status_code}") from None
-        except httpx.HTTPError:
-            raise ValueError("AirKorea measurement request failed") from None
+    meas_resp, meas_raw = _fetch_measurements(meas_req, key=key, timeout_sec=timeout_sec)
 
     body = ((meas_resp or {}).get("response") or {}).get("body") or {}
     items = body.get("items") or []
     if not isinstance(items, list) or not items:
         raise ValueError("AirKorea: measurement API returned no items")
 
-    # compute means
-    def _mean(key: str) -> float | None:
-        vals: list[float] = []
-        for it in items:
-            v = _as_float((it or {}).get(key))
-            if v is None:
-                continue
-            vals.append(v)
-        if not vals:
-            return None
-        return sum(vals) / float(len(vals))
-
-    pm10 = _mean("pm10Value")
-    pm25 = _mean("pm25Value")
-    o3 = _mean("o3Value")
+    # One pass over items: PM10/PM2.5/O3 sums+counts and the dataTime range.
+    # dataTime is "YYYY-MM-DD HH:MM"; its ISO date prefix orders correctly as a string,
+    # so min/max need no datetime parsing.
+    s_pm10 = s_pm25 = s_o3 = 0.0
+    c_pm10 = c_pm25 = c_o3 = 0
+    day_min = ""
+    day_max = ""
+    # Plain accumulation is the right tool at this size (numOfRows is a few hundred at most);
+    # binding the converter locally saves a global lookup per value.
+    as_float = _as_float
+    for it in items:
+        it = it or {}
+        v = as_float(it.get("pm10Value"))
+        if v is not None:
+            s_pm10 += v
+            c_pm10 += 1
+        v = as_float(it.get("pm25Value"))
+        if v is not None:
+            s_pm25 += v
+            c_pm25 += 1
+        v = as_float(it.get("o3Value"))
+        if v is not None:
+            s_o3 += v
+            c_o3 += 1
+        day = str(it.get("dataTime") or "").strip()[:10]
+        if len(day) == 10 and day[4] == "-" and day[7] == "-":
+            if not day_min or day < day_min:
+                day_min = day
+            if day > day_max:
+                day_max = day
+
+    pm10 = s_pm10 / c_pm10 if c_pm10 else None
+    pm25 = s_pm25 / c_pm25 if c_pm25 else None
+    o3 = s_o3 / c_o3 if c_o3 else None
 
     # period range from items' dataTime
-    dts = [_parse_dt(str((it or {}).get("dataTime") or "")) for it in items]
-    dts = [d for d in dts if d is not None]
-    if dts:
-        d0 = min(dts)
-        d1 = max(dts)
-        period_start = d0.strftime("%Y-%m-%d")
-        period_end = d1.strftime("%Y-%m-%d")
-    else:
-        period_start = ""
-        period_end = ""
+    period_start = day_min
+    period_end = day_max
 
     values: dict[str, float] = {}
     if pm10 is not None:
@@ -211,9 +331,15 @@ def fetch_air_baseline(
             "num_rows": num_rows,
         },
         "station_request": station_req,
-        "station_response": station_resp,
+        "station_response": (
+            station_resp
+            if include_raw_responses or station_resp is None
+            else _response_summary(station_resp, station_raw)
+        ),
         "measure_request": meas_req,
-        "measure_response": meas_resp,
+        "measure_response": (
+            meas_resp if include_raw_responses else _response_summary(meas_resp, meas_raw)
+        ),
         "computed": {
             "station_name": station_name,
             "station_distance_km": station_distance_km,
@@ -233,5 +359,36 @@ def fetch_air_baseline(
     )
 
 
+def fetch_air_baselines(
+    sites: list[tuple[float, float]],
+    *,
+    max_workers: int = 8,
+    data_term: str = "MONTH",
+    num_rows: int = 200,
+    timeout_sec: int = 20,
+) -> list[AirBaseline]:
+    """Fetch baselines for several (lon, lat) sites concurrently.
+
+    Requests overlap on the shared pooled client, so wall time approaches one round trip
+    instead of N. Results keep the input order; the first failure is re-raised.
+    """
+    if not sites:
+        return []
+
+    def _one(site: tuple[float, float]) -> AirBaseline:
+        lon, lat = site
+        return fetch_air_baseline(
+            center_lon=float(lon),
+            center_lat=float(lat),
+            data_term=data_term,
+            num_rows=num_rows,
+            timeout_sec=timeout_sec,
+        )
+
+    workers = max(1, min(int(max_workers), len(sites)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_one, sites))
+
+
 def evidence_bytes(evidence: dict[str, Any]) -> bytes:
-    return json.dumps(evidence, ensure_ascii=False, indent=2).encode("utf-8")
+    return dumps_pretty(evidence)
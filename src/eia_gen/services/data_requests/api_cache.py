@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from eia_gen.services.data_requests.fast_json import dumps_pretty, loads
+
+# On-disk cache for slow-changing API lookups (geocode results, KMA station catalog).
+# Opt-in per project via `cache.api` in config/cache.yaml, like the WMS/WMTS caches:
+#
+#   cache:
+#     api:
+#       enabled: true
+#       root_dir: ".cache/api"  # relative: resolved against the project root (parent of config/)
+#       ttl_days: {geocode: 90, kma_stations: 30}  # or one number for all; <= 0 never expires
+
+
+@dataclass(frozen=True)
+class ApiCache:
+    root: Path
+    ttl_days: float = 0
+
+    def read_json(self, rel: str) -> Any | None:
+        """Return the cached JSON at `rel` unless missing or older than `ttl_days` (best-effort)."""
+        path = self.root / rel
+        try:
+            if self.ttl_days > 0 and time.time() - path.stat().st_mtime > self.ttl_days * 86400.0:
+                return None
+            return loads(path.read_bytes())
+        except Exception:
+            return None
+
+    def write_json(self, rel: str, obj: Any) -> None:
+        """Atomically write `obj` to `rel` under the cache root (best-effort, errors ignored)."""
+        path = self.root / rel
+        tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(dumps_pretty(obj))
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+def cache_key(*parts: str) -> str:
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def api_cache_from_config(
+    cache_cfg: dict[str, Any], *, kind: str, base_dir: Path
+) -> ApiCache | None:
+    """Build the `kind` cache (e.g. "geocode") from a parsed cache config; None when disabled."""
+    cache = cache_cfg.get("cache") if isinstance(cache_cfg.get("cache"), dict) else {}
+    api = cache.get("api") if isinstance(cache.get("api"), dict) else {}
+    if not bool(api.get("enabled")):
+        return None
+
+    root = Path(str(api.get("root_dir") or ".cache/api")).expanduser()
+    if not root.is_absolute():
+        root = base_dir / root
+
+    ttl = api.get("ttl_days")
+    if isinstance(ttl, dict):
+        ttl = ttl.get(kind)
+    try:
+        ttl_days = float(ttl or 0)
+    except (TypeError, ValueError):
+        ttl_days = 0.0
+    return ApiCache(root=root / kind, ttl_days=ttl_days)
+
+
+def load_api_cache(cache_config: Path, *, kind: str) -> ApiCache | None:
+    """Read `cache_config` (config/cache.yaml) and build the `kind` cache; None when disabled."""
+    try:
+        cfg = yaml.safe_load(cache_config.read_text(encoding="utf-8")) or {}
+    except Exception:
+        return None
+    if not isinstance(cfg, dict):
+        return None
+    # config/cache.yaml lives in <project>/config/, so relative roots land in <project>/.
+    return api_cache_from_config(cfg, kind=kind, base_dir=cache_config.resolve().parent.parent)
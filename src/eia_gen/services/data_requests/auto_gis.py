@@ -2,16 +2,22 @@ from __future__ import annotations
 
 import csv
 import io
-import json
 import math
-from dataclasses import dataclass
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import shapely
 from PIL import Image, ImageDraw
 from pyproj import CRS, Transformer
-from shapely.geometry import GeometryCollection, MultiPoint, Point, shape
-from shapely.ops import nearest_points, transform, unary_union
+from shapely.geometry import GeometryCollection, Point, shape
+from shapely.ops import nearest_points, transform
+
+from eia_gen.services.data_requests.fast_json import loads as json_loads
 
 
 @dataclass(frozen=True)
@@ -34,6 +40,42 @@ class WmsOverlayInput:
     basis: str
 
 
+@dataclass(frozen=True)
+class _PendingOverlay:
+    row_index: int
+    overlay_id: str
+    category: str
+    designation_name: str
+    geom_file: str
+    geom_epsg: int
+    data_origin: str
+    src_id: str
+    geom_m: Any
+
+
+def _map_ordered(fn, items) -> list:
+    """Map `fn` over `items` on a thread pool, preserving order (inline for 0/1 items)."""
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(x) for x in items]
+    workers = max(1, min(len(items), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items))
+
+
+def _csv_bytes(fieldnames: list[str], rows: list[dict[str, Any]]) -> bytes:
+    """Encode rows as UTF-8 CSV (header + fields in `fieldnames` order; missing -> "")."""
+    buf = io.BytesIO()
+    text = io.TextIOWrapper(buf, encoding="utf-8", newline="")
+    w = csv.writer(text)
+    w.writerow(fieldnames)
+    w.writerows([[r.get(k, "") for k in fieldnames] for r in rows])
+    text.flush()
+    out = buf.getvalue()
+    text.detach()
+    return out
+
+
 def _parse_epsg(v: Any, default: int) -> int:
     if v is None:
         return default
@@ -51,7 +93,35 @@ def _parse_epsg(v: Any, default: int) -> int:
 
 
 def _load_geojson_geom(path: Path):
-    obj = json.loads(path.read_text(encoding="utf-8"))
+    # Boundary/overlay files are re-read across overlays and runs; keying on mtime+size keeps
+    # edited files fresh. Shapely geometries are immutable, so sharing cached ones is safe.
+    st = path.stat()
+    return _load_geojson_geom_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=128)
+def _load_geojson_geom_cached(path_str: str, mtime_ns: int, size: int):
+    return _parse_geojson_geom(Path(path_str))
+
+
+def _parse_geojson_geom(path: Path):
+    raw = path.read_bytes()
+    # Fast path: GEOS reads the whole document in C, skipping json -> dict -> shape() per feature.
+    # A FeatureCollection comes back as a GeometryCollection of its feature geometries. Inputs
+    # GEOS rejects (e.g. features with null geometry) take the Python path below.
+    try:
+        geom = shapely.from_geojson(raw)
+    except Exception:
+        geom = None
+    if geom is not None:
+        if geom.geom_type == "GeometryCollection" and b'"FeatureCollection"' in raw:
+            parts = shapely.get_parts(geom)
+            if not len(parts):
+                return GeometryCollection()
+            return shapely.union_all(parts)
+        return geom
+
+    obj = json_loads(raw)
     if "features" in obj:
         geoms = []
         for f in obj.get("features") or []:
@@ -60,19 +130,34 @@ def _load_geojson_geom(path: Path):
                 geoms.append(shape(geom))
         if not geoms:
             return GeometryCollection()
-        return unary_union(geoms)
+        return shapely.union_all(np.asarray(geoms, dtype=object))
     if "geometry" in obj:
         return shape(obj["geometry"])
     return shape(obj)
 
 
+# PROJ database lookups / pipeline setup dominate one-off transforms; EPSG pairs repeat across
+# overlays and runs, so CRS and Transformer objects are built once per code.
+@lru_cache(maxsize=64)
+def _get_crs(epsg: int) -> CRS:
+    return CRS.from_epsg(epsg)
+
+
+@lru_cache(maxsize=64)
+def _get_transformer(from_epsg: int, to_epsg: int) -> Transformer:
+    return Transformer.from_crs(_get_crs(from_epsg), _get_crs(to_epsg), always_xy=True)
+
+
 def _transform_geom(geom, *, from_epsg: int, to_epsg: int):
     if from_epsg == to_epsg:
         return geom
-    t = Transformer.from_crs(CRS.from_epsg(from_epsg), CRS.from_epsg(to_epsg), always_xy=True)
+    t = _get_transformer(from_epsg, to_epsg)
     return transform(t.transform, geom)
 
 
+_DIRS_8 = ("북", "북동", "동", "남동", "남", "남서", "서", "북서")
+
+
 def _direction_8(from_xy: tuple[float, float], to_xy: tuple[float, float]) -> str:
     fx, fy = from_xy
     tx, ty = to_xy
@@ -80,49 +165,9 @@ def _direction_8(from_xy: tuple[float, float], to_xy: tuple[float, float]) -> st
     dy = ty - fy
     if abs(dx) < 1e-9 and abs(dy) < 1e-9:
         return "-"
-    # 0deg = North
-    deg = math.degrees(math.atan2(dx, dy))
-    if deg < 0:
-        deg += 360.0
-    dirs = ["북", "북동", "동", "남동", "남", "남서", "서", "북서"]
-    idx = int((deg + 22.5) // 45) % 8
-    return dirs[idx]
-
-
-def _world_to_pixel(
-    x: float,
-    y: float,
-    *,
-    bbox: tuple[float, float, float, float],
-    width: int,
-    height: int,
-) -> tuple[float, float]:
-    minx, miny, maxx, maxy = bbox
-    dx = maxx - minx
-    dy = maxy - miny
-    if abs(dx) < 1e-12 or abs(dy) < 1e-12:
-        return (0.0, 0.0)
-    px = (x - minx) / dx * (width - 1)
-    py = (maxy - y) / dy * (height - 1)
-    return (float(px), float(py))
-
-
-def _pixel_to_world(
-    px: int,
-    py: int,
-    *,
-    bbox: tuple[float, float, float, float],
-    width: int,
-    height: int,
-) -> tuple[float, float]:
-    minx, miny, maxx, maxy = bbox
-    dx = maxx - minx
-    dy = maxy - miny
-    if abs(dx) < 1e-12 or abs(dy) < 1e-12:
-        return (float(minx), float(miny))
-    x = minx + (float(px) + 0.5) / float(width) * dx
-    y = maxy - (float(py) + 0.5) / float(height) * dy
-    return (float(x), float(y))
+    # Bearing clockwise from North in [0, tau); each sector is tau/8 wide, centred on its heading.
+    theta = math.atan2(dx, dy) % math.tau
+    return _DIRS_8[int(theta * (8 / math.tau) + 0.5) % 8]
 
 
 def _ensure_rgba(img: Image.Image) -> Image.Image:
@@ -137,12 +182,15 @@ def _ensure_rgba(img: Image.Image) -> Image.Image:
 
 def _downsample(img: Image.Image, *, max_size: int) -> Image.Image:
     w, h = img.size
-    if max(w, h) <= max_size:
+    # Slightly oversized rasters cost more to resize than to scan as-is.
+    if max(w, h) <= int(max_size * 1.25):
         return img
     scale = float(max_size) / float(max(w, h))
     nw = max(1, int(round(w * scale)))
     nh = max(1, int(round(h * scale)))
-    return img.resize((nw, nh), resample=Image.Resampling.NEAREST)
+    # BOX averages each source block, so thin features are not dropped the way NEAREST's
+    # point sampling can drop them; alpha > threshold then marks any partially covered pixel.
+    return img.resize((nw, nh), resample=Image.Resampling.BOX)
 
 
 def _polygon_mask(
@@ -155,13 +203,33 @@ def _polygon_mask(
     mask = Image.new("L", (width, height), 0)
     draw = ImageDraw.Draw(mask)
 
+    # World -> pixel affine (corners map to 0 and size-1), applied to whole rings at once.
+    minx, miny, maxx, maxy = bbox
+    dx = maxx - minx
+    dy = maxy - miny
+    degenerate = abs(dx) < 1e-12 or abs(dy) < 1e-12
+    sx = 0.0 if degenerate else (width - 1) / dx
+    sy = 0.0 if degenerate else (height - 1) / dy
+
+    def _ring_to_pixels(ring) -> list[float]:
+        # Flat [x0, y0, x1, y1, ...] list: PIL consumes it directly, no per-vertex tuples.
+        xy = np.asarray(ring.coords, dtype=np.float64)
+        if xy.ndim != 2 or xy.shape[0] == 0:
+            return []
+        if degenerate:
+            return [0.0] * (2 * xy.shape[0])
+        pix = np.empty((xy.shape[0], 2), dtype=np.float64)
+        np.multiply(xy[:, 0] - minx, sx, out=pix[:, 0])
+        np.multiply(maxy - xy[:, 1], sy, out=pix[:, 1])
+        return pix.ravel().tolist()
+
     def _draw_poly(poly):
-        coords = [_world_to_pixel(x, y, bbox=bbox, width=width, height=height) for x, y in poly.exterior.coords]
-        if len(coords) >= 3:
+        coords = _ring_to_pixels(poly.exterior)
+        if len(coords) >= 6:
             draw.polygon(coords, fill=255)
         for ring in poly.interiors:
-            hole = [_world_to_pixel(x, y, bbox=bbox, width=width, height=height) for x, y in ring.coords]
-            if len(hole) >= 3:
+            hole = _ring_to_pixels(ring)
+            if len(hole) >= 6:
                 draw.polygon(hole, fill=0)
 
     if geom.geom_type == "Polygon":
@@ -205,54 +273,25 @@ def _analyze_wms_raster(
     img = _downsample(img, max_size=analysis_max_size)
     w, h = img.size
 
-    alpha = img.getchannel("A")
+    # One HxWx4 array export; the alpha plane is a view into it (no getchannel()/tobytes() copies).
+    alpha = np.asarray(img)[..., 3]
 
     # If the alpha channel is effectively opaque everywhere, the layer likely isn't transparent.
     # In that case, overlap checks become unreliable.
-    try:
-        alpha_extrema = alpha.getextrema()  # (min, max)
-    except Exception:
-        alpha_extrema = (0, 255)
-    opaque_alpha = alpha_extrema == (255, 255)
-    if opaque_alpha:
-        warnings.append("alpha channel is fully opaque; cannot reliably detect feature pixels")
-
-    mask = _polygon_mask(boundary_geom, bbox=bbox, width=w, height=h)
-
-    a_bytes = alpha.tobytes()
-    m_bytes = mask.tobytes()
-    if len(a_bytes) != len(m_bytes):
-        return (
-            {"intersects": False, "is_applicable": "UNKNOWN", "distance_m": "", "direction": ""},
-            ["internal raster size mismatch"],
-        )
-
-    mask_px = 0
-    active_total_px = 0
-    active_inside_px = 0
-
-    # Count pixels
-    for ab, mb in zip(a_bytes, m_bytes):
-        if ab > alpha_threshold:
-            active_total_px += 1
-            if mb:
-                active_inside_px += 1
-        if mb:
-            mask_px += 1
-
-    intersects = active_inside_px > 0
-
+    opaque_alpha = bool(alpha.min() == 255)
     if opaque_alpha:
         # If the layer isn't transparent, treating alpha>threshold as "feature pixels" becomes meaningless
         # (e.g., basemaps or generated placeholder evidences). Mark as UNKNOWN to avoid false positives.
+        # Decided before rasterizing the boundary: the mask-based counts would not be used.
+        warnings.append("alpha channel is fully opaque; cannot reliably detect feature pixels")
         out = {
             "intersects": False,
             "is_applicable": "UNKNOWN",
             "distance_m": "",
             "direction": "",
-            "mask_px": mask_px,
-            "active_total_px": active_total_px,
-            "active_inside_px": active_inside_px,
+            "mask_px": "",
+            "active_total_px": int(np.count_nonzero(alpha > alpha_threshold)),
+            "active_inside_px": "",
             "overlap_area_m2": "",
             "epsg": epsg,
             "bbox": bbox,
@@ -260,10 +299,29 @@ def _analyze_wms_raster(
         }
         return out, warnings
 
+    mask = _polygon_mask(boundary_geom, bbox=bbox, width=w, height=h)
+
+    m_arr = np.asarray(mask)
+    if alpha.shape != m_arr.shape:
+        return (
+            {"intersects": False, "is_applicable": "UNKNOWN", "distance_m": "", "direction": ""},
+            ["internal raster size mismatch"],
+        )
+
+    # Count pixels (bulk reductions instead of a per-pixel loop). `inside` is not needed after
+    # mask_px, so the overlap AND is written into it instead of a third HxW temporary.
+    active = alpha > alpha_threshold
+    inside = m_arr > 0
+    mask_px = int(np.count_nonzero(inside))
+    active_total_px = int(np.count_nonzero(active))
+    active_inside_px = int(np.count_nonzero(np.logical_and(inside, active, out=inside)))
+
+    intersects = active_inside_px > 0
+
     # Approx overlap area (only meaningful for projected CRS)
     overlap_area_m2 = ""
     try:
-        crs = CRS.from_epsg(epsg)
+        crs = _get_crs(epsg)
         if crs.is_projected:
             minx, miny, maxx, maxy = bbox
             px_area = abs((maxx - minx) / float(w) * (maxy - miny) / float(h))
@@ -280,40 +338,47 @@ def _analyze_wms_raster(
             direction = ""
         else:
             # Build a sampled MultiPoint of feature pixels.
-            pts: list[tuple[float, float]] = []
             stride = max(1, int(distance_sample_stride))
             max_pts = max(10, int(distance_max_points))
-            for idx, ab in enumerate(a_bytes):
-                if ab <= alpha_threshold:
-                    continue
-                px = idx % w
-                py = idx // w
-                if stride > 1 and ((px % stride) != 0 or (py % stride) != 0):
-                    continue
-                x, y = _pixel_to_world(px, py, bbox=bbox, width=w, height=h)
-                pts.append((x, y))
-                if len(pts) >= max_pts:
-                    break
-
-            if not pts:
+            ys, xs = np.nonzero(active[::stride, ::stride])
+            if xs.size > max_pts:
+                # Spread the cap evenly over all hits (row-major order) rather than keeping the
+                # first N, which would bias samples toward the top of the image.
+                keep = np.linspace(0, xs.size - 1, max_pts).astype(np.intp)
+                xs = xs[keep]
+                ys = ys[keep]
+            # Pixel centers -> world coords.
+            minx, miny, maxx, maxy = bbox
+            dx = maxx - minx
+            dy = maxy - miny
+            if abs(dx) < 1e-12 or abs(dy) < 1e-12:
+                pts = np.empty((xs.size, 2), dtype=np.float64)
+                pts[:] = (minx, miny)
+            else:
+                wx = minx + (xs * stride + 0.5) * (dx / w)
+                wy = maxy - (ys * stride + 0.5) * (dy / h)
+                pts = np.column_stack([wx, wy])
+
+            if pts.shape[0] == 0:
                 distance_m = ""
                 direction = ""
             else:
                 try:
-                    crs_img = CRS.from_epsg(epsg)
-                    crs_metric = CRS.from_epsg(metric_epsg)
+                    crs_img = _get_crs(epsg)
 
                     if crs_img.is_projected:
                         boundary_for_dist = boundary_geom
                         pts_for_dist = pts
                         centroid_for_dir = boundary_centroid_xy
                     else:
-                        t = Transformer.from_crs(crs_img, crs_metric, always_xy=True)
+                        t = _get_transformer(epsg, metric_epsg)
                         boundary_for_dist = transform(t.transform, boundary_geom)
-                        pts_for_dist = [t.transform(x, y) for x, y in pts]
+                        tx, ty = t.transform(pts[:, 0], pts[:, 1])
+                        pts_for_dist = np.column_stack([tx, ty])
                         centroid_for_dir = tuple(t.transform(boundary_centroid_xy[0], boundary_centroid_xy[1]))
 
-                    mp = MultiPoint([Point(xy) for xy in pts_for_dist])
+                    # One GEOS call for all sample points instead of a Point() per sample.
+                    mp = shapely.multipoints(shapely.points(pts_for_dist))
                     d = float(boundary_for_dist.distance(mp))
                     distance_m = round(d, 1)
 
@@ -374,12 +439,7 @@ def zoning_breakdown_from_parcels(*, parcels_rows: list[dict[str, Any]], req_id:
     ]
 
     # Evidence as CSV (reproducible calculation output)
-    buf = io.StringIO()
-    w = csv.writer(buf)
-    w.writerow(["zoning", "area_m2", "src_id"])
-    for r in out_rows:
-        w.writerow([r.get("zoning", ""), r.get("area_m2", ""), r.get("src_id", "")])
-    evidence_bytes = buf.getvalue().encode("utf-8")
+    evidence_bytes = _csv_bytes(["zoning", "area_m2", "src_id"], out_rows)
 
     return AutoGisOutput(
         rows=out_rows,
@@ -430,13 +490,18 @@ def overlay_from_geojson(
         )
 
     boundary_m = _transform_geom(boundary, from_epsg=boundary_epsg, to_epsg=metric_epsg)
+    # Prepared once for the STRtree `intersects` query below (the distance/intersection calls
+    # don't use prepared geometries).
+    shapely.prepare(boundary_m)
     boundary_centroid = boundary_m.centroid
     bc_xy = (float(boundary_centroid.x), float(boundary_centroid.y))
 
     rows: list[dict[str, Any]] = []
     evidence_rows: list[dict[str, Any]] = []
+    pending: list[_PendingOverlay] = []
 
-    for item in overlays:
+    def _load_overlay(item: dict[str, Any]) -> tuple[dict[str, Any] | None, _PendingOverlay | None, list[str]]:
+        item_warnings: list[str] = []
         overlay_id = str(item.get("overlay_id") or item.get("id") or "").strip()
         category = str(item.get("category") or "").strip()
         designation_name = str(item.get("designation_name") or item.get("name") or "").strip()
@@ -446,66 +511,95 @@ def overlay_from_geojson(
         src_id = str(item.get("src_id") or "").strip()
 
         if not overlay_id:
-            warnings.append("overlay item missing overlay_id")
-            continue
+            item_warnings.append("overlay item missing overlay_id")
+            return None, None, item_warnings
         if not geom_file:
-            warnings.append(f"[{overlay_id}] geometry_file is empty")
-            rows.append(
-                {
-                    "overlay_id": overlay_id,
-                    "category": category,
-                    "designation_name": designation_name,
-                    "is_applicable": "UNKNOWN",
-                    "distance_m": "",
-                    "direction": "",
-                    "basis": "AUTO_GIS (missing geometry_file)",
-                    "data_origin": data_origin,
-                    "src_id": src_id or "S-TBD",
-                }
-            )
-            continue
+            item_warnings.append(f"[{overlay_id}] geometry_file is empty")
+            fail_row = {
+                "overlay_id": overlay_id,
+                "category": category,
+                "designation_name": designation_name,
+                "is_applicable": "UNKNOWN",
+                "distance_m": "",
+                "direction": "",
+                "basis": "AUTO_GIS (missing geometry_file)",
+                "data_origin": data_origin,
+                "src_id": src_id or "S-TBD",
+            }
+            return fail_row, None, item_warnings
 
         gpath = Path(geom_file)
         if not gpath.is_absolute():
             gpath = (case_dir / gpath).resolve()
         if not gpath.exists():
-            warnings.append(f"[{overlay_id}] geometry_file not found: {gpath}")
-            rows.append(
-                {
-                    "overlay_id": overlay_id,
-                    "category": category,
-                    "designation_name": designation_name,
-                    "is_applicable": "UNKNOWN",
-                    "distance_m": "",
-                    "direction": "",
-                    "basis": f"AUTO_GIS (missing file: {gpath.name})",
-                    "data_origin": data_origin,
-                    "src_id": src_id or "S-TBD",
-                }
-            )
-            continue
+            item_warnings.append(f"[{overlay_id}] geometry_file not found: {gpath}")
+            fail_row = {
+                "overlay_id": overlay_id,
+                "category": category,
+                "designation_name": designation_name,
+                "is_applicable": "UNKNOWN",
+                "distance_m": "",
+                "direction": "",
+                "basis": f"AUTO_GIS (missing file: {gpath.name})",
+                "data_origin": data_origin,
+                "src_id": src_id or "S-TBD",
+            }
+            return fail_row, None, item_warnings
 
         try:
             geom = _load_geojson_geom(gpath)
             geom_m = _transform_geom(geom, from_epsg=geom_epsg, to_epsg=metric_epsg)
         except Exception as e:
-            warnings.append(f"[{overlay_id}] failed to parse/transform geometry: {e}")
-            rows.append(
-                {
-                    "overlay_id": overlay_id,
-                    "category": category,
-                    "designation_name": designation_name,
-                    "is_applicable": "UNKNOWN",
-                    "distance_m": "",
-                    "direction": "",
-                    "basis": f"AUTO_GIS (parse error: {e})",
-                    "data_origin": data_origin,
-                    "src_id": src_id or "S-TBD",
-                }
-            )
-            continue
+            item_warnings.append(f"[{overlay_id}] failed to parse/transform geometry: {e}")
+            fail_row = {
+                "overlay_id": overlay_id,
+                "category": category,
+                "designation_name": designation_name,
+                "is_applicable": "UNKNOWN",
+                "distance_m": "",
+                "direction": "",
+                "basis": f"AUTO_GIS (parse error: {e})",
+                "data_origin": data_origin,
+                "src_id": src_id or "S-TBD",
+            }
+            return fail_row, None, item_warnings
+
+        return (
+            None,
+            _PendingOverlay(
+                row_index=-1,
+                overlay_id=overlay_id,
+                category=category,
+                designation_name=designation_name,
+                geom_file=geom_file,
+                geom_epsg=geom_epsg,
+                data_origin=data_origin,
+                src_id=src_id,
+                geom_m=geom_m,
+            ),
+            item_warnings,
+        )
 
-        intersects = bool(boundary_m.intersects(geom_m))
+    # File parsing + reprojection per overlay is independent; results are merged in input order.
+    for fail_row, loaded, item_warnings in _map_ordered(_load_overlay, overlays):
+        warnings.extend(item_warnings)
+        if loaded is not None:
+            # Reserve the row slot; it is filled once every overlay is loaded and indexed.
+            pending.append(replace(loaded, row_index=len(rows)))
+            rows.append({})
+        elif fail_row is not None:
+            rows.append(fail_row)
+
+    # One STRtree query finds every overlay that touches the boundary (bbox filter + predicate);
+    # only the rest need distance/direction work.
+    hits: set[int] = set()
+    if pending:
+        tree = shapely.STRtree([ov.geom_m for ov in pending])
+        hits = set(tree.query(boundary_m, predicate="intersects").tolist())
+
+    for k, ov in enumerate(pending):
+        geom_m = ov.geom_m
+        intersects = k in hits
         distance_m = float(boundary_m.distance(geom_m)) if not intersects else 0.0
 
         dir_text = "-"
@@ -514,61 +608,56 @@ def overlay_from_geojson(
             dir_text = _direction_8(bc_xy, (float(nearest_on_overlay.x), float(nearest_on_overlay.y)))
 
         is_app = "O" if intersects else "X"
-        row = {
-            "overlay_id": overlay_id,
-            "category": category,
-            "designation_name": designation_name,
+        rows[ov.row_index] = {
+            "overlay_id": ov.overlay_id,
+            "category": ov.category,
+            "designation_name": ov.designation_name,
             "is_applicable": is_app,
             "distance_m": round(distance_m, 1),
             "direction": dir_text,
-            "basis": f"AUTO_GIS (epsg:{geom_epsg}→{metric_epsg})",
-            "data_origin": data_origin,
-            "src_id": src_id or "S-TBD",
+            "basis": f"AUTO_GIS (epsg:{ov.geom_epsg}→{metric_epsg})",
+            "data_origin": ov.data_origin,
+            "src_id": ov.src_id or "S-TBD",
         }
-        rows.append(row)
 
+        # Disjoint overlays (bbox-rejected or predicate-false above) overlap by zero by
+        # construction, so the GEOS intersection is only built for hits.
         overlap_area_m2 = 0.0
-        try:
-            inter = boundary_m.intersection(geom_m)
-            overlap_area_m2 = float(getattr(inter, "area", 0.0) or 0.0)
-        except Exception:
-            overlap_area_m2 = 0.0
+        if intersects:
+            try:
+                inter = boundary_m.intersection(geom_m)
+                overlap_area_m2 = float(getattr(inter, "area", 0.0) or 0.0)
+            except Exception:
+                overlap_area_m2 = 0.0
         evidence_rows.append(
             {
-                "overlay_id": overlay_id,
-                "category": category,
-                "designation_name": designation_name,
+                "overlay_id": ov.overlay_id,
+                "category": ov.category,
+                "designation_name": ov.designation_name,
                 "is_applicable": is_app,
                 "distance_m": round(distance_m, 3),
                 "direction": dir_text,
                 "overlap_area_m2": round(overlap_area_m2, 3),
-                "geometry_file": str(Path(geom_file).as_posix()),
-                "geometry_epsg": geom_epsg,
+                "geometry_file": str(Path(ov.geom_file).as_posix()),
+                "geometry_epsg": ov.geom_epsg,
             }
         )
 
-    buf = io.StringIO()
-    w = csv.DictWriter(
-        buf,
-        fieldnames=[
-            "overlay_id",
-            "category",
-            "designation_name",
-            "is_applicable",
-            "distance_m",
-            "direction",
-            "overlap_area_m2",
-            "geometry_file",
-            "geometry_epsg",
-        ],
-    )
-    w.writeheader()
-    for r in evidence_rows:
-        w.writerow(r)
+    fieldnames = [
+        "overlay_id",
+        "category",
+        "designation_name",
+        "is_applicable",
+        "distance_m",
+        "direction",
+        "overlap_area_m2",
+        "geometry_file",
+        "geometry_epsg",
+    ]
 
     return AutoGisOutput(
         rows=rows,
-        evidence_bytes=buf.getvalue().encode("utf-8"),
+        evidence_bytes=_csv_bytes(fieldnames, evidence_rows),
         evidence_filename=f"{req_id}_overlay.csv",
         warnings=warnings,
     )
@@ -615,18 +704,21 @@ def overlay_from_wms_evidence(
             except Exception as e:
                 warnings.append(f"failed to parse boundary geojson: {e}")
 
-    for it in items:
+    def _one(it: WmsOverlayInput) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[str]]:
+        item_rows: list[dict[str, Any]] = []
+        item_evidence: list[dict[str, Any]] = []
+        item_warnings: list[str] = []
         if not it.overlay_id:
-            warnings.append("WMS overlay item missing overlay_id")
-            continue
+            item_warnings.append("WMS overlay item missing overlay_id")
+            return item_rows, item_evidence, item_warnings
 
         epsg = int(it.image_epsg)
         bbox = it.image_bbox
         bbox_text = ",".join(str(x) for x in bbox)
 
         if "__PLACEHOLDER__" in it.image_path.name:
-            warnings.append(f"[{it.overlay_id}] placeholder evidence image; returning UNKNOWN")
-            rows.append(
+            item_warnings.append(f"[{it.overlay_id}] placeholder evidence image; returning UNKNOWN")
+            item_rows.append(
                 {
                     "overlay_id": it.overlay_id,
                     "category": it.category,
@@ -639,7 +731,7 @@ def overlay_from_wms_evidence(
                     "src_id": it.src_id or "S-TBD",
                 }
             )
-            evidence_rows.append(
+            item_evidence.append(
                 {
                     "overlay_id": it.overlay_id,
                     "category": it.category,
@@ -657,7 +749,7 @@ def overlay_from_wms_evidence(
                     "image_size": "",
                 }
             )
-            continue
+            return item_rows, item_evidence, item_warnings
 
         # Resolve boundary geometry in raster CRS.
         boundary_geom = None
@@ -668,12 +760,12 @@ def overlay_from_wms_evidence(
                 c = boundary_geom.centroid
                 boundary_centroid_xy = (float(c.x), float(c.y))
             except Exception as e:
-                warnings.append(f"[{it.overlay_id}] boundary transform failed: {e}")
+                item_warnings.append(f"[{it.overlay_id}] boundary transform failed: {e}")
 
         if boundary_geom is None:
             # Fallback: circle buffer from center point.
             if center_lon is None or center_lat is None:
-                rows.append(
+                item_rows.append(
                     {
                         "overlay_id": it.overlay_id,
                         "category": it.category,
@@ -686,7 +778,7 @@ def overlay_from_wms_evidence(
                         "src_id": it.src_id or "S-TBD",
                     }
                 )
-                evidence_rows.append(
+                item_evidence.append(
                     {
                         "overlay_id": it.overlay_id,
                         "image": str(it.image_path.as_posix()),
@@ -696,15 +788,15 @@ def overlay_from_wms_evidence(
                         "reason": "missing boundary and center coords",
                     }
                 )
-                continue
+                return item_rows, item_evidence, item_warnings
             try:
-                t = Transformer.from_crs(CRS.from_epsg(center_epsg), CRS.from_epsg(epsg), always_xy=True)
+                t = _get_transformer(int(center_epsg), epsg)
                 x, y = t.transform(float(center_lon), float(center_lat))
                 boundary_geom = Point(float(x), float(y)).buffer(float(radius_m))
                 boundary_centroid_xy = (float(x), float(y))
             except Exception as e:
-                warnings.append(f"[{it.overlay_id}] failed to build point buffer boundary: {e}")
-                rows.append(
+                item_warnings.append(f"[{it.overlay_id}] failed to build point buffer boundary: {e}")
+                item_rows.append(
                     {
                         "overlay_id": it.overlay_id,
                         "category": it.category,
@@ -717,7 +809,7 @@ def overlay_from_wms_evidence(
                         "src_id": it.src_id or "S-TBD",
                     }
                 )
-                continue
+                return item_rows, item_evidence, item_warnings
 
         analysis, w = _analyze_wms_raster(
             boundary_geom=boundary_geom,
@@ -732,13 +824,13 @@ def overlay_from_wms_evidence(
             metric_epsg=metric_epsg,
         )
         for ww in w:
-            warnings.append(f"[{it.overlay_id}] {ww}")
+            item_warnings.append(f"[{it.overlay_id}] {ww}")
 
         is_app = str(analysis.get("is_applicable") or "UNKNOWN")
         distance_m = analysis.get("distance_m")
         direction = str(analysis.get("direction") or "")
 
-        rows.append(
+        item_rows.append(
             {
                 "overlay_id": it.overlay_id,
                 "category": it.category,
@@ -751,7 +843,7 @@ def overlay_from_wms_evidence(
                 "src_id": it.src_id or "S-TBD",
             }
         )
-        evidence_rows.append(
+        item_evidence.append(
             {
                 "overlay_id": it.overlay_id,
                 "category": it.category,
@@ -769,8 +861,15 @@ def overlay_from_wms_evidence(
                 "image_size": "x".join(str(x) for x in (analysis.get("image_size") or [])),
             }
         )
+        return item_rows, item_evidence, item_warnings
+
+    # Raster decode + analysis per item is independent (PIL/numpy/GEOS release the GIL);
+    # results are merged in input order.
+    for item_rows, item_evidence, item_warnings in _map_ordered(_one, items):
+        warnings.extend(item_warnings)
+        rows.extend(item_rows)
+        evidence_rows.extend(item_evidence)
 
-    buf = io.StringIO()
     fieldnames = [
         "overlay_id",
         "category",
@@ -787,14 +886,10 @@ def overlay_from_wms_evidence(
         "bbox",
         "image_size",
     ]
-    w = csv.DictWriter(buf, fieldnames=fieldnames)
-    w.writeheader()
-    for r in evidence_rows:
-        w.writerow({k: r.get(k, "") for k in fieldnames})
 
     return AutoGisOutput(
         rows=rows,
-        evidence_bytes=buf.getvalue().encode("utf-8"),
+        evidence_bytes=_csv_bytes(fieldnames, evidence_rows),
         evidence_filename=f"{req_id}_wms_overlay.csv",
         warnings=warnings,
     )
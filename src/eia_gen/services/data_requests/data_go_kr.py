@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 from typing import Any
-from urllib.parse import quote, urlencode
+from urllib.parse import quote, quote_plus, urlencode
+
+
+_URL_SAFE = ""
+_SCALAR_TYPES = (str, int, float)
 
 
 def build_url(
@@ -32,7 +36,15 @@ def build_url(
     # Remove any accidental key param from params.
     params2 = {k: v for k, v in (params or {}).items() if str(k) != key_param}
 
-    tail = urlencode(params2, doseq=True)
+    # Common case (scalar str/int/float values): same encoding as urlencode(quote_via=quote_plus)
+    # without its per-value sequence handling.
+    if all(type(v) in _SCALAR_TYPES and type(k) is str for k, v in params2.items()):
+        tail = "&".join(
+            f"{quote_plus(k, safe=_URL_SAFE)}={quote_plus(str(v), safe=_URL_SAFE)}"
+            for k, v in params2.items()
+        )
+    else:
+        tail = urlencode(params2, doseq=True)
     if tail:
         return f"{base_url}?{key_param}={sk}&{tail}"
     return f"{base_url}?{key_param}={sk}"
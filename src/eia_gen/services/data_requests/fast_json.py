@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Optional accelerator (`pip install eia-gen[fast-json]`); stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse a JSON document (bytes are decoded directly by orjson, without an interim str)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize evidence JSON as UTF-8 bytes with 2-space indent and non-ASCII kept as-is."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
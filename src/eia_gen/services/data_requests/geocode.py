@@ -1,33 +1,50 @@
 from __future__ import annotations
 
-import json
 import os
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any
 
-import httpx
+from eia_gen.services.data_requests.api_cache import ApiCache, cache_key
+from eia_gen.services.data_requests.fast_json import dumps_pretty
+from eia_gen.services.data_requests.fast_json import loads as json_loads
+from eia_gen.services.data_requests.http_client import get_client, rate_limit
 
 
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 VWORLD_GEOCODE_URL = "https://api.vworld.kr/req/address"
 
+# In-process memo of live lookups (provider, whitespace-normalized address) -> result, so
+# repeated addresses in one run cost one request. Disk-cache hits are not memoized here.
+_GEOCODE_MEMO_MAX = 4096
+_geocode_memo: dict[tuple[str, str], GeocodeResult] = {}
+_geocode_lock = threading.Lock()
+
 
 def _now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
+_MISSING_TOKENS = frozenset({"-", "NA", "N/A"})
+
+
 def _as_float(v: Any) -> float | None:
+    # Hot path (called per item x field): numbers and numeric strings succeed on the first
+    # float(); placeholders like "-" fall through to the slow path.
     if v is None:
         return None
-    if isinstance(v, (int, float)):
+    try:
         return float(v)
+    except (TypeError, ValueError):
+        pass
     s = str(v).strip()
-    if not s or s in {"-", "NA", "N/A"}:
+    if not s or s in _MISSING_TOKENS:
         return None
     try:
         return float(s)
-    except Exception:
+    except ValueError:
         return None
 
 
@@ -44,22 +61,124 @@ def _vworld_key() -> str:
     return os.environ.get("VWORLD_API_KEY", "").strip()
 
 
-def geocode_address(*, address: str, provider: str = "AUTO", timeout_sec: int = 20) -> GeocodeResult:
+def _resolve_provider(provider: str) -> str:
+    prov = str(provider or "AUTO").strip().upper()
+    if prov == "AUTO":
+        prov = "VWORLD" if _vworld_key() else "NOMINATIM"
+    if prov not in {"VWORLD", "NOMINATIM"}:
+        raise ValueError(f"Unsupported provider: {provider}")
+    return prov
+
+
+def geocode_address(
+    *,
+    address: str,
+    provider: str = "AUTO",
+    timeout_sec: int = 20,
+    cache: ApiCache | None = None,
+    force_refresh: bool = False,
+) -> GeocodeResult:
     """Geocode an address into WGS84 lon/lat.
 
     Supported providers:
     - AUTO: prefer VWORLD when `VWORLD_API_KEY` exists, else NOMINATIM
     - VWORLD: VWorld address geocoder (requires `VWORLD_API_KEY`)
     - NOMINATIM: OpenStreetMap Nominatim (no key; best-effort)
+
+    Repeated addresses are served from an in-process memo and, when `cache` is given (see
+    `api_cache.load_api_cache`), from the on-disk API cache; either way the evidence then
+    carries `cache_hit: true`. `force_refresh` skips both and stores the fresh result.
     """
     addr = str(address or "").strip()
     if not addr:
         raise ValueError("Missing address")
 
-    prov = str(provider or "AUTO").strip().upper()
-    if prov == "AUTO":
-        prov = "VWORLD" if _vworld_key() else "NOMINATIM"
+    prov = _resolve_provider(provider)
+
+    # Keyed by provider + whitespace-normalized address. Failures raise and are never cached.
+    res = _geocode_cached(prov, " ".join(addr.split()), int(timeout_sec), cache, force_refresh)
+    return res if res.address == addr else replace(res, address=addr)
 
+
+def geocode_addresses(
+    addresses: list[str],
+    *,
+    provider: str = "AUTO",
+    timeout_sec: int = 20,
+    max_concurrency: int = 4,
+    cache: ApiCache | None = None,
+    force_refresh: bool = False,
+) -> list[GeocodeResult]:
+    """Geocode several addresses, returning results in input order.
+
+    Distinct addresses are looked up concurrently (VWorld) or one per second (Nominatim);
+    duplicates and cached addresses cost no request. The first failure is raised.
+    """
+    addrs = [str(a or "").strip() for a in addresses]
+    if not addrs:
+        return []
+    prov = _resolve_provider(provider)
+
+    def _one(addr: str) -> GeocodeResult:
+        return geocode_address(
+            address=addr,
+            provider=prov,
+            timeout_sec=timeout_sec,
+            cache=cache,
+            force_refresh=force_refresh,
+        )
+
+    # One lookup per cache key (provider + whitespace-normalized address).
+    unique = {" ".join(a.split()): a for a in addrs}
+    workers = 1 if prov == "NOMINATIM" else max(1, min(int(max_concurrency), len(unique)))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            found = dict(zip(unique, pool.map(_one, unique.values()), strict=True))
+    else:
+        found = {k: _one(a) for k, a in unique.items()}
+
+    out: list[GeocodeResult] = []
+    for a in addrs:
+        res = found[" ".join(a.split())]
+        out.append(res if res.address == a else replace(res, address=a))
+    return out
+
+
+def _geocode_cached(
+    prov: str, addr: str, timeout_sec: int, cache: ApiCache | None, force_refresh: bool
+) -> GeocodeResult:
+    key = (prov, addr)
+    rel = f"{prov.lower()}/{cache_key(prov, addr)}.json"
+    if not force_refresh:
+        with _geocode_lock:
+            hit = _geocode_memo.get(key)
+        if hit is not None:
+            # Label memo hits like disk hits, on a copy so callers never share the memo's dict.
+            return replace(hit, evidence_json={**hit.evidence_json, "cache_hit": True})
+        cached = cache.read_json(rel) if cache is not None else None
+        if isinstance(cached, dict):
+            try:
+                return GeocodeResult(
+                    provider=prov,
+                    address=addr,
+                    lat=float(cached["lat"]),
+                    lon=float(cached["lon"]),
+                    evidence_json={**(cached.get("evidence") or {}), "cache_hit": True},
+                )
+            except (KeyError, TypeError, ValueError):
+                pass
+
+    res = _geocode_uncached(prov, addr, timeout_sec)
+    if cache is not None:
+        cache.write_json(rel, {"lat": res.lat, "lon": res.lon, "evidence": res.evidence_json})
+    with _geocode_lock:
+        if key not in _geocode_memo and len(_geocode_memo) >= _GEOCODE_MEMO_MAX:
+            _geocode_memo.pop(next(iter(_geocode_memo)))
+        _geocode_memo[key] = res
+    return res
+
+
+def _geocode_uncached(prov: str, addr: str, timeout_sec: int) -> GeocodeResult:
     if prov == "VWORLD":
         key = _vworld_key()
         if not key:
@@ -75,10 +194,10 @@ def geocode_address(*, address: str, provider: str = "AUTO", timeout_sec: int =
             "type": "road",
             "key": key,
         }
-        with httpx.Client(timeout=timeout_sec, follow_redirects=True) as client:
-            r = client.get(VWORLD_GEOCODE_URL, params=params)
-            r.raise_for_status()
-            resp = r.json()
+        rate_limit(VWORLD_GEOCODE_URL)
+        r = get_client().get(VWORLD_GEOCODE_URL, params=params, timeout=timeout_sec)
+        r.raise_for_status()
+        resp = json_loads(r.content)
 
         # best-effort parse
         point = (((resp or {}).get("response") or {}).get("result") or {}).get("point") or {}
@@ -102,10 +221,10 @@ def geocode_address(*, address: str, provider: str = "AUTO", timeout_sec: int =
             # Nominatim requires a valid User-Agent.
             "User-Agent": "eia-gen/0.1 (local, for EIA/DIA drafting)",
         }
-        with httpx.Client(timeout=timeout_sec, follow_redirects=True, headers=headers) as client:
-            r = client.get(NOMINATIM_URL, params=params)
-            r.raise_for_status()
-            resp = r.json()
+        rate_limit(NOMINATIM_URL)
+        r = get_client().get(NOMINATIM_URL, params=params, headers=headers, timeout=timeout_sec)
+        r.raise_for_status()
+        resp = json_loads(r.content)
 
         if not isinstance(resp, list) or not resp:
             raise ValueError("Nominatim returned no results")
@@ -124,9 +243,9 @@ def geocode_address(*, address: str, provider: str = "AUTO", timeout_sec: int =
         }
         return GeocodeResult(provider="NOMINATIM", address=addr, lat=float(lat), lon=float(lon), evidence_json=evidence)
 
-    raise ValueError(f"Unsupported provider: {provider}")
+    raise ValueError(f"Unsupported provider: {prov}")
 
 
 def evidence_bytes(evidence: dict[str, Any]) -> bytes:
-    return json.dumps(evidence, ensure_ascii=False, indent=2).encode("utf-8")
+    return dumps_pretty(evidence)
 
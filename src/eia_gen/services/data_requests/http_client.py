@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import threading
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+# Keep-alive pool shared by the public-data connectors: repeated calls to the same host
+# (e.g. apis.data.go.kr station lookup -> measurement) reuse one TCP/TLS connection.
+_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0)
+
+# Ask for compressed JSON/XML bodies explicitly (httpx decodes transparently). `br` is not
+# advertised: decoding it needs the optional brotli package.
+_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+# HTTP/2 multiplexes concurrent requests to one host over a single connection. httpx needs the
+# optional `h2` package for it (eia-gen[http2]); without it the client stays on HTTP/1.1.
+# Only https:// origins negotiate h2 (ALPN).
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+_lock = threading.Lock()
+_client: httpx.Client | None = None
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide pooled client (lazy; recreated if closed).
+
+    Callers pass `timeout=` per request; the client-level default only applies when omitted.
+    Do not close the returned client.
+    """
+    global _client
+    c = _client
+    if c is not None and not c.is_closed:
+        return c
+    with _lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(
+                timeout=20, follow_redirects=True, limits=_LIMITS, headers=_HEADERS, http2=_HTTP2
+            )
+        return _client
+
+
+@atexit.register
+def _close_client() -> None:
+    # Release pooled sockets cleanly at interpreter exit.
+    c = _client
+    if c is not None and not c.is_closed:
+        c.close()
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens/sec refill, bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        # Tokens are reserved under the lock (balance may go negative), so sleeping outside it
+        # keeps concurrent callers queued in arrival order without holding the lock.
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Proactive per-host pacing so concurrent pages/ranges stay under the providers' limits instead
+# of discovering them through 429/5xx + backoff. Hosts not listed are not throttled.
+_HOST_RATES: dict[str, tuple[float, float]] = {
+    "apis.data.go.kr": (5.0, 5.0),
+    "nominatim.openstreetmap.org": (1.0, 1.0),  # usage policy: max 1 request/sec
+}
+_buckets: dict[str, TokenBucket] = {}
+
+
+def rate_limit(url: str) -> None:
+    """Block until a request to `url`'s host is allowed by its token bucket (no-op if unlisted)."""
+    host = (urlsplit(url).hostname or "").lower()
+    rate = _HOST_RATES.get(host)
+    if rate is None:
+        return
+    bucket = _buckets.get(host)
+    if bucket is None:
+        with _lock:
+            bucket = _buckets.setdefault(host, TokenBucket(*rate))
+    bucket.acquire()
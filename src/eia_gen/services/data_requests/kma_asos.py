@@ -1,18 +1,38 @@
 from __future__ import annotations
 
-import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 import httpx
 
 from eia_gen.services.data_requests.data_go_kr import build_url
+from eia_gen.services.data_requests.fast_json import dumps_pretty
+from eia_gen.services.data_requests.fast_json import loads as json_loads
+from eia_gen.services.data_requests.http_client import get_client, rate_limit
 
 
-KMA_ASOS_DAILY_URL = "http://apis.data.go.kr/1360000/AsosDalyInfoService/getWthrDataList"
+KMA_ASOS_DAILY_URL = "https://apis.data.go.kr/1360000/AsosDalyInfoService/getWthrDataList"
+
+# Pages per date-range chunk (safety cap) and the number of simultaneous requests to the API.
+_MAX_PAGES = 50
+_KMA_MAX_CONCURRENCY = 4
+_KMA_INFLIGHT = threading.BoundedSemaphore(_KMA_MAX_CONCURRENCY)
+
+# Fields that may carry max 1-hour rainfall, depending on the dataset.
+_MAX1H_KEYS = (
+    "maxRn",  # some datasets
+    "maxRnHrmt",  # maximum hourly rainfall time (sometimes paired)
+    "maxRn1hr",
+    "max1hrRn",
+    "maxRnHr",
+    "maxRnHr1",
+)
 
 
 def _now_iso() -> str:
@@ -28,20 +48,43 @@ def _service_key() -> str:
     return ""
 
 
+_MISSING_TOKENS = frozenset({"-", "NA", "N/A"})
+
+
 def _as_float(v: Any) -> float | None:
+    # Hot path (called per item x field): numbers and numeric strings succeed on the first
+    # float(); placeholders like "-" fall through to the slow path.
     if v is None:
         return None
-    if isinstance(v, (int, float)):
+    try:
         return float(v)
+    except (TypeError, ValueError):
+        pass
     s = str(v).strip()
-    if not s or s in {"-", "NA", "N/A"}:
+    if not s or s in _MISSING_TOKENS:
         return None
     try:
         return float(s)
-    except Exception:
+    except ValueError:
         return None
 
 
+@lru_cache(maxsize=64)
+def _parse_ymd(s: str) -> date | None:
+    ss = s.strip()
+    if not ss:
+        return None
+    try:
+        return datetime.strptime(ss, "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def _fmt_ymd(d: date) -> str:
+    # Integer formatting (no strftime) for range boundaries.
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
+
+
 def _result_code(resp: dict[str, Any]) -> str:
     header = ((resp or {}).get("response") or {}).get("header") or {}
     return str(header.get("resultCode") or "").strip()
@@ -64,6 +107,18 @@ def _extract_items(resp: dict[str, Any]) -> list[dict[str, Any]]:
     return []
 
 
+def _slim_response(resp: dict[str, Any]) -> dict[str, Any]:
+    """Keep only the header and paging fields of a response page (items are summarized elsewhere)."""
+    response = (resp or {}).get("response") or {}
+    body = response.get("body") or {}
+    return {
+        "response": {
+            "header": response.get("header"),
+            "body": {k: body.get(k) for k in ("pageNo", "numOfRows", "totalCount")},
+        }
+    }
+
+
 @dataclass(frozen=True)
 class AsosPrecipStats:
     station_id: str
@@ -104,26 +159,17 @@ def fetch_asos_daily_precip_stats(
     # KMA ASOS daily API typically serves data up to *yesterday*.
     # If a caller asks for today, the API may return resultCode=99 ("전날 자료까지 제공...").
     # To keep AUTO runs stable, clamp end_dt to yesterday when it exceeds yesterday.
-    def _parse_ymd(s: str) -> datetime | None:
-        ss = str(s or "").strip()
-        if not ss:
-            return None
-        try:
-            return datetime.strptime(ss, "%Y%m%d")
-        except Exception:
-            return None
-
-    max_end_dt = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
+    max_end_parsed = date.today() - timedelta(days=1)
     end_parsed = _parse_ymd(requested_end_dt)
-    max_end_parsed = _parse_ymd(max_end_dt)
-    if end_parsed is not None and max_end_parsed is not None and end_parsed > max_end_parsed:
-        end_dt = max_end_dt
+    if end_parsed is not None and end_parsed > max_end_parsed:
+        end_dt = _fmt_ymd(max_end_parsed)
+        end_parsed = max_end_parsed
     else:
         end_dt = requested_end_dt
     start_dt = requested_start_dt
 
     # Basic guard: ensure start<=end when both parse.
-    end_parsed2 = _parse_ymd(end_dt)
+    end_parsed2 = end_parsed
     start_parsed2 = _parse_ymd(start_dt)
     if start_parsed2 is not None and end_parsed2 is not None and start_parsed2 > end_parsed2:
         raise ValueError(f"KMA ASOS daily API invalid date range: start_dt={start_dt} end_dt={end_dt}")
@@ -151,11 +197,62 @@ def fetch_asos_daily_precip_stats(
         cur = start_parsed2
         while cur <= end_parsed2:
             chunk_end = min(cur + timedelta(days=999), end_parsed2)  # inclusive <= 1000 days
-            ranges.append((cur.strftime("%Y%m%d"), chunk_end.strftime("%Y%m%d")))
+            ranges.append((_fmt_ymd(cur), _fmt_ymd(chunk_end)))
             cur = chunk_end + timedelta(days=1)
     else:
         ranges.append((start_dt, end_dt))
 
+    def _fetch_page(
+        client: httpx.Client,
+        *,
+        range_start_dt: str,
+        range_end_dt: str,
+        page_no: int,
+    ) -> tuple[dict[str, Any], int | None]:
+        params = {
+            "pageNo": page_no,
+            "numOfRows": page_size,
+            "dataType": "JSON",
+            "dataCd": "ASOS",
+            "dateCd": "DAY",
+            "startDt": range_start_dt,
+            "endDt": range_end_dt,
+            "stnIds": stn,
+        }
+
+        url = build_url(base_url=KMA_ASOS_DAILY_URL, service_key=key, params=params, key_param="serviceKey")
+
+        resp: dict[str, Any] | None = None
+        last_status: int | None = None
+        for attempt in range(4):
+            try:
+                rate_limit(url)
+                with _KMA_INFLIGHT:
+                    r = client.get(url, timeout=timeout_sec)
+                last_status = getattr(r, "status_code", None)
+                r.raise_for_status()
+                resp = json_loads(r.content)
+                break
+            except httpx.HTTPStatusError as e:
+                last_status = e.response.status_code
+                if 500 <= int(last_status or 0) < 600 and attempt < 3:
+                    time.sleep(0.6 * (2**attempt))
+                    continue
+                raise ValueError(f"KMA ASOS daily API failed: HTTP {e.response.status_code}") from None
+            except httpx.HTTPError:
+                if attempt < 3:
+                    time.sleep(0.6 * (2**attempt))
+                    continue
+                raise ValueError("KMA ASOS daily API failed") from None
+
+        if not isinstance(resp, dict):
+            raise ValueError("KMA ASOS daily API returned invalid JSON")
+
+        code = _result_code(resp)
+        if code and code not in {"00", "0", "200"}:
+            raise ValueError(f"KMA ASOS daily API error: resultCode={code} resultMsg={_result_msg(resp)}")
+        return resp, last_status
+
     def _fetch_range(
         client: httpx.Client,
         *,
@@ -164,118 +261,106 @@ def fetch_asos_daily_precip_stats(
     ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int | None, dict[str, Any] | None]:
         pages: list[dict[str, Any]] = []
         items_all: list[dict[str, Any]] = []
-        total: int | None = None
-        last_resp: dict[str, Any] | None = None
-
-        page_no = 1
-        while page_no <= 50:
-            params = {
-                "pageNo": page_no,
-                "numOfRows": page_size,
-                "dataType": "JSON",
-                "dataCd": "ASOS",
-                "dateCd": "DAY",
-                "startDt": range_start_dt,
-                "endDt": range_end_dt,
-                "stnIds": stn,
-            }
-
-            url = build_url(base_url=KMA_ASOS_DAILY_URL, service_key=key, params=params, key_param="serviceKey")
 
-            resp: dict[str, Any] | None = None
-            last_status: int | None = None
-            for attempt in range(4):
-                try:
-                    r = client.get(url)
-                    last_status = getattr(r, "status_code", None)
-                    r.raise_for_status()
-                    resp = r.json()
+        def _page(page_no: int) -> tuple[dict[str, Any], int | None]:
+            return _fetch_page(client, range_start_dt=range_start_dt, range_end_dt=range_end_dt, page_no=page_no)
+
+        resp, status = _page(1)
+        last_resp: dict[str, Any] | None = resp
+        chunk = _extract_items(resp)
+        if not chunk:
+            return items_all, pages, None, last_resp
+        items_all.extend(chunk)
+        pages.append({"pageNo": 1, "numOfRows": page_size, "http_status": status})
+
+        total = _total_count(resp)
+        if (total is not None and page_size >= total) or len(chunk) < page_size:
+            return items_all, pages, total, last_resp
+
+        if total is not None:
+            # totalCount fixes the page count: fetch pages 2..N concurrently, then consume them in
+            # order with the same stop rules as the serial walk.
+            n_pages = min(-(-total // page_size), _MAX_PAGES)
+            with ThreadPoolExecutor(max_workers=_KMA_MAX_CONCURRENCY) as pool:
+                fetched = list(pool.map(_page, range(2, n_pages + 1)))
+            for page_no, (resp, status) in enumerate(fetched, start=2):
+                last_resp = resp
+                chunk = _extract_items(resp)
+                if not chunk:
+                    break
+                items_all.extend(chunk)
+                pages.append({"pageNo": page_no, "numOfRows": page_size, "http_status": status})
+                if len(chunk) < page_size:
                     break
-                except httpx.HTTPStatusError as e:
-                    last_status = e.response.status_code
-                    if 500 <= int(last_status or 0) < 600 and attempt < 3:
-                        time.sleep(0.6 * (2**attempt))
-                        continue
-                    raise ValueError(f"KMA ASOS daily API failed: HTTP {e.response.status_code}") from None
-                except httpx.HTTPError:
-                    if attempt < 3:
-                        time.sleep(0.6 * (2**attempt))
-                        continue
-                    raise ValueError("KMA ASOS daily API failed") from None
-
-            if not isinstance(resp, dict):
-                raise ValueError("KMA ASOS daily API returned invalid JSON")
+            return items_all, pages, total, last_resp
 
+        # No totalCount: walk the remaining pages serially until a short/empty page.
+        page_no = 2
+        while page_no <= _MAX_PAGES:
+            resp, status = _page(page_no)
             last_resp = resp
-            code = _result_code(resp)
-            if code and code not in {"00", "0", "200"}:
-                raise ValueError(f"KMA ASOS daily API error: resultCode={code} resultMsg={_result_msg(resp)}")
-
             chunk = _extract_items(resp)
             if not chunk:
                 break
-
             items_all.extend(chunk)
-            pages.append({"pageNo": page_no, "numOfRows": page_size, "http_status": last_status})
-
-            total = total if total is not None else _total_count(resp)
-            if total is not None and page_no * page_size >= total:
-                break
+            pages.append({"pageNo": page_no, "numOfRows": page_size, "http_status": status})
             if len(chunk) < page_size:
                 break
             page_no += 1
-
         return items_all, pages, total, last_resp
 
-    with httpx.Client(timeout=timeout_sec, follow_redirects=True) as client:
-        for range_start_dt, range_end_dt in ranges:
-            items_chunk, pages, total, last = _fetch_range(
-                client,
-                range_start_dt=range_start_dt,
-                range_end_dt=range_end_dt,
-            )
-            if items_chunk:
-                all_items.extend(items_chunk)
-            last_resp = last or last_resp
-            range_runs.append(
-                {
-                    "startDt": range_start_dt,
-                    "endDt": range_end_dt,
-                    "total_count": total,
-                    "pages": pages,
-                }
-            )
+    # Shared pooled client: pages/ranges (and other data.go.kr calls) reuse one connection.
+    # Date-range chunks are independent, so they are fetched concurrently; _KMA_INFLIGHT caps
+    # the number of simultaneous requests across ranges and pages.
+    client = get_client()
+
+    def _run_range(rng: tuple[str, str]):
+        return _fetch_range(client, range_start_dt=rng[0], range_end_dt=rng[1])
+
+    if len(ranges) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(ranges), _KMA_MAX_CONCURRENCY)) as pool:
+            range_results = list(pool.map(_run_range, ranges))
+    else:
+        range_results = [_run_range(r) for r in ranges]
+
+    for (range_start_dt, range_end_dt), (items_chunk, pages, total, last) in zip(ranges, range_results):
+        if items_chunk:
+            all_items.extend(items_chunk)
+        last_resp = last or last_resp
+        range_runs.append(
+            {
+                "startDt": range_start_dt,
+                "endDt": range_end_dt,
+                "total_count": total,
+                "pages": pages,
+            }
+        )
 
     if not all_items:
         raise ValueError("KMA ASOS daily API returned no items")
 
     items = all_items
 
-    # Daily total rainfall typically in sumRn
-    totals: list[float] = []
-    max1h_candidates: list[float] = []
-    max1h_keys = [
-        "maxRn",  # some datasets
-        "maxRnHrmt",  # maximum hourly rainfall time (sometimes paired)
-        "maxRn1hr",
-        "max1hrRn",
-        "maxRnHr",
-        "maxRnHr1",
-    ]
-
+    # Daily total rainfall typically in sumRn; one pass keeps the running total/max values.
+    total = 0.0
+    has_total = False
+    max_24h: float | None = None
+    max_1h: float | None = None
+    as_float = _as_float
     for it in items:
-        v = _as_float(it.get("sumRn"))
+        v = as_float(it.get("sumRn"))
         if v is not None:
-            totals.append(v)
+            total += v
+            has_total = True
+            if max_24h is None or v > max_24h:
+                max_24h = v
 
-        for k in max1h_keys:
-            vv = _as_float(it.get(k))
-            if vv is not None:
-                max1h_candidates.append(vv)
+        for k in _MAX1H_KEYS:
+            vv = as_float(it.get(k))
+            if vv is not None and (max_1h is None or vv > max_1h):
+                max_1h = vv
 
-    total_rain = sum(totals) if totals else None
-    max_24h = max(totals) if totals else None
-    max_1h = max(max1h_candidates) if max1h_candidates else None
+    total_rain = total if has_total else None
 
     evidence = {
         "generated_at": _now_iso(),
@@ -285,7 +370,11 @@ def fetch_asos_daily_precip_stats(
             "requested": {"startDt": requested_start_dt, "endDt": requested_end_dt},
             "ranges": range_runs,
         },
-        "response": {"items_count": len(items), "last_page": last_resp},
+        "response": {
+            "items_count": len(items),
+            # Header + paging only: the full page would duplicate up to num_rows items.
+            "last_page": _slim_response(last_resp) if last_resp else None,
+        },
         "computed": {
             "station_id": stn,
             "start_dt": start_dt,
@@ -308,4 +397,4 @@ def fetch_asos_daily_precip_stats(
 
 
 def evidence_bytes(evidence: dict[str, Any]) -> bytes:
-    return json.dumps(evidence, ensure_ascii=False, indent=2).encode("utf-8")
+    return dumps_pretty(evidence)
@@ -1,21 +1,35 @@
 from __future__ import annotations
 
 import csv
-import json
+import heapq
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 import httpx
+import numpy as np
 
+from eia_gen.services.data_requests.api_cache import ApiCache
 from eia_gen.services.data_requests.data_go_kr import build_url
+from eia_gen.services.data_requests.fast_json import dumps_pretty
+from eia_gen.services.data_requests.fast_json import loads as json_loads
+from eia_gen.services.data_requests.http_client import get_client, rate_limit
 from pyproj import Geod
 
 
-KMA_ASOS_STATIONS_URL = "http://apis.data.go.kr/1360000/AsosInfoService/getAsosStnInfo"
+KMA_ASOS_STATIONS_URL = "https://apis.data.go.kr/1360000/AsosInfoService/getAsosStnInfo"
+
+_GEOD = Geod(ellps="WGS84")
+_EARTH_RADIUS_M = 6371008.8  # IUGG mean radius (haversine prefilter only)
+_PREFILTER_MARGIN = 1.02
+
+# Simultaneous page requests once totalCount is known.
+_KMA_MAX_CONCURRENCY = 4
 
 
 def _now_iso() -> str:
@@ -31,17 +45,24 @@ def _service_key() -> str:
     return ""
 
 
+_MISSING_TOKENS = frozenset({"-", "NA", "N/A"})
+
+
 def _as_float(v: Any) -> float | None:
+    # Hot path (called per item x field): numbers and numeric strings succeed on the first
+    # float(); placeholders like "-" fall through to the slow path.
     if v is None:
         return None
-    if isinstance(v, (int, float)):
+    try:
         return float(v)
+    except (TypeError, ValueError):
+        pass
     s = str(v).strip()
-    if not s or s in {"-", "NA", "N/A"}:
+    if not s or s in _MISSING_TOKENS:
         return None
     try:
         return float(s)
-    except Exception:
+    except ValueError:
         return None
 
 
@@ -65,25 +86,109 @@ class AsosStation:
     lon: float
 
 
+@dataclass(frozen=True)
+class _StationCoords:
+    """Static per-station arrays for vectorized distance queries (degrees + haversine terms)."""
+
+    lons: np.ndarray
+    lats: np.ndarray
+    lon_rad: np.ndarray
+    lat_rad: np.ndarray
+    cos_lat: np.ndarray
+    valid: np.ndarray  # finite lon and lat within [-90, 90]; other rows are never ranked
+
+
+def _station_coords(stations: list[AsosStation]) -> _StationCoords:
+    n = len(stations)
+    lons = np.fromiter((s.lon for s in stations), dtype=np.float64, count=n)
+    lats = np.fromiter((s.lat for s in stations), dtype=np.float64, count=n)
+    lat_rad = np.radians(lats)
+    return _StationCoords(
+        lons=lons,
+        lats=lats,
+        lon_rad=np.radians(lons),
+        lat_rad=lat_rad,
+        cos_lat=np.cos(lat_rad),
+        valid=np.isfinite(lons) & (np.abs(lats) <= 90.0),
+    )
+
+
 @dataclass(frozen=True)
 class AsosStationCatalog:
     stations: list[AsosStation]
     evidence_json: dict[str, Any]
 
+    @cached_property
+    def _coords(self) -> _StationCoords:
+        # Computed once per catalog; repeated nearest-station queries only convert the query point.
+        return _station_coords(self.stations)
+
+
+def _candidates_scan(
+    coords: _StationCoords, center_lon: float, center_lat: float, k: int
+) -> np.ndarray:
+    n = coords.lons.size
+    lat0 = np.radians(center_lat)
+    dlon = coords.lon_rad - np.radians(center_lon)
+    with np.errstate(invalid="ignore"):  # invalid rows are masked out just below
+        a = np.sin((coords.lat_rad - lat0) * 0.5) ** 2
+        a += np.cos(lat0) * coords.cos_lat * np.sin(dlon * 0.5) ** 2
+        hav = 2.0 * _EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+    hav[~coords.valid] = np.inf
+    if k < n:
+        bound = np.partition(hav, k - 1)[k - 1]
+        if np.isfinite(bound):
+            return np.flatnonzero(hav <= bound * _PREFILTER_MARGIN + 1.0)
+    return np.flatnonzero(coords.valid)
+
+
+def _load_cached_catalog(cache: ApiCache, rel: str) -> AsosStationCatalog | None:
+    cached = cache.read_json(rel)
+    if not isinstance(cached, dict):
+        return None
+    try:
+        stations = [
+            AsosStation(station_id=str(sid), station_name=str(name), lat=float(lat), lon=float(lon))
+            for sid, name, lat, lon in cached.get("stations") or []
+        ]
+    except (TypeError, ValueError):
+        return None
+    if not stations:
+        return None
+    evidence = dict(cached.get("evidence") or {})
+    evidence["cache_hit"] = True
+    return AsosStationCatalog(stations=stations, evidence_json=evidence)
+
 
-def fetch_asos_station_catalog(*, timeout_sec: int = 25, num_rows: int = 100, max_pages: int = 50) -> AsosStationCatalog:
+def fetch_asos_station_catalog(
+    *,
+    timeout_sec: int = 25,
+    num_rows: int = 100,
+    max_pages: int = 50,
+    cache: ApiCache | None = None,
+    force_refresh: bool = False,
+) -> AsosStationCatalog:
     """Fetch KMA ASOS station catalog (id/name/lat/lon) with pagination.
 
     Notes:
     - `num_rows` is treated as page size.
     - We retry a few times on transient 5xx errors.
     - Evidence excludes API keys.
+    - When `cache` is given (see `api_cache.load_api_cache`), a catalog within its TTL is served
+      from the on-disk API cache (evidence then carries `cache_hit: true`); `force_refresh`
+      skips it and stores the fresh catalog.
     """
+    page_size = max(1, int(num_rows))
+    cache_rel = f"asos_stations_{page_size}x{int(max_pages)}.json"
+    if cache is not None and not force_refresh:
+        cached = _load_cached_catalog(cache, cache_rel)
+        if cached is not None:
+            return cached
+
     key = _service_key()
     if not key:
         raise ValueError("Missing KMA API key (KMA_API_KEY or DATA_GO_KR_SERVICE_KEY)")
 
-    page_size = max(1, int(num_rows))
     all_items: list[dict[str, Any]] = []
     pages: list[dict[str, Any]] = []
 
@@ -105,73 +210,96 @@ def fetch_asos_station_catalog(*, timeout_sec: int = 25, num_rows: int = 100, ma
         header = ((resp or {}).get("response") or {}).get("header") or {}
         return str(header.get("resultMsg") or "").strip()
 
-    with httpx.Client(timeout=timeout_sec, follow_redirects=True) as client:
-        total: int | None = None
-        page_no = 1
-        while page_no <= max_pages:
-            params = {
-                "pageNo": page_no,
-                "numOfRows": page_size,
-                "dataType": "JSON",
-            }
-            url = build_url(base_url=KMA_ASOS_STATIONS_URL, service_key=key, params=params, key_param="serviceKey")
-
-            # best-effort retries for transient server errors
-            resp: dict[str, Any] | None = None
-            last_status: int | None = None
-            for attempt in range(4):
-                try:
-                    r = client.get(url)
-                    last_status = getattr(r, "status_code", None)
-                    r.raise_for_status()
-                    resp = r.json()
-                    break
-                except httpx.HTTPStatusError as e:
-                    last_status = e.response.status_code
-                    if 500 <= int(last_status or 0) < 600 and attempt < 3:
-                        time.sleep(0.6 * (2**attempt))
-                        continue
-                    raise ValueError(f"KMA ASOS station catalog fetch failed: HTTP {e.response.status_code}") from None
-                except httpx.HTTPError:
-                    if attempt < 3:
-                        time.sleep(0.6 * (2**attempt))
-                        continue
-                    raise ValueError("KMA ASOS station catalog fetch failed") from None
-
-            if not isinstance(resp, dict):
-                raise ValueError("KMA ASOS station catalog returned invalid JSON")
-
-            code = _result_code(resp)
-            if code and code not in {"00", "0", "200"}:
-                raise ValueError(f"KMA ASOS station catalog API error: resultCode={code} resultMsg={_result_msg(resp)}")
-
-            items = _extract_items(resp)
-            if not items:
-                break
-
-            all_items.extend(items)
-            pages.append({"pageNo": page_no, "numOfRows": page_size, "http_status": last_status})
-
-            total = total if total is not None else _total_count(resp)
-            if total is not None and page_no * page_size >= total:
-                break
-            if len(items) < page_size:
+    # Shared pooled client: every page reuses one keep-alive connection.
+    client = get_client()
+
+    def _fetch_page(page_no: int) -> tuple[dict[str, Any], int | None]:
+        params = {
+            "pageNo": page_no,
+            "numOfRows": page_size,
+            "dataType": "JSON",
+        }
+        url = build_url(base_url=KMA_ASOS_STATIONS_URL, service_key=key, params=params, key_param="serviceKey")
+
+        # best-effort retries for transient server errors
+        resp: dict[str, Any] | None = None
+        last_status: int | None = None
+        for attempt in range(4):
+            try:
+                rate_limit(url)
+                r = client.get(url, timeout=timeout_sec)
+                last_status = getattr(r, "status_code", None)
+                r.raise_for_status()
+                resp = json_loads(r.content)
                 break
-
-            page_no += 1
+            except httpx.HTTPStatusError as e:
+                last_status = e.response.status_code
+                if 500 <= int(last_status or 0) < 600 and attempt < 3:
+                    time.sleep(0.6 * (2**attempt))
+                    continue
+                raise ValueError(f"KMA ASOS station catalog fetch failed: HTTP {e.response.status_code}") from None
+            except httpx.HTTPError:
+                if attempt < 3:
+                    time.sleep(0.6 * (2**attempt))
+                    continue
+                raise ValueError("KMA ASOS station catalog fetch failed") from None
+
+        if not isinstance(resp, dict):
+            raise ValueError("KMA ASOS station catalog returned invalid JSON")
+
+        code = _result_code(resp)
+        if code and code not in {"00", "0", "200"}:
+            raise ValueError(f"KMA ASOS station catalog API error: resultCode={code} resultMsg={_result_msg(resp)}")
+        return resp, last_status
+
+    def _consume(page_no: int, resp: dict[str, Any], status: int | None) -> bool:
+        """Collect one page; return False once the walk should stop."""
+        items = _extract_items(resp)
+        if not items:
+            return False
+        all_items.extend(items)
+        pages.append({"pageNo": page_no, "numOfRows": page_size, "http_status": status})
+        return len(items) >= page_size
+
+    total: int | None = None
+    if max_pages >= 1:
+        resp, status = _fetch_page(1)
+        more = _consume(1, resp, status)
+        total = _total_count(resp)
+        if more and total is not None:
+            # totalCount fixes the page count: fetch pages 2..N concurrently, then consume them
+            # in page order with the same stop rules as the serial walk.
+            n_pages = min(-(-total // page_size), max_pages)
+            if n_pages >= 2:
+                with ThreadPoolExecutor(max_workers=min(n_pages - 1, _KMA_MAX_CONCURRENCY)) as pool:
+                    fetched = list(pool.map(_fetch_page, range(2, n_pages + 1)))
+                for page_no, (resp, status) in enumerate(fetched, start=2):
+                    if not _consume(page_no, resp, status):
+                        break
+        elif more:
+            # No totalCount: walk the remaining pages serially until a short/empty page.
+            page_no = 2
+            while page_no <= max_pages and _consume(page_no, *_fetch_page(page_no)):
+                page_no += 1
 
     if not all_items:
         raise ValueError("KMA ASOS station info returned no items")
 
-    stations: list[AsosStation] = []
+    # Keyed by station id: rows repeated across paginated overlaps are kept once (first wins).
+    by_id: dict[str, AsosStation] = {}
+    as_float = _as_float
     for it in all_items:
+        # Each row falls back across the id/name spellings on its own (pages can mix them).
         sid = str(it.get("stnId") or it.get("stationId") or it.get("stn_id") or "").strip()
-        name = str(it.get("stnNm") or it.get("stationName") or it.get("stn_nm") or "").strip()
-        lat = _as_float(it.get("lat"))
-        lon = _as_float(it.get("lon"))
-        if not sid or lat is None or lon is None:
+        if not sid or sid in by_id:
+            continue
+        lat = as_float(it.get("lat"))
+        lon = as_float(it.get("lon"))
+        if lat is None or lon is None:
             continue
-        stations.append(AsosStation(station_id=sid, station_name=name, lat=float(lat), lon=float(lon)))
+        name = str(it.get("stnNm") or it.get("stationName") or it.get("stn_nm") or "").strip()
+        by_id[sid] = AsosStation(station_id=sid, station_name=name, lat=lat, lon=lon)
+    stations = list(by_id.values())
 
     if not stations:
         raise ValueError("KMA ASOS station info had no usable lat/lon fields")
@@ -194,6 +322,14 @@ def fetch_asos_station_catalog(*, timeout_sec: int = 25, num_rows: int = 100, ma
         "parsed": {"station_count": len(stations)},
     }
 
+    if cache is not None:
+        cache.write_json(
+            cache_rel,
+            {
+                "stations": [[s.station_id, s.station_name, s.lat, s.lon] for s in stations],
+                "evidence": evidence,
+            },
+        )
     return AsosStationCatalog(stations=stations, evidence_json=evidence)
 
 
@@ -215,50 +351,71 @@ def load_asos_station_catalog_csv(path: Path) -> list[AsosStation]:
 
 
 def write_asos_station_catalog_csv(path: Path, stations: list[AsosStation]) -> None:
+    """Write the catalog CSV and fsync it (callers may `os.replace` a tmp path into place)."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=["station_id", "station_name", "lat", "lon"])
-        writer.writeheader()
-        for s in sorted(stations, key=lambda x: (x.station_id, x.station_name)):
-            writer.writerow(
-                {
-                    "station_id": s.station_id,
-                    "station_name": s.station_name,
-                    "lat": f"{s.lat:.8f}",
-                    "lon": f"{s.lon:.8f}",
-                }
-            )
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(("station_id", "station_name", "lat", "lon"))
+        rows = sorted(stations, key=lambda x: (x.station_id, x.station_name))
+        writer.writerows((s.station_id, s.station_name, f"{s.lat:.8f}", f"{s.lon:.8f}") for s in rows)
+        f.flush()
+        os.fsync(f.fileno())
 
 
 def evidence_bytes(evidence: dict[str, Any]) -> bytes:
-    return json.dumps(evidence, ensure_ascii=False, indent=2).encode("utf-8")
+    return dumps_pretty(evidence)
 
 
 def pick_nearest_asos_stations(
     *,
     center_lon: float,
     center_lat: float,
-    stations: list[AsosStation],
+    stations: list[AsosStation] | AsosStationCatalog,
     top_n: int = 3,
 ) -> list[dict[str, Any]]:
-    """Pick nearest ASOS stations using geodesic distance (WGS84)."""
-    if not stations:
+    """Pick nearest ASOS stations using geodesic distance (WGS84).
+
+    Passing an `AsosStationCatalog` reuses its precomputed coordinate arrays across calls.
+    """
+    k = max(1, int(top_n))
+    if isinstance(stations, AsosStationCatalog):
+        coords = stations._coords
+        stations = stations.stations
+        if not stations:
+            return []
+    elif stations:
+        coords = _station_coords(stations)
+    else:
         return []
 
-    geod = Geod(ellps="WGS84")
-    scored: list[tuple[float, AsosStation]] = []
-    for s in stations:
-        try:
-            _, _, dist_m = geod.inv(center_lon, center_lat, s.lon, s.lat)
-            if dist_m is None:
+    # Vectorized spherical (haversine) distances rank every station in one NumPy pass; the exact
+    # WGS84 geodesic is solved only for stations that can still make the top-N: the sphere is
+    # within ~0.6% of the ellipsoid, so the 2% margin never drops one.
+    cand = _candidates_scan(coords, center_lon, center_lat, k)
+    lons, lats = coords.lons, coords.lats
+
+    try:
+        _, _, dists = _GEOD.inv(
+            np.full(cand.size, center_lon, dtype=np.float64),
+            np.full(cand.size, center_lat, dtype=np.float64),
+            lons[cand],
+            lats[cand],
+        )
+        dists = np.atleast_1d(np.asarray(dists, dtype=np.float64))
+    except Exception:
+        # Fall back to one solve per station so a single bad row only drops itself.
+        dists = np.full(cand.size, np.nan)
+        for j, i in enumerate(cand):
+            try:
+                dists[j] = float(_GEOD.inv(center_lon, center_lat, lons[i], lats[i])[2])
+            except Exception:
                 continue
-            scored.append((float(dist_m), s))
-        except Exception:
-            continue
 
-    scored.sort(key=lambda x: x[0])
+    scored: list[tuple[float, AsosStation]] = [
+        (float(dists[j]), stations[int(cand[j])]) for j in np.flatnonzero(np.isfinite(dists))
+    ]
     out: list[dict[str, Any]] = []
-    for dist_m, s in scored[: max(1, int(top_n))]:
+    for dist_m, s in heapq.nsmallest(k, scored, key=lambda x: x[0]):
         out.append(
             {
                 "station_id": s.station_id,
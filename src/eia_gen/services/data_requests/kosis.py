@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-import json
+import copy
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import httpx
 import yaml
 
+from eia_gen.services.data_requests.fast_json import dumps_pretty
+from eia_gen.services.data_requests.fast_json import loads as json_loads
+from eia_gen.services.data_requests.http_client import get_client
+
 
 # NOTE:
 # - KOSIS의 orgId/tblId 기반 조회는 `statisticsData.do`보다
@@ -18,6 +24,12 @@ import yaml
 #   본 프로젝트의 dataset_key(SSOT) 방식에는 Param 엔드포인트를 기본값으로 둔다.
 KOSIS_DATA_URL = "https://kosis.kr/openapi/Param/statisticsParameterData.do"
 
+# Simultaneous requests for the multi-itmId fan-out.
+_KOSIS_MAX_CONCURRENCY = 8
+
+# libyaml-backed loader when available (same safe-loading contract, C parser).
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
@@ -28,6 +40,11 @@ def _api_key() -> str:
 
 
 def _as_int(v: Any) -> int | None:
+    if isinstance(v, str):
+        # Fast path: KOSIS `DT` cells are almost always plain (ASCII) integer strings.
+        t = v.strip()
+        if t.isascii() and (t.isdigit() or (t[:1] == "-" and t[1:].isdigit())):
+            return int(t)
     if v is None:
         return None
     if isinstance(v, bool):
@@ -52,7 +69,7 @@ def _safe_upper(v: Any) -> str:
 
 def _load_yaml(path: Path) -> dict[str, Any]:
     try:
-        obj = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        obj = yaml.load(path.read_text(encoding="utf-8"), Loader=_SafeLoader) or {}
     except Exception as e:
         raise ValueError(f"Failed to load YAML: {path} ({e})") from None
     if not isinstance(obj, dict):
@@ -61,7 +78,28 @@ def _load_yaml(path: Path) -> dict[str, Any]:
 
 
 def load_kosis_dataset_catalog(path: Path) -> dict[str, dict[str, Any]]:
-    """Load `config/kosis_datasets.yaml` and return `dataset_key -> dataset dict`."""
+    """Load `config/kosis_datasets.yaml` and return `dataset_key -> dataset dict`.
+
+    The parsed catalog is cached per file (path + mtime + size), so resolving many dataset keys
+    in a run parses the YAML once; each call still returns its own (deep) copy.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return _parse_kosis_dataset_catalog(path)  # raises the usual "Failed to load YAML" error
+    cached = _load_kosis_dataset_catalog_cached(str(path.resolve()), st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(cached)
+
+
+@lru_cache(maxsize=32)
+def _load_kosis_dataset_catalog_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> dict[str, dict[str, Any]]:
+    # Never handed out directly: callers get deep copies.
+    return _parse_kosis_dataset_catalog(Path(path_str))
+
+
+def _parse_kosis_dataset_catalog(path: Path) -> dict[str, dict[str, Any]]:
     obj = _load_yaml(path)
     datasets = obj.get("datasets") or {}
     if not isinstance(datasets, dict):
@@ -231,18 +269,18 @@ def fetch_kosis_series(*, q: KosisQuery, timeout_sec: int = 25) -> KosisFetchRes
     params.update(q.query_params or {})
 
     def _fetch_once(p: dict[str, Any]) -> list[dict[str, Any]]:
-        with httpx.Client(timeout=timeout_sec, follow_redirects=True) as client:
+        # Shared pooled client: the itmId fan-out and later datasets reuse one TLS connection.
+        try:
+            r = get_client().get(q.endpoint_url, params=p, timeout=timeout_sec)
+            r.raise_for_status()
             try:
-                r = client.get(q.endpoint_url, params=p)
-                r.raise_for_status()
-                try:
-                    data0 = r.json()
-                except Exception:
-                    raise ValueError("KOSIS response is not JSON")
-            except httpx.HTTPStatusError as e:
-                raise ValueError(f"KOSIS request failed: HTTP {e.response.status_code}") from None
-            except httpx.HTTPError:
-                raise ValueError("KOSIS request failed") from None
+                data0 = json_loads(r.content)
+            except Exception:
+                raise ValueError("KOSIS response is not JSON")
+        except httpx.HTTPStatusError as e:
+            raise ValueError(f"KOSIS request failed: HTTP {e.response.status_code}") from None
+        except httpx.HTTPError:
+            raise ValueError("KOSIS request failed") from None
 
         # KOSIS typically returns a list of dicts on success, or a dict on error.
         if isinstance(data0, dict):
@@ -271,11 +309,13 @@ def fetch_kosis_series(*, q: KosisQuery, timeout_sec: int = 25) -> KosisFetchRes
     requests_meta: list[dict[str, Any]] = []
     items: list[dict[str, Any]] = []
     if itm_ids and len(itm_ids) >= 2 and itm_key:
-        for one in itm_ids:
-            p = dict(params)
-            p[itm_key] = one
+        per_id = [{**params, itm_key: one} for one in itm_ids]
+        for p in per_id:
             requests_meta.append({"url": q.endpoint_url, "params": {k: v for k, v in p.items() if k != "apiKey"}})
-            items.extend(_fetch_once(p))
+        # Independent per-itmId calls: fetch concurrently, merge rows in itmId order.
+        with ThreadPoolExecutor(max_workers=min(_KOSIS_MAX_CONCURRENCY, len(per_id))) as pool:
+            for rows in pool.map(_fetch_once, per_id):
+                items.extend(rows)
     else:
         requests_meta.append({"url": q.endpoint_url, "params": {k: v for k, v in params.items() if k != "apiKey"}})
         items = _fetch_once(params)
@@ -309,36 +349,54 @@ def build_env_base_socio_rows(
     """
     by_year: dict[str, dict[str, Any]] = {}
 
+    # Index mappings by ITM_ID once (ids uppercased at build time). Each item then scans only the
+    # mappings for its id plus the id-less ones, in their original order (later ones still win).
+    indexed = list(enumerate(mappings))
+    no_id = [(i, m) for i, m in indexed if not m.match_itm_id]
+    by_id: dict[str, list[tuple[int, KosisMapping]]] = {}
+    for i, m in indexed:
+        if m.match_itm_id:
+            by_id.setdefault(_safe_upper(m.match_itm_id), []).append((i, m))
+
+    def _plan(entries: list[tuple[int, KosisMapping]]) -> list[tuple[str, str]]:
+        return [(m.output_col, m.match_itm_nm_contains) for _, m in sorted(entries, key=lambda x: x[0])]
+
+    plans = {k: _plan(v + no_id) for k, v in by_id.items()}
+    default_plan = _plan(no_id)
+
     for it in items:
         year = str(it.get("PRD_DE") or it.get("PRD") or "").strip()
         if not year:
             continue
-        itm_id = _safe_upper(it.get("ITM_ID"))
-        itm_nm = str(it.get("ITM_NM") or "").strip()
-        dt = it.get("DT")
-
-        row = by_year.setdefault(
-            year,
-            {
+        row = by_year.get(year)
+        if row is None:
+            row = by_year[year] = {
                 "admin_code": admin_code,
                 "admin_name": admin_name,
                 "year": year,
-            },
-        )
+            }
 
-        for m in mappings:
-            if m.match_itm_id and itm_id != _safe_upper(m.match_itm_id):
-                continue
-            if m.match_itm_nm_contains and m.match_itm_nm_contains not in itm_nm:
-                continue
-            val = _as_int(dt)
-            if val is None:
+        # Most items match no mapping: skip the name/value parsing for them (the year row above is
+        # still registered, as before).
+        plan = plans.get(_safe_upper(it.get("ITM_ID")), default_plan)
+        if not plan:
+            continue
+        val = _as_int(it.get("DT"))
+        if val is None:
+            continue
+        itm_nm = str(it.get("ITM_NM") or "").strip()
+        for output_col, nm_contains in plan:
+            if nm_contains and nm_contains not in itm_nm:
                 continue
-            row[m.output_col] = val
+            row[output_col] = val
 
-    # Stable ordering
-    return [by_year[y] for y in sorted(by_year.keys())]
+    # Stable ordering. KOSIS usually returns rows grouped in period order, so the insertion order
+    # is already sorted; only sort when it is not. Keys stay strings: PRD_DE may be YYYY or YYYYMM.
+    years = list(by_year)
+    if any(a > b for a, b in zip(years, years[1:])):
+        years.sort()
+    return [by_year[y] for y in years]
 
 
 def evidence_bytes(evidence: dict[str, Any]) -> bytes:
-    return json.dumps(evidence, ensure_ascii=False, indent=2).encode("utf-8")
+    return dumps_pretty(evidence)
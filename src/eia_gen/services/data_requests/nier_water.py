@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass
 from datetime import datetime
@@ -9,6 +8,9 @@ from typing import Any
 import httpx
 
 from eia_gen.services.data_requests.data_go_kr import build_url
+from eia_gen.services.data_requests.fast_json import dumps_pretty
+from eia_gen.services.data_requests.fast_json import loads as json_loads
+from eia_gen.services.data_requests.http_client import get_client, rate_limit
 
 
 NIER_EIA_WATER_IVSTG_URL = "https://apis.data.go.kr/1480523/WaterqualityServices/getIvstg"
@@ -97,15 +99,15 @@ def fetch_eia_ivstg_water_quality(
 
     url = build_url(base_url=NIER_EIA_WATER_IVSTG_URL, service_key=key, params=params, key_param="ServiceKey")
 
-    with httpx.Client(timeout=timeout_sec, follow_redirects=True) as client:
-        try:
-            r = client.get(url)
-            r.raise_for_status()
-            resp = r.json()
-        except httpx.HTTPStatusError as e:
-            raise ValueError(f"NIER ivstg API failed: HTTP {e.response.status_code}") from None
-        except httpx.HTTPError:
-            raise ValueError("NIER ivstg API failed") from None
+    try:
+        rate_limit(url)
+        r = get_client().get(url, timeout=timeout_sec)
+        r.raise_for_status()
+        resp = json_loads(r.content)
+    except httpx.HTTPStatusError as e:
+        raise ValueError(f"NIER ivstg API failed: HTTP {e.response.status_code}") from None
+    except httpx.HTTPError:
+        raise ValueError("NIER ivstg API failed") from None
 
     outer = (resp or {}).get("response") if isinstance(resp, dict) else None
     if not isinstance(outer, dict):
@@ -178,5 +180,5 @@ def fetch_eia_ivstg_water_quality(
 
 
 def evidence_bytes(evidence: dict[str, Any]) -> bytes:
-    return json.dumps(evidence, ensure_ascii=False, indent=2).encode("utf-8")
+    return dumps_pretty(evidence)
 
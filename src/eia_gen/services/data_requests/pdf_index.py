@@ -1,32 +1,89 @@
 from __future__ import annotations
 
 import json
+import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
+from eia_gen.services.data_requests.fast_json import loads as json_loads
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PdfIndexHit:
     kind: str
     page: int  # 1-based
     label: str
     text: str
+    # lowercased `text`, computed once so repeated `filter_hits` calls don't redo it per hit
+    text_lower: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "text_lower", (self.text or "").lower())
 
-def _iter_index_files(index_path: Path) -> list[Path]:
-    p = index_path
-    if p.is_file():
-        return [p]
 
-    files: list[Path] = []
-    for name in ("combined_index.json", "pass2_hits.json"):
-        files.extend(sorted(p.rglob(name)))
+# resolved dir -> (mtime_ns of every directory walked, index files relative to it).
+# Adding/removing/renaming a file bumps its parent directory's mtime, so an entry is reused
+# only while all of those stamps are unchanged.
+_DirStamps = tuple[tuple[str, int], ...]
+_INDEX_FILES_CACHE: dict[str, tuple[_DirStamps, tuple[Path, ...]]] = {}
+
+
+def _mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _scan_index_dir(root: str) -> tuple[_DirStamps, tuple[Path, ...]]:
+    """Walk `root` once (like `Path.rglob`: symlinked dirs are not descended into)."""
+    stamps: list[tuple[str, int]] = []
+    combined: list[Path] = []
+    pass2: list[Path] = []
+    other: list[Path] = []
+
+    stack: list[tuple[str, Path]] = [(root, Path())]
+    while stack:
+        d, rel = stack.pop()
+        stamps.append((d, _mtime_ns(d)))
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    name = e.name
+                    try:
+                        if e.is_dir() and not e.is_symlink():
+                            stack.append((e.path, rel / name))
+                    except OSError:
+                        pass
+                    if not name.endswith(".json"):
+                        continue
+                    if name == "combined_index.json":
+                        combined.append(rel / name)
+                    elif name == "pass2_hits.json":
+                        pass2.append(rel / name)
+                    other.append(rel / name)
+        except OSError:
+            continue
+
+    files = sorted(combined) + sorted(pass2)
     # fallback: any json
     if not files:
-        files = sorted(p.rglob("*.json"))
-    return files
+        files = sorted(other)
+    return tuple(stamps), tuple(files)
+
+
+def _iter_index_files(index_path: Path) -> tuple[Path, ...]:
+    p = index_path
+    if p.is_file():
+        return (p,)
+
+    key = str(p.resolve())
+    cached = _INDEX_FILES_CACHE.get(key)
+    if cached is None or any(_mtime_ns(d) != m for d, m in cached[0]):
+        cached = _INDEX_FILES_CACHE[key] = _scan_index_dir(key)
+    return tuple(p / rel for rel in cached[1])
 
 
 def load_pdf_index_hits(index_path: str | Path) -> tuple[list[PdfIndexHit], str | None]:
@@ -44,11 +101,14 @@ def load_pdf_index_hits(index_path: str | Path) -> tuple[list[PdfIndexHit], str
     p = Path(index_path)
     pdf_path: str | None = None
 
+    # de-dup while reading (the same hit often appears in both combined_index.json and
+    # pass2_hits.json), so only unique hits are sorted below
+    seen: set[tuple[str, int, str, str]] = set()
     hits: list[PdfIndexHit] = []
 
     for f in _iter_index_files(p):
         try:
-            obj = json.loads(f.read_text(encoding="utf-8"))
+            obj = json_loads(f.read_bytes())
         except Exception:
             continue
 
@@ -62,6 +122,8 @@ def load_pdf_index_hits(index_path: str | Path) -> tuple[list[PdfIndexHit], str
             raw_hits = obj["pass2"]["hits"]
         elif isinstance(obj.get("hits"), list):
             raw_hits = obj.get("hits")
+        # Only the hit list is used; drop the rest of the (possibly large) index document now.
+        del obj
 
         if not raw_hits:
             continue
@@ -80,19 +142,14 @@ def load_pdf_index_hits(index_path: str | Path) -> tuple[list[PdfIndexHit], str
             text = str(h.get("text") or "").strip()
             if not label:
                 continue
+            key = (kind, page, label, text)
+            if key in seen:
+                continue
+            seen.add(key)
             hits.append(PdfIndexHit(kind=kind, page=page, label=label, text=text))
 
-    # de-dup, preserve stable order
-    seen: set[tuple[str, int, str, str]] = set()
-    out: list[PdfIndexHit] = []
-    for h in sorted(hits, key=lambda x: (x.page, x.kind, x.label, x.text)):
-        key = (h.kind, h.page, h.label, h.text)
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(h)
-
-    return out, pdf_path
+    hits.sort(key=lambda x: (x.page, x.kind, x.label, x.text))
+    return hits, pdf_path
 
 
 def filter_hits(
@@ -105,8 +162,8 @@ def filter_hits(
 ) -> list[PdfIndexHit]:
     kinds = {k.lower() for k in (kinds or {"figure", "table"})}
     include_labels = {s.strip() for s in (include_labels or set()) if s.strip()} or None
-    include_text_any = [s for s in (include_text_any or []) if s.strip()]
-    exclude_text_any = [s for s in (exclude_text_any or []) if s.strip()]
+    include_text_any = [s.lower() for s in (include_text_any or []) if s.strip()]
+    exclude_text_any = [s.lower() for s in (exclude_text_any or []) if s.strip()]
 
     out: list[PdfIndexHit] = []
     for h in hits:
@@ -115,12 +172,12 @@ def filter_hits(
         if include_labels is not None and h.label not in include_labels:
             continue
 
-        text_norm = (h.text or "").lower()
+        text_norm = h.text_lower
         if include_text_any:
-            if not any(k.lower() in text_norm for k in include_text_any):
+            if not any(k in text_norm for k in include_text_any):
                 continue
         if exclude_text_any:
-            if any(k.lower() in text_norm for k in exclude_text_any):
+            if any(k in text_norm for k in exclude_text_any):
                 continue
 
         out.append(h)
@@ -129,10 +186,15 @@ def filter_hits(
 
 
 _ID_SAFE_RE = re.compile(r"[^A-Za-z0-9_-]+")
+_ID_SAFE_SUB = _ID_SAFE_RE.sub
+_KIND_TAGS = {"figure": "FIG", "table": "TBL"}
+
+# Same output as `json.dumps(obj, ensure_ascii=False)`, without building an encoder per row.
+_params_json = json.JSONEncoder(ensure_ascii=False).encode
 
 
 def _safe_id(s: str) -> str:
-    s2 = _ID_SAFE_RE.sub("_", str(s or "")).strip("_")
+    s2 = _ID_SAFE_SUB("_", str(s or "")).strip("_")
     return s2 or "X"
 
 
@@ -150,7 +212,7 @@ def build_pdf_page_data_requests(
     rows: list[dict[str, str | int | bool]] = []
 
     for i, h in enumerate(hits, start=1):
-        kind_tag = "FIG" if h.kind == "figure" else "TBL" if h.kind == "table" else _safe_id(h.kind)
+        kind_tag = _KIND_TAGS.get(h.kind) or _safe_id(h.kind)
         label = _safe_id(h.label.replace(".", "_"))
         req_id = f"{req_prefix}-{kind_tag}-{label}-p{h.page:03d}"
 
@@ -171,7 +233,7 @@ def build_pdf_page_data_requests(
                 "connector": "PDF_PAGE",
                 "purpose": "EVIDENCE",
                 "src_id": src_id,
-                "params_json": json.dumps(params, ensure_ascii=False),
+                "params_json": _params_json(params),
                 "output_sheet": "",
                 "merge_strategy": "REPLACE_SHEET",
                 "upsert_keys": "",
@@ -9,6 +9,7 @@ from typing import Any
 
 from eia_gen.services.data_requests.airkorea import evidence_bytes as airkorea_evidence_bytes
 from eia_gen.services.data_requests.airkorea import fetch_air_baseline
+from eia_gen.services.data_requests.api_cache import load_api_cache
 from eia_gen.services.data_requests.geocode import evidence_bytes as geocode_evidence_bytes
 from eia_gen.services.data_requests.geocode import geocode_address
 from eia_gen.services.data_requests.kosis import KosisMapping, KosisQuery
@@ -104,6 +105,17 @@ def _parse_int(v: Any, default: int) -> int:
         return default
 
 
+def _parse_bool(v: Any, default: bool = False) -> bool:
+    if isinstance(v, bool):
+        return v
+    s = str(v or "").strip().upper()
+    if s in {"TRUE", "T", "Y", "YES", "1"}:
+        return True
+    if s in {"FALSE", "F", "N", "NO", "0"}:
+        return False
+    return default
+
+
 def _parse_epsg(v: Any, default: int) -> int:
     if v is None:
         return default
@@ -187,6 +199,10 @@ def run_data_requests(
     executed = 0
     skipped = 0
 
+    # Optional on-disk API caches (`cache.api` in cache_config; disabled unless configured).
+    geocode_cache = load_api_cache(cache_config, kind="geocode")
+    kma_stations_cache = load_api_cache(cache_config, kind="kma_stations")
+
     def _is_once_complete(req) -> bool:
         """Best-effort: treat ONCE requests as complete only when evidence exists and is readable.
 
@@ -322,7 +338,12 @@ def run_data_requests(
                 if not address:
                     raise ValueError("Missing address for GEOCODE (LOCATION.address_road/address_jibeon or params_json.address)")
 
-                res = geocode_address(address=address, provider=provider)
+                res = geocode_address(
+                    address=address,
+                    provider=provider,
+                    cache=geocode_cache,
+                    force_refresh=_parse_bool(params.get("force_refresh")),
+                )
 
                 ev_id = _evidence_id(req.req_id)
                 ev_rel = Path("attachments/evidence/api") / f"{ev_id}_geocode.json"
@@ -1386,7 +1407,7 @@ def run_data_requests(
                         stations_path = wms_layers_config.parent / "stations" / "kma_asos_stations.csv"
                         stations = load_asos_station_catalog_csv(stations_path)
                         if not stations:
-                            cat = fetch_asos_station_catalog()
+                            cat = fetch_asos_station_catalog(cache=kma_stations_cache)
                             stations = cat.stations
                             try:
                                 write_asos_station_catalog_csv(stations_path, stations)
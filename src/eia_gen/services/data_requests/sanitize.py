@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
@@ -18,6 +19,7 @@ _SENSITIVE_QUERY_KEYS = {
 }
 
 
+@lru_cache(maxsize=256)
 def _is_sensitive_key(key: str) -> bool:
     k = str(key or "").strip().lower()
     return k in _SENSITIVE_QUERY_KEYS
@@ -10,10 +10,14 @@ from eia_gen.models.sources import SourceRegistry
 from eia_gen.services.canonicalize import canonicalize_case
 
 
+# libyaml-backed loader when available; parsing dominates case/sources load time.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_yaml(path: str | Path) -> Any:
     p = Path(path)
     raw = p.read_text(encoding="utf-8")
-    return yaml.safe_load(raw)
+    return yaml.load(raw, Loader=_SafeLoader)
 
 
 def load_case(path: str | Path) -> Case:
@@ -1380,7 +1380,6 @@ class ReportWriter:
     def generate(self, case: Case) -> ReportDraft:
         sections: list[SectionDraft] = []
 
-        scoping_by_id = {s.item_id: s for s in case.scoping_matrix}
         omission = _extract_prior_omission(case)
 
         for spec in SECTION_SPECS:
@@ -1391,8 +1390,8 @@ class ReportWriter:
                 sections.append(draft)
                 continue
 
-            if item_id and item_id in scoping_by_id:
-                item = scoping_by_id[item_id]
+            item = case.scoping_by_id(item_id) if item_id else None
+            if item is not None:
                 if item.scoping_class == ScopingClass.EXCLUDE:
                     draft = _excluded_section(
                         spec,
@@ -1469,7 +1468,6 @@ class SpecReportWriter:
 
     def generate(self, case: Case) -> ReportDraft:
         sections: list[SectionDraft] = []
-        scoping_by_id = {s.item_id: s for s in case.scoping_matrix}
         omission = _extract_prior_omission(case)
         tables_by_id = {t.id: t for t in self._spec.tables.tables}
         figures_by_id = {f.id: f for f in self._spec.figures.figures}
@@ -1490,8 +1488,8 @@ class SpecReportWriter:
                 sections.append(_omitted_section(llm_spec, omission.get("legal_basis_text", "")))
                 continue
 
-            if item_id and item_id in scoping_by_id:
-                item = scoping_by_id[item_id]
+            item = case.scoping_by_id(item_id) if item_id else None
+            if item is not None:
                 if item.scoping_class == ScopingClass.EXCLUDE:
                     sections.append(
                         _excluded_section(
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from eia_gen.services.data_requests import airkorea
+
+
+def _envelope(items: list[dict], *, code: str = "00") -> dict:
+    return {
+        "response": {
+            "header": {"resultCode": code, "resultMsg": "NORMAL_CODE" if code == "00" else "ERROR"},
+            "body": {"items": items, "totalCount": len(items)},
+        }
+    }
+
+
+_STATIONS = _envelope([{"stationName": "의창동", "tm": 2.4}])
+_MEASUREMENTS = _envelope(
+    [
+        {"dataTime": "2024-05-02 01:00", "pm10Value": "30", "pm25Value": "12", "o3Value": "0.030"},
+        {"dataTime": "2024-05-01 01:00", "pm10Value": "-", "pm25Value": "18", "o3Value": "0.020"},
+    ]
+)
+
+
+class _FakeClient:
+    def __init__(self, responses: dict[str, list[dict]]):
+        # endpoint name -> queued JSON bodies (the last one repeats)
+        self.responses = responses
+        self.calls: list[str] = []
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        endpoint = url.split("?", 1)[0].rsplit("/", 1)[-1]
+        self.calls.append(url)
+        queue = self.responses[endpoint]
+        body = queue.pop(0) if len(queue) > 1 else queue[0]
+        return httpx.Response(
+            200, content=json.dumps(body).encode(), request=httpx.Request("GET", url)
+        )
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    def _install(**responses: list[dict]) -> _FakeClient:
+        client = _FakeClient(responses)
+        monkeypatch.setattr(airkorea, "get_client", lambda: client)
+        return client
+
+    monkeypatch.setattr(airkorea, "rate_limit", lambda url: None)
+    monkeypatch.setenv("AIRKOREA_API_KEY", "test-key")
+    airkorea._nearest_station.cache_clear()
+    airkorea._meas_cache.clear()
+    yield _install
+    airkorea._nearest_station.cache_clear()
+    airkorea._meas_cache.clear()
+
+
+def _default_client(fake_client) -> _FakeClient:
+    return fake_client(
+        getNearbyMsrstnList=[_STATIONS], getMsrstnAcctoRltmMesureDnsty=[_MEASUREMENTS]
+    )
+
+
+def _calls_to(client: _FakeClient, endpoint: str) -> int:
+    return sum(1 for u in client.calls if f"/{endpoint}?" in u)
+
+
+def test_measurements_are_reused_within_ttl(fake_client):
+    client = _default_client(fake_client)
+
+    a = airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25)
+    b = airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25)
+
+    assert a.values == b.values == {"PM10": 30.0, "PM2.5": 15.0, "O3": 0.025}
+    assert (a.period_start, a.period_end) == ("2024-05-01", "2024-05-02")
+    assert _calls_to(client, "getMsrstnAcctoRltmMesureDnsty") == 1
+
+
+def test_measurement_cache_key_covers_params_and_key(fake_client, monkeypatch):
+    client = _default_client(fake_client)
+
+    airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25)
+    airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25, data_term="DAILY")
+    monkeypatch.setenv("AIRKOREA_API_KEY", "other-key")
+    airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25)
+
+    assert _calls_to(client, "getMsrstnAcctoRltmMesureDnsty") == 3
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [
+        _envelope([], code="22"),  # e.g. LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR
+        _envelope([{"dataTime": "2024-05-01 01:00", "pm10Value": "30"}], code="30"),
+        _envelope([]),
+    ],
+)
+def test_failed_measurement_responses_are_not_cached(fake_client, failure):
+    client = fake_client(
+        getNearbyMsrstnList=[_STATIONS],
+        getMsrstnAcctoRltmMesureDnsty=[failure, _MEASUREMENTS],
+    )
+
+    try:
+        airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25)
+    except ValueError:
+        pass
+    res = airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25)
+
+    assert res.values["PM10"] == 30.0
+    assert _calls_to(client, "getMsrstnAcctoRltmMesureDnsty") == 2
+
+
+def test_measurement_cache_ignores_entries_past_ttl(fake_client, monkeypatch):
+    client = _default_client(fake_client)
+    now = [1000.0]
+    monkeypatch.setattr(airkorea.time, "monotonic", lambda: now[0])
+
+    airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25)
+    now[0] += airkorea._MEAS_TTL_SEC + 1
+    airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25)
+
+    assert _calls_to(client, "getMsrstnAcctoRltmMesureDnsty") == 2
+
+
+def test_nearest_station_lookup_is_cached_on_rounded_coords(fake_client):
+    client = _default_client(fake_client)
+
+    a = airkorea.fetch_air_baseline(center_lon=128.68012, center_lat=35.25004)
+    b = airkorea.fetch_air_baseline(center_lon=128.68041, center_lat=35.24981)  # same 0.001° cell
+    c = airkorea.fetch_air_baseline(center_lon=128.69, center_lat=35.25)
+
+    assert a.station_name == b.station_name == c.station_name == "의창동"
+    assert a.station_distance_km == 2.4
+    assert _calls_to(client, "getNearbyMsrstnList") == 2
+    # Evidence keeps the caller's own coordinates even on a cache hit.
+    assert b.evidence_json["inputs"]["center_lon"] == 128.68041
+
+
+def test_nearest_station_failures_are_not_cached(fake_client):
+    client = fake_client(
+        getNearbyMsrstnList=[_envelope([]), _STATIONS],
+        getMsrstnAcctoRltmMesureDnsty=[_MEASUREMENTS],
+    )
+
+    with pytest.raises(ValueError, match="returned no stations"):
+        airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25)
+    res = airkorea.fetch_air_baseline(center_lon=128.68, center_lat=35.25)
+
+    assert res.station_name == "의창동"
+    assert _calls_to(client, "getNearbyMsrstnList") == 2
+
+
+def test_station_override_skips_lookup(fake_client):
+    client = _default_client(fake_client)
+
+    res = airkorea.fetch_air_baseline(
+        center_lon=128.68, center_lat=35.25, station_name_override="용지동"
+    )
+
+    assert res.station_name == "용지동"
+    assert res.evidence_json["station_request"] == {}
+    assert _calls_to(client, "getNearbyMsrstnList") == 0
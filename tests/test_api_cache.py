@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from eia_gen.services.data_requests import geocode, kma_stations
+from eia_gen.services.data_requests.api_cache import ApiCache, api_cache_from_config, load_api_cache
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _api_cfg(**api) -> dict:
+    return {"cache": {"enabled": True, "root_dir": ".cache/maps", "api": api}}
+
+
+def test_api_cache_is_off_unless_configured(tmp_path):
+    assert load_api_cache(_REPO_ROOT / "config" / "cache.yaml", kind="geocode") is None
+    assert load_api_cache(tmp_path / "missing.yaml", kind="geocode") is None
+    assert api_cache_from_config({}, kind="geocode", base_dir=tmp_path) is None
+    assert api_cache_from_config(_api_cfg(enabled=False), kind="geocode", base_dir=tmp_path) is None
+
+
+def test_api_cache_reads_root_and_ttl_from_config(tmp_path):
+    cfg = _api_cfg(enabled=True, root_dir="cache/api", ttl_days={"geocode": 90, "kma_stations": 30})
+    assert api_cache_from_config(cfg, kind="geocode", base_dir=tmp_path) == ApiCache(
+        root=tmp_path / "cache/api/geocode", ttl_days=90
+    )
+    assert api_cache_from_config(cfg, kind="kma_stations", base_dir=tmp_path).ttl_days == 30
+    assert api_cache_from_config(cfg, kind="other", base_dir=tmp_path).ttl_days == 0
+
+    absolute = _api_cfg(enabled=True, root_dir=str(tmp_path / "abs"), ttl_days=7)
+    assert api_cache_from_config(absolute, kind="geocode", base_dir=Path("/elsewhere")) == ApiCache(
+        root=tmp_path / "abs/geocode", ttl_days=7
+    )
+
+
+def test_load_api_cache_resolves_root_against_project_dir(tmp_path):
+    (tmp_path / "config").mkdir()
+    cfg_path = tmp_path / "config" / "cache.yaml"
+    cfg_path.write_text("cache:\n  api:\n    enabled: true\n    ttl_days: 5\n", encoding="utf-8")
+
+    cache = load_api_cache(cfg_path, kind="kma_stations")
+    assert cache == ApiCache(root=tmp_path / ".cache/api/kma_stations", ttl_days=5)
+
+
+def test_api_cache_roundtrip_and_ttl(tmp_path):
+    cache = ApiCache(root=tmp_path, ttl_days=1)
+    cache.write_json("a/b.json", {"x": [1, "가"]})
+    assert cache.read_json("a/b.json") == {"x": [1, "가"]}
+    assert cache.read_json("missing.json") is None
+
+    old = time.time() - 2 * 86400
+    os.utime(tmp_path / "a/b.json", (old, old))
+    assert cache.read_json("a/b.json") is None
+    assert ApiCache(root=tmp_path, ttl_days=0).read_json("a/b.json") == {"x": [1, "가"]}
+
+
+class _FakeClient:
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = 0
+
+    def get(self, url: str, params=None, **kwargs) -> httpx.Response:
+        self.calls += 1
+        body = self.handler(url, params or {})
+        return httpx.Response(
+            200, content=json.dumps(body).encode(), request=httpx.Request("GET", url)
+        )
+
+
+@pytest.fixture
+def nominatim(monkeypatch):
+    lat = [35.25]
+
+    def handler(url, params):
+        return [{"lat": str(lat[0]), "lon": "128.68"}]
+
+    client = _FakeClient(handler)
+    client.lat = lat
+    monkeypatch.setattr(geocode, "get_client", lambda: client)
+    monkeypatch.setattr(geocode, "rate_limit", lambda url: None)
+    geocode._geocode_memo.clear()
+    yield client
+    geocode._geocode_memo.clear()
+
+
+def test_geocode_without_cache_writes_nothing(nominatim, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    a = geocode.geocode_address(address="창원시  의창구", provider="NOMINATIM")
+    b = geocode.geocode_address(address="창원시 의창구", provider="NOMINATIM")
+
+    assert (a.lat, a.lon) == (b.lat, b.lon) == (35.25, 128.68)
+    assert b.address == "창원시 의창구"
+    assert nominatim.calls == 1  # in-process memo
+    assert "cache_hit" not in a.evidence_json
+    assert b.evidence_json["cache_hit"] is True
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_geocode_disk_cache_hit_and_force_refresh(nominatim, tmp_path):
+    cache = ApiCache(root=tmp_path, ttl_days=90)
+    geocode.geocode_address(address="창원시 의창구", provider="NOMINATIM", cache=cache)
+    assert nominatim.calls == 1
+
+    geocode._geocode_memo.clear()  # a new process
+    hit = geocode.geocode_address(address="창원시 의창구", provider="NOMINATIM", cache=cache)
+    assert hit.evidence_json["cache_hit"] is True
+    assert nominatim.calls == 1
+
+    nominatim.lat[0] = 35.3
+    fresh = geocode.geocode_address(
+        address="창원시 의창구", provider="NOMINATIM", cache=cache, force_refresh=True
+    )
+    assert fresh.lat == 35.3
+    assert "cache_hit" not in fresh.evidence_json
+    assert nominatim.calls == 2
+
+    # The refresh replaced both the memo and the disk entry.
+    def lookup():
+        return geocode.geocode_address(address="창원시 의창구", provider="NOMINATIM", cache=cache)
+
+    assert lookup().lat == 35.3
+    geocode._geocode_memo.clear()
+    assert lookup().lat == 35.3
+    assert nominatim.calls == 2
+
+
+def test_geocode_disk_hits_are_not_memoized(nominatim, tmp_path):
+    cache = ApiCache(root=tmp_path, ttl_days=90)
+    geocode.geocode_address(address="창원시 의창구", provider="NOMINATIM", cache=cache)
+    geocode._geocode_memo.clear()
+    geocode.geocode_address(address="창원시 의창구", provider="NOMINATIM", cache=cache)  # disk hit
+
+    for f in tmp_path.rglob("*.json"):
+        f.unlink()
+    geocode.geocode_address(address="창원시 의창구", provider="NOMINATIM", cache=cache)
+    assert nominatim.calls == 2
+
+
+def test_geocode_memo_hits_do_not_share_evidence(nominatim):
+    first = geocode.geocode_address(address="창원시 의창구", provider="NOMINATIM")
+    hit = geocode.geocode_address(address="창원시 의창구", provider="NOMINATIM")
+    hit.evidence_json["note"] = "edited by caller"
+
+    again = geocode.geocode_address(address="창원시 의창구", provider="NOMINATIM")
+    assert "note" not in again.evidence_json
+    assert "cache_hit" not in first.evidence_json
+    assert again.evidence_json["cache_hit"] is True
+
+
+def test_geocode_addresses_labels_only_earlier_lookups_as_hits(nominatim):
+    out = geocode.geocode_addresses(["주소 1", "주소  1"], provider="NOMINATIM")
+    assert [r.address for r in out] == ["주소 1", "주소  1"]
+    assert nominatim.calls == 1
+    assert not any("cache_hit" in r.evidence_json for r in out)
+
+    out = geocode.geocode_addresses(["주소 1", "주소 2"], provider="NOMINATIM")
+    assert nominatim.calls == 2
+    assert [r.evidence_json.get("cache_hit", False) for r in out] == [True, False]
+
+
+def test_geocode_addresses_force_refresh_requests_each_address_once(nominatim):
+    geocode.geocode_addresses(["주소 1", "주소 2"], provider="NOMINATIM")
+    assert nominatim.calls == 2
+    out = geocode.geocode_addresses(
+        ["주소 1", "주소  1", "주소 2"], provider="NOMINATIM", force_refresh=True
+    )
+    assert [r.address for r in out] == ["주소 1", "주소  1", "주소 2"]
+    assert nominatim.calls == 4
+
+
+@pytest.fixture
+def kma_catalog(monkeypatch):
+    def handler(url, params):
+        items = [
+            {"stnId": "155", "stnNm": "창원", "lat": "35.17", "lon": "128.57"},
+            {"stnId": "159", "stnNm": "부산", "lat": "35.10", "lon": "129.03"},
+        ]
+        return {
+            "response": {
+                "header": {"resultCode": "00"},
+                "body": {"items": {"item": items}, "totalCount": len(items)},
+            }
+        }
+
+    client = _FakeClient(handler)
+    monkeypatch.setattr(kma_stations, "get_client", lambda: client)
+    monkeypatch.setattr(kma_stations, "rate_limit", lambda url: None)
+    monkeypatch.setenv("KMA_API_KEY", "test-key")
+    return client
+
+
+def test_station_catalog_uses_cache_only_when_given(kma_catalog, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    kma_stations.fetch_asos_station_catalog()
+    kma_stations.fetch_asos_station_catalog()
+    assert kma_catalog.calls == 2
+    assert list(tmp_path.iterdir()) == []
+
+    cache = ApiCache(root=tmp_path / "api", ttl_days=30)
+    first = kma_stations.fetch_asos_station_catalog(cache=cache)
+    again = kma_stations.fetch_asos_station_catalog(cache=cache)
+    assert kma_catalog.calls == 3
+    assert again.stations == first.stations
+    assert again.evidence_json["cache_hit"] is True
+
+    refreshed = kma_stations.fetch_asos_station_catalog(cache=cache, force_refresh=True)
+    assert kma_catalog.calls == 4
+    assert "cache_hit" not in refreshed.evidence_json
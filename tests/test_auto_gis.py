@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+from shapely.geometry import Polygon, box
+
+from eia_gen.services.data_requests import auto_gis
+from eia_gen.services.data_requests.auto_gis import (
+    WmsOverlayInput,
+    overlay_from_geojson,
+    overlay_from_wms_evidence,
+)
+
+# Everything below is in EPSG:5186 (metres), so no reprojection is involved.
+_EPSG = 5186
+_X0, _Y0 = 200000.0, 500000.0
+_BOUNDARY = box(_X0, _Y0, _X0 + 100, _Y0 + 100)
+
+
+def _feature(geom) -> dict:
+    return {"type": "Feature", "properties": {}, "geometry": geom.__geo_interface__}
+
+
+def _write_geojson(path: Path, *geoms) -> str:
+    doc = {"type": "FeatureCollection", "features": [_feature(g) for g in geoms]}
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    return path.name
+
+
+def _evidence(out: auto_gis.AutoGisOutput) -> dict[str, dict[str, str]]:
+    rows = csv.DictReader(io.StringIO(out.evidence_bytes.decode("utf-8")))
+    return {r["overlay_id"]: r for r in rows}
+
+
+def test_polygon_mask_fills_exterior_and_clears_holes():
+    ring = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    hole = [(4, 4), (6, 4), (6, 6), (4, 6)]
+    mask = auto_gis._polygon_mask(Polygon(ring, [hole]), bbox=(0, 0, 10, 10), width=11, height=11)
+
+    m = np.asarray(mask) > 0
+    assert m.shape == (11, 11)
+    assert m[0, 0] and m[10, 10] and m[2, 8]
+    assert not m[5, 5] and not m[4:7, 4:7].any()
+    assert int(m.sum()) == 121 - 9
+
+
+def test_overlay_from_geojson_rows_and_evidence(tmp_path):
+    boundary = _write_geojson(tmp_path / "boundary.geojson", _BOUNDARY)
+    overlapping = box(_X0 + 50, _Y0, _X0 + 150, _Y0 + 100)
+    east = box(_X0 + 150, _Y0 + 20, _X0 + 200, _Y0 + 80)
+    north_parts = (
+        box(_X0, _Y0 + 300, _X0 + 20, _Y0 + 320),
+        box(_X0 + 80, _Y0 + 200, _X0 + 100, _Y0 + 220),
+    )
+    overlays = [
+        {"overlay_id": "IN", "geometry_file": _write_geojson(tmp_path / "in.geojson", overlapping)},
+        {"overlay_id": "EAST", "geometry_file": _write_geojson(tmp_path / "e.geojson", east)},
+        {
+            "overlay_id": "NORTH",
+            "geometry_file": _write_geojson(tmp_path / "n.geojson", *north_parts),
+            "src_id": "S-03",
+        },
+        {"overlay_id": "MISSING", "geometry_file": "nope.geojson"},
+        {"overlay_id": "EMPTY", "geometry_file": ""},
+        {"geometry_file": "in.geojson"},
+    ]
+
+    out = overlay_from_geojson(
+        case_dir=tmp_path,
+        boundary_file=boundary,
+        boundary_epsg=_EPSG,
+        overlays=overlays,
+        metric_epsg=_EPSG,
+        req_id="REQ-1",
+    )
+
+    rows = {r["overlay_id"]: r for r in out.rows}
+    assert [r["overlay_id"] for r in out.rows] == ["IN", "EAST", "NORTH", "MISSING", "EMPTY"]
+    assert (rows["IN"]["is_applicable"], rows["IN"]["distance_m"], rows["IN"]["direction"]) == (
+        "O",
+        0.0,
+        "-",
+    )
+    assert (rows["EAST"]["is_applicable"], rows["EAST"]["distance_m"]) == ("X", 50.0)
+    assert rows["EAST"]["direction"] == "동"
+    assert (rows["NORTH"]["is_applicable"], rows["NORTH"]["distance_m"]) == ("X", 100.0)
+    assert rows["NORTH"]["direction"] == "북"
+    assert rows["NORTH"]["src_id"] == "S-03" and rows["IN"]["src_id"] == "S-TBD"
+    assert rows["MISSING"]["is_applicable"] == rows["EMPTY"]["is_applicable"] == "UNKNOWN"
+    assert any("missing overlay_id" in w for w in out.warnings)
+
+    ev = _evidence(out)
+    assert out.evidence_filename == "REQ-1_overlay.csv"
+    assert set(ev) == {"IN", "EAST", "NORTH"}
+    assert float(ev["IN"]["overlap_area_m2"]) == pytest.approx(5000.0)
+    assert float(ev["EAST"]["overlap_area_m2"]) == 0.0
+    assert ev["NORTH"]["geometry_epsg"] == str(_EPSG)
+
+
+def test_overlay_from_geojson_missing_boundary(tmp_path):
+    out = overlay_from_geojson(
+        case_dir=tmp_path,
+        boundary_file="missing.geojson",
+        boundary_epsg=_EPSG,
+        overlays=[],
+        metric_epsg=_EPSG,
+        req_id="REQ-1",
+    )
+    assert out.rows == [] and out.evidence_bytes == b""
+    assert out.warnings and "boundary_file not found" in out.warnings[0]
+
+
+# 100x100 px raster over a 300 m square: 3 m per pixel, boundary at pixels ~33..66.
+_BBOX = (_X0 - 100, _Y0 - 100, _X0 + 200, _Y0 + 200)
+
+
+def _raster(path: Path, *, block: tuple[int, int, int, int] | None, opaque: bool = False) -> Path:
+    rgba = np.zeros((100, 100, 4), dtype=np.uint8)
+    if opaque:
+        rgba[..., 3] = 255
+    if block is not None:
+        x0, x1, y0, y1 = block
+        rgba[y0:y1, x0:x1] = (255, 0, 0, 255)
+    Image.fromarray(rgba, "RGBA").save(path)
+    return path
+
+
+def _wms_item(overlay_id: str, image: Path) -> WmsOverlayInput:
+    return WmsOverlayInput(
+        overlay_id=overlay_id,
+        category="재해",
+        designation_name=overlay_id,
+        image_path=image,
+        image_bbox=_BBOX,
+        image_epsg=_EPSG,
+        src_id="S-WMS",
+        basis="AUTO_GIS (WMS)",
+    )
+
+
+def test_overlay_from_wms_evidence_coverage_and_distance(tmp_path):
+    boundary = _write_geojson(tmp_path / "boundary.geojson", _BOUNDARY)
+    items = [
+        _wms_item("INSIDE", _raster(tmp_path / "inside.png", block=(40, 50, 40, 50))),
+        _wms_item("EAST", _raster(tmp_path / "east.png", block=(85, 95, 40, 50))),
+        _wms_item("OPAQUE", _raster(tmp_path / "opaque.png", block=None, opaque=True)),
+        _wms_item("EMPTY", _raster(tmp_path / "empty.png", block=None)),
+        _wms_item("PH", _raster(tmp_path / "x__PLACEHOLDER__.png", block=(40, 50, 40, 50))),
+    ]
+
+    out = overlay_from_wms_evidence(
+        case_dir=tmp_path,
+        boundary_file=boundary,
+        boundary_epsg=_EPSG,
+        center_lon=None,
+        center_lat=None,
+        center_epsg=4326,
+        radius_m=500,
+        items=items,
+        req_id="REQ-2",
+        metric_epsg=_EPSG,
+        distance_sample_stride=1,
+    )
+
+    rows = {r["overlay_id"]: r for r in out.rows}
+    assert [r["overlay_id"] for r in out.rows] == ["INSIDE", "EAST", "OPAQUE", "EMPTY", "PH"]
+    assert (rows["INSIDE"]["is_applicable"], rows["INSIDE"]["distance_m"]) == ("O", 0.0)
+    # Nearest feature pixel centre: x = 199900 + 85.5 * 3 = 200156.5, 56.5 m east of the edge.
+    assert rows["EAST"]["is_applicable"] == "X"
+    assert rows["EAST"]["distance_m"] == pytest.approx(56.5)
+    assert rows["EAST"]["direction"] == "동"
+    assert rows["OPAQUE"]["is_applicable"] == "UNKNOWN"
+    assert (rows["EMPTY"]["is_applicable"], rows["EMPTY"]["distance_m"]) == ("X", "")
+    assert rows["PH"]["is_applicable"] == "UNKNOWN"
+
+    ev = _evidence(out)
+    assert (ev["INSIDE"]["active_total_px"], ev["INSIDE"]["active_inside_px"]) == ("100", "100")
+    assert float(ev["INSIDE"]["overlap_area_m2"]) == pytest.approx(900.0)
+    assert ev["EAST"]["active_inside_px"] == "0"
+    assert ev["INSIDE"]["mask_px"] == ev["EAST"]["mask_px"]
+    assert 33 * 33 <= int(ev["INSIDE"]["mask_px"]) <= 35 * 35
+    assert ev["INSIDE"]["image_size"] == "100x100"
+    assert any("fully opaque" in w for w in out.warnings)
+
+
+def test_overlay_from_wms_evidence_point_buffer_fallback(tmp_path):
+    image = _raster(tmp_path / "inside.png", block=(40, 50, 40, 50))
+    out = overlay_from_wms_evidence(
+        case_dir=tmp_path,
+        boundary_file="",
+        boundary_epsg=_EPSG,
+        center_lon=_X0 + 50,
+        center_lat=_Y0 + 50,
+        center_epsg=_EPSG,
+        radius_m=30,
+        items=[_wms_item("INSIDE", image)],
+        req_id="REQ-3",
+        metric_epsg=_EPSG,
+    )
+    assert out.rows[0]["is_applicable"] == "O"
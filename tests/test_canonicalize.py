@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from eia_gen.models.case import Case, InfluenceArea
+from eia_gen.models.fields import QuantityField, TextField
+from eia_gen.services.canonicalize import canonicalize_case
+
+
+def _case() -> Case:
+    return Case.model_validate(
+        {
+            "project_overview": {
+                "location": {
+                    "address": {"t": "경상남도 창원시 의창구 북면 일원", "src": ["S-ADDR"]}
+                },
+                "area": {
+                    "parcels": [
+                        {
+                            "jibun": {"t": "1-1", "src": ["S-J1"]},
+                            "land_category": "전",
+                            "zoning": {"t": "계획관리지역", "src": ["S-Z"]},
+                            "area_m2": {"v": 1000, "src": ["S-A1"]},
+                        },
+                        {
+                            "jibun": "2",
+                            "land_category": "임야",
+                            "zoning": "계획관리지역",
+                            "area_m2": 500,
+                        },
+                    ]
+                },
+            },
+            "scoping_matrix": [
+                {"item_id": "LE-AIR", "item_name": "대기질", "category": "중점"},
+            ],
+        }
+    )
+
+
+def test_influence_area_default_dump_is_unchanged():
+    ia = InfluenceArea()
+    assert ia.radius_m == QuantityField(v=500.0, u="m")
+    assert ia.model_dump(exclude_unset=True) == {}
+    assert ia.radius_m.model_dump(exclude_unset=True) == {"v": 500.0, "u": "m"}
+
+
+def test_canonicalize_derived_fields_match_validated_constructors():
+    case = canonicalize_case(_case())
+    area = case.project_overview.area
+
+    assert case.scoping_by_id("LIFE_AIR") is not None
+
+    total = QuantityField(v=1500.0, u="m2", src=["S-A1", "S-J1", "S-Z"])
+    assert area.total_area_m2 == total
+    assert area.total_area_m2.model_fields_set == total.model_fields_set
+
+    zoning = QuantityField(v=1500.0, u="m2", src=["S-A1", "S-Z", "S-J1"])
+    assert area.zoning_area_m2 == {"계획관리지역": zoning}
+    assert area.zoning_area_m2["계획관리지역"].model_fields_set == zoning.model_fields_set
+
+    village = TextField(t="경상남도 창원시 의창구 북면", src=["S-ADDR"])
+    nearest = case.baseline.population_traffic.nearest_village
+    assert nearest == village
+    assert nearest.model_dump(exclude_unset=True) == village.model_dump(exclude_unset=True)
+
+    summary = case.baseline.landuse_landscape.current_landcover_summary
+    assert summary.t.startswith("대상지 지번(2필지)은 지목 기준 임야 1필지, 전 1필지")
+    assert summary.model_fields_set == {"t", "src"}
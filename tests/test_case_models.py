@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from eia_gen.models.case import (
+    AdminDistrict,
+    Case,
+    CenterCoord,
+    Facility,
+    Milestone,
+    NoiseReceptor,
+    PermitItem,
+    ScopingItem,
+    StreamEntry,
+    Viewpoint,
+)
+from eia_gen.services.export.source_register_xlsx import _walk_source_ids
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        AdminDistrict,
+        CenterCoord,
+        Facility,
+        Milestone,
+        NoiseReceptor,
+        PermitItem,
+        StreamEntry,
+        Viewpoint,
+    ],
+)
+def test_leaf_models_keep_unknown_keys(model):
+    obj = model.model_validate({"custom_key": {"t": "x", "src": ["S-EXTRA"]}})
+    assert obj.model_extra == {"custom_key": {"t": "x", "src": ["S-EXTRA"]}}
+
+
+def test_leaf_model_extras_feed_source_ids():
+    fac = Facility.model_validate(
+        {"name": {"t": "주차장", "src": ["S-01"]}, "foo": {"t": "bar", "src": ["S-EXTRA"]}}
+    )
+    assert fac.model_extra == {"foo": {"t": "bar", "src": ["S-EXTRA"]}}
+    assert set(_walk_source_ids(fac)) == {"S-01", "S-EXTRA"}
+
+
+def _case_with_scoping() -> Case:
+    return Case.model_validate(
+        {
+            "scoping_matrix": [
+                {"item_id": "A1", "item_name": "대기질", "category": {"t": "중점"}},
+                {"item_id": "A2", "item_name": "소음", "category": {"t": "현황"}},
+            ]
+        }
+    )
+
+
+def test_scoping_index_returns_the_case_items():
+    case = _case_with_scoping()
+    assert case.scoping_by_id("A2") is case.scoping_matrix[1]
+    assert case.scoping_by_id("ZZ") is None
+
+
+def test_scoping_index_follows_copies_and_mutations():
+    case = _case_with_scoping()
+    copied = case.model_copy(deep=True)
+    assert copied.scoping_by_id("A1") is copied.scoping_matrix[0]
+    assert copied.scoping_by_id("A1") is not case.scoping_matrix[0]
+
+    case.scoping_matrix.append(ScopingItem(item_id="A3", item_name="진동", category={"t": "현황"}))
+    assert case.scoping_by_id("A3") is case.scoping_matrix[2]
+
+    case.scoping_matrix = [ScopingItem(item_id="B1", item_name="수질", category={"t": "중점"})]
+    assert case.scoping_by_id("A1") is None
+    assert case.scoping_by_id("B1") is case.scoping_matrix[0]
+
+    case.scoping_matrix[0].item_id = "B2"
+    case.reindex_scoping()
+    assert case.scoping_by_id("B2") is case.scoping_matrix[0]
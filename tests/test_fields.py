@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from eia_gen.models.fields import QuantityField, TextField
+
+
+def test_text_field_coerces_scalars():
+    assert TextField.model_validate("abc").t == "abc"
+    assert TextField.model_validate(None).t == ""
+    assert TextField.model_validate(12).t == "12"
+
+
+def test_text_field_accepts_dict_and_text_alias():
+    tf = TextField.model_validate({"text": "abc", "src": ["S-1"], "confidential": True})
+    assert (tf.t, tf.src, tf.confidential) == ("abc", ["S-1"], True)
+
+    raw = {"text": "abc"}
+    TextField.model_validate(raw)
+    assert raw == {"text": "abc"}  # caller's dict is not modified
+
+
+def test_text_field_passes_instances_through():
+    src = TextField(t="abc", src=["S-1"])
+    assert TextField.model_validate(src) == src
+
+
+def test_text_field_scalar_matches_dict_input():
+    for raw in ("abc", None):
+        a = TextField.model_validate(raw)
+        b = TextField.model_validate({"t": raw or ""})
+        assert a == b
+        assert a.model_fields_set == b.model_fields_set == {"t"}
+        assert a.model_dump(exclude_unset=True) == b.model_dump(exclude_unset=True)
+
+
+def test_quantity_field_coerces_scalars():
+    assert QuantityField.model_validate(3).v == 3.0
+    assert QuantityField.model_validate("2.5").v == 2.5
+    assert QuantityField.model_validate(None).v is None
+
+    bad = QuantityField.model_validate("n/a")
+    assert bad.v is None
+    assert bad.note == "non-numeric: 'n/a'"
+    assert bad.model_fields_set == {"v", "note"}
+
+
+def test_quantity_field_accepts_dict_and_value_alias():
+    q = QuantityField.model_validate({"value": "7", "u": "m2", "src": ["S-2"]})
+    assert (q.v, q.u, q.src) == (7.0, "m2", ["S-2"])
+
+
+def test_quantity_field_scalar_matches_dict_input():
+    a = QuantityField.model_validate(5)
+    b = QuantityField.model_validate({"v": 5})
+    assert a == b
+    assert a.model_dump(exclude_unset=True) == b.model_dump(exclude_unset=True) == {"v": 5.0}
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import httpx
+import pytest
+
+from eia_gen.services.data_requests import kma_asos
+
+
+def _ymd(d: date) -> str:
+    return d.strftime("%Y%m%d")
+
+
+def _rain(d: date) -> float:
+    # Deterministic daily rainfall (mm) with dry days.
+    return float((d.toordinal() * 37) % 23) if d.toordinal() % 3 else 0.0
+
+
+class _FakeAsos:
+    """Serves the daily ASOS endpoint for any date range, answering out of order."""
+
+    def __init__(self, *, with_total: bool = True, error_page: int | None = None):
+        self.with_total = with_total
+        self.error_page = error_page
+        self.requests: list[tuple[str, str, int]] = []
+        self._lock = threading.Lock()
+        self._rnd = random.Random(3)
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        q = httpx.URL(url).params
+        start = datetime.strptime(q["startDt"], "%Y%m%d").date()
+        end = datetime.strptime(q["endDt"], "%Y%m%d").date()
+        page_no, rows = int(q["pageNo"]), int(q["numOfRows"])
+        with self._lock:
+            self.requests.append((q["startDt"], q["endDt"], page_no))
+            delay = self._rnd.uniform(0, 0.004)
+        time.sleep(delay)
+
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        page = days[(page_no - 1) * rows : page_no * rows]
+        items = [
+            {"tm": d.isoformat(), "stnId": q["stnIds"], "sumRn": str(_rain(d)) if _rain(d) else ""}
+            for d in page
+        ]
+        body = {"pageNo": page_no, "numOfRows": rows, "items": {"item": items}}
+        if self.with_total:
+            body["totalCount"] = len(days)
+        code = "03" if page_no == self.error_page else "00"
+        header = {"resultCode": code, "resultMsg": "NORMAL_SERVICE"}
+        resp = {"response": {"header": header, "body": body}}
+        return httpx.Response(
+            200, content=json.dumps(resp).encode(), request=httpx.Request("GET", url)
+        )
+
+
+@pytest.fixture
+def fake_asos(monkeypatch):
+    def _install(**kwargs) -> _FakeAsos:
+        fake = _FakeAsos(**kwargs)
+        monkeypatch.setattr(kma_asos, "get_client", lambda: fake)
+        return fake
+
+    monkeypatch.setattr(kma_asos, "rate_limit", lambda url: None)
+    monkeypatch.setenv("KMA_API_KEY", "test-key")
+    return _install
+
+
+def _expected(start: date, end: date) -> tuple[float, float]:
+    vals = [_rain(start + timedelta(days=i)) for i in range((end - start).days + 1)]
+    return sum(vals), max(vals)
+
+
+@pytest.mark.parametrize("with_total", [True, False])
+def test_concurrent_ranges_and_pages_match_serial_results(fake_asos, with_total):
+    fake = fake_asos(with_total=with_total)
+    start, end = date(2015, 1, 1), date(2021, 12, 31)  # 2557 days -> 3 range chunks
+
+    stats = kma_asos.fetch_asos_daily_precip_stats(
+        station_id="155", start_dt=_ymd(start), end_dt=_ymd(end), num_rows=200
+    )
+
+    total, max_24h = _expected(start, end)
+    assert stats.total_rain_mm == pytest.approx(total)
+    assert stats.max_24h_rain_mm == max_24h
+    ev = stats.evidence_json
+    assert ev["response"]["items_count"] == (end - start).days + 1
+
+    # Ranges and pages are reported in calendar/page order regardless of completion order.
+    chunks = []
+    cur = start
+    while cur <= end:  # <= 1000-day blocks
+        chunk_end = min(cur + timedelta(days=999), end)
+        chunks.append((cur, chunk_end))
+        cur = chunk_end + timedelta(days=1)
+    ranges = ev["request"]["ranges"]
+    assert [(r["startDt"], r["endDt"]) for r in ranges] == [(_ymd(a), _ymd(b)) for a, b in chunks]
+    for r, (a, b) in zip(ranges, chunks, strict=True):
+        n_pages = -(-((b - a).days + 1) // 200)
+        assert [p["pageNo"] for p in r["pages"]] == list(range(1, n_pages + 1))
+    # The last page reported is the final page of the last range.
+    assert ev["response"]["last_page"]["response"]["body"]["pageNo"] == n_pages
+
+    # No page is requested twice (plus one trailing empty probe per range without totalCount).
+    assert len(fake.requests) == len(set(fake.requests))
+
+
+def test_api_error_on_a_later_page_is_raised(fake_asos):
+    fake_asos(error_page=2)
+    with pytest.raises(ValueError, match="resultCode=03"):
+        kma_asos.fetch_asos_daily_precip_stats(
+            station_id="155", start_dt="20200101", end_dt="20201231", num_rows=100
+        )
+
+
+def test_end_date_is_clamped_to_yesterday(fake_asos):
+    fake = fake_asos()
+    yesterday = date.today() - timedelta(days=1)
+    stats = kma_asos.fetch_asos_daily_precip_stats(
+        station_id="155", start_dt=_ymd(yesterday - timedelta(days=9)), end_dt=_ymd(date.today())
+    )
+    assert stats.end_dt == _ymd(yesterday)
+    assert {r[1] for r in fake.requests} == {_ymd(yesterday)}
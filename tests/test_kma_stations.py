@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import random
+
+import httpx
+import numpy as np
+from pyproj import Geod
+
+from eia_gen.services.data_requests import kma_stations
+from eia_gen.services.data_requests.kma_stations import (
+    AsosStation,
+    AsosStationCatalog,
+    pick_nearest_asos_stations,
+)
+
+_GEOD = Geod(ellps="WGS84")
+
+
+def _stations(n: int, seed: int = 7) -> list[AsosStation]:
+    rnd = random.Random(seed)
+    return [
+        AsosStation(
+            station_id=str(100 + i),
+            station_name=f"STN{i}",
+            lat=rnd.uniform(33.0, 38.6),
+            lon=rnd.uniform(124.5, 131.0),
+        )
+        for i in range(n)
+    ]
+
+
+def _brute_force(stations: list[AsosStation], lon: float, lat: float, top_n: int) -> list[dict]:
+    scored = []
+    for s in stations:
+        _, _, d = _GEOD.inv(lon, lat, s.lon, s.lat)
+        scored.append((d, s))
+    scored.sort(key=lambda x: x[0])
+    return [
+        {
+            "station_id": s.station_id,
+            "station_name": s.station_name,
+            "distance_km": round(d / 1000.0, 3),
+        }
+        for d, s in scored[:top_n]
+    ]
+
+
+def test_pick_nearest_matches_exhaustive_geodesic_search():
+    stations = _stations(120)
+    catalog = AsosStationCatalog(stations=stations, evidence_json={})
+    rnd = random.Random(11)
+    for _ in range(50):
+        lon, lat = rnd.uniform(125.0, 130.5), rnd.uniform(33.5, 38.3)
+        for top_n in (1, 3, 10):
+            expected = _brute_force(stations, lon, lat, top_n)
+            for given in (stations, catalog):
+                got = pick_nearest_asos_stations(
+                    center_lon=lon, center_lat=lat, stations=given, top_n=top_n
+                )
+                assert got == expected
+
+
+def test_pick_nearest_handles_small_and_empty_inputs():
+    def pick(stations, top_n):
+        return pick_nearest_asos_stations(
+            center_lon=128.6, center_lat=35.2, stations=stations, top_n=top_n
+        )
+
+    stations = _stations(2)
+    expected = _brute_force(stations, 128.6, 35.2, 5)
+    assert [r["station_id"] for r in pick(stations, 5)] == [r["station_id"] for r in expected]
+    assert pick([], 3) == []
+    assert pick(AsosStationCatalog(stations=[], evidence_json={}), 3) == []
+
+
+def _bad_rows() -> list[AsosStation]:
+    return [
+        AsosStation(station_id="900", station_name="NO_LAT", lat=float("nan"), lon=128.6),
+        AsosStation(station_id="901", station_name="POLE", lat=95.0, lon=128.6),
+        AsosStation(station_id="902", station_name="NO_LON", lat=35.2, lon=float("inf")),
+    ]
+
+
+def test_pick_nearest_skips_bad_rows_only():
+    good = _stations(20)
+    stations = _bad_rows() + good
+    for top_n in (1, 3, 25):
+        out = pick_nearest_asos_stations(
+            center_lon=128.6, center_lat=35.2, stations=stations, top_n=top_n
+        )
+        assert out == _brute_force(good, 128.6, 35.2, top_n)
+
+
+class _ScalarOnlyGeod:
+    """Rejects batched calls, like a pyproj build that raises on one bad array element."""
+
+    def inv(self, lons1, lats1, lons2, lats2):
+        if not np.isscalar(lons2) and np.ndim(lons2):
+            raise ValueError("batch failed")
+        if lons2 == 129.0:
+            raise ValueError("bad station")
+        return _GEOD.inv(lons1, lats1, lons2, lats2)
+
+
+def test_pick_nearest_falls_back_to_per_station_solves(monkeypatch):
+    monkeypatch.setattr(kma_stations, "_GEOD", _ScalarOnlyGeod())
+    stations = _stations(10)
+    broken = AsosStation(station_id="999", station_name="BROKEN", lat=35.2, lon=129.0)
+
+    out = pick_nearest_asos_stations(
+        center_lon=128.6, center_lat=35.2, stations=[broken, *stations], top_n=3
+    )
+    assert out == _brute_force(stations, 128.6, 35.2, 3)
+
+
+class _CatalogClient:
+    def __init__(self, items: list[dict]):
+        self.items = items
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        body = {
+            "response": {
+                "header": {"resultCode": "00"},
+                "body": {"items": {"item": self.items}, "totalCount": len(self.items)},
+            }
+        }
+        return httpx.Response(
+            200, content=json.dumps(body).encode(), request=httpx.Request("GET", url)
+        )
+
+
+def test_station_catalog_reads_id_and_name_keys_per_row(monkeypatch):
+    items = [
+        {"stnId": "", "stationId": "90", "stnNm": "속초", "lat": "38.25", "lon": "128.56"},
+        {"stationId": "155", "stationName": "창원", "lat": "35.17", "lon": "128.57"},
+        {"stn_id": "159", "stn_nm": "부산", "lat": "35.10", "lon": "129.03"},
+        {"stnId": "155", "stnNm": "창원(중복)", "lat": "35.17", "lon": "128.57"},
+        {"stnNm": "ID 없음", "lat": "35.0", "lon": "128.0"},
+    ]
+    monkeypatch.setattr(kma_stations, "get_client", lambda: _CatalogClient(items))
+    monkeypatch.setattr(kma_stations, "rate_limit", lambda url: None)
+    monkeypatch.setenv("KMA_API_KEY", "test-key")
+
+    catalog = kma_stations.fetch_asos_station_catalog()
+
+    assert [(s.station_id, s.station_name) for s in catalog.stations] == [
+        ("90", "속초"),
+        ("155", "창원"),
+        ("159", "부산"),
+    ]
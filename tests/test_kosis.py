@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from eia_gen.services.data_requests.kosis import load_kosis_dataset_catalog, resolve_kosis_dataset
+
+_CATALOG = """\
+datasets:
+  POP_SIGUNGU:
+    description: 시군구 인구
+    query_params:
+      orgId: "101"
+      tblId: DT_1B040A3
+      objL1: "{admin_code}"
+      itmId: [T20, T21]
+    mappings:
+      - output_col: population_total
+        match_itm_id: T20
+      - output_col: households
+        match_itm_nm_contains: 세대
+"""
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    p = tmp_path / "kosis_datasets.yaml"
+    p.write_text(_CATALOG, encoding="utf-8")
+    return p
+
+
+def test_catalog_returns_plain_dicts(catalog_path):
+    cat = load_kosis_dataset_catalog(catalog_path)
+    assert type(cat) is dict
+    assert type(cat["POP_SIGUNGU"]) is dict
+    assert cat["POP_SIGUNGU"]["query_params"]["itmId"] == ["T20", "T21"]
+
+
+def test_catalog_calls_do_not_share_nested_data(catalog_path):
+    first = load_kosis_dataset_catalog(catalog_path)
+    first["POP_SIGUNGU"]["query_params"]["tblId"] = "CHANGED"
+    first["POP_SIGUNGU"]["query_params"]["itmId"].append("T99")
+    first["POP_SIGUNGU"]["mappings"].clear()
+    del first["POP_SIGUNGU"]["description"]
+
+    again = load_kosis_dataset_catalog(catalog_path)
+    assert again["POP_SIGUNGU"]["query_params"]["tblId"] == "DT_1B040A3"
+    assert again["POP_SIGUNGU"]["query_params"]["itmId"] == ["T20", "T21"]
+    assert len(again["POP_SIGUNGU"]["mappings"]) == 2
+    assert again["POP_SIGUNGU"]["description"] == "시군구 인구"
+
+
+def test_catalog_edits_are_picked_up(catalog_path):
+    assert load_kosis_dataset_catalog(catalog_path)["POP_SIGUNGU"]["query_params"]["orgId"] == "101"
+
+    st = catalog_path.stat()
+    catalog_path.write_text(_CATALOG.replace('orgId: "101"', 'orgId: "102"'), encoding="utf-8")
+    os.utime(catalog_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_kosis_dataset_catalog(catalog_path)["POP_SIGUNGU"]["query_params"]["orgId"] == "102"
+
+
+def test_missing_catalog_raises(tmp_path):
+    with pytest.raises(ValueError, match="Failed to load YAML"):
+        load_kosis_dataset_catalog(tmp_path / "missing.yaml")
+
+
+def test_resolve_dataset_formats_templates_without_touching_catalog(catalog_path):
+    q, mappings, meta = resolve_kosis_dataset(
+        dataset_key="POP_SIGUNGU", config_path=catalog_path, context={"admin_code": "38110"}
+    )
+    assert q.query_params["objL1"] == "38110"
+    assert [m.output_col for m in mappings] == ["population_total", "households"]
+    assert meta["dataset_key"] == "POP_SIGUNGU"
+
+    raw = load_kosis_dataset_catalog(catalog_path)["POP_SIGUNGU"]["query_params"]
+    assert raw["objL1"] == "{admin_code}"
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from eia_gen.services.data_requests import pdf_index
+from eia_gen.services.data_requests.pdf_index import (
+    PdfIndexHit,
+    build_pdf_page_data_requests,
+    filter_hits,
+    load_pdf_index_hits,
+)
+
+
+def _write(path: Path, obj: dict) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+_HITS = [
+    {"kind": "Table", "page": 12, "label": "3.2-1", "text": " 대기질 현황 "},
+    {"kind": "figure", "page": "3", "label": "2.1-1", "text": "사업 위치도"},
+    {"kind": "figure", "page": 12, "label": "3.2-1", "text": "소음 측정 지점"},
+    {"kind": "chapter", "page": 1, "label": "1", "text": "사업의 개요"},
+    {"kind": "note", "page": 2, "label": "x", "text": "ignored kind"},
+    {"kind": "figure", "page": "?", "label": "bad", "text": "bad page"},
+    {"kind": "figure", "page": 4, "label": "", "text": "no label"},
+]
+
+
+def _key(h: PdfIndexHit) -> tuple:
+    return (h.kind, h.page, h.label, h.text)
+
+
+def test_hits_are_deduplicated_across_files_and_sorted(tmp_path):
+    _write(tmp_path / "combined_index.json", {"pdf_path": " report.pdf ", "pass2": {"hits": _HITS}})
+    pass2 = {"pdf_path": "other.pdf", "hits": _HITS[::-1] + _HITS}
+    _write(tmp_path / "run1" / "pass2_hits.json", pass2)
+
+    hits, pdf_path = load_pdf_index_hits(tmp_path)
+
+    assert pdf_path == "report.pdf"  # the first file (combined_index.json) wins
+    assert [_key(h) for h in hits] == [
+        ("chapter", 1, "1", "사업의 개요"),
+        ("figure", 3, "2.1-1", "사업 위치도"),
+        ("figure", 12, "3.2-1", "소음 측정 지점"),
+        ("table", 12, "3.2-1", "대기질 현황"),
+    ]
+
+
+def test_dedup_keeps_distinct_hits_and_matches_sort_then_dedup(tmp_path):
+    raw = [
+        {"kind": "figure", "page": p % 7, "label": f"{p % 5}", "text": f"t{p % 3}"}
+        for p in range(60)
+    ]
+    _write(tmp_path / "index.json", {"hits": raw})
+
+    hits, pdf_path = load_pdf_index_hits(tmp_path / "index.json")
+
+    unique = {("figure", r["page"], r["label"], r["text"]) for r in raw}
+    expected = sorted(unique, key=lambda k: (k[1], k[0], k[2], k[3]))
+    assert [_key(h) for h in hits] == expected
+    assert pdf_path is None
+
+
+def test_index_files_prefer_combined_then_pass2_then_any_json(tmp_path):
+    _write(tmp_path / "b" / "pass2_hits.json", {})
+    _write(tmp_path / "b" / "combined_index.json", {})
+    _write(tmp_path / "a" / "combined_index.json", {})
+    _write(tmp_path / "a" / "notes.json", {})
+
+    rel = [p.relative_to(tmp_path).as_posix() for p in pdf_index._iter_index_files(tmp_path)]
+    assert rel == ["a/combined_index.json", "b/combined_index.json", "b/pass2_hits.json"]
+
+    only_other = tmp_path / "other"
+    _write(only_other / "z.json", {})
+    _write(only_other / "sub" / "a.json", {})
+    (only_other / "readme.txt").write_text("x", encoding="utf-8")
+    rel = [p.relative_to(only_other).as_posix() for p in pdf_index._iter_index_files(only_other)]
+    assert rel == ["sub/a.json", "z.json"]
+
+    f = tmp_path / "a" / "notes.json"
+    assert pdf_index._iter_index_files(f) == (f,)
+
+
+def test_index_file_listing_is_rescanned_when_a_directory_changes(tmp_path):
+    _write(tmp_path / "run1" / "pass2_hits.json", {"hits": [_HITS[1]]})
+    assert len(load_pdf_index_hits(tmp_path)[0]) == 1
+
+    # A file added to an already-scanned subdirectory is picked up.
+    _write(tmp_path / "run1" / "combined_index.json", {"hits": [_HITS[3]]})
+    assert [h.kind for h in load_pdf_index_hits(tmp_path)[0]] == ["chapter", "figure"]
+
+    # So is a file in a new nested directory, and removals are noticed too.
+    _write(tmp_path / "run2" / "deep" / "pass2_hits.json", {"hits": [_HITS[0]]})
+    assert len(load_pdf_index_hits(tmp_path)[0]) == 3
+    (tmp_path / "run1" / "pass2_hits.json").unlink()
+    assert [h.kind for h in load_pdf_index_hits(tmp_path)[0]] == ["chapter", "table"]
+
+
+def test_filter_hits_matches_text_case_insensitively():
+    hits = [
+        PdfIndexHit(kind="figure", page=1, label="1", text="PM10 Monitoring Sites"),
+        PdfIndexHit(kind="table", page=2, label="2", text="pm2.5 annual MEAN"),
+        PdfIndexHit(kind="chapter", page=3, label="3", text="PM overview"),
+    ]
+    assert hits[0].text_lower == "pm10 monitoring sites"
+    assert hits[0] == PdfIndexHit(kind="figure", page=1, label="1", text="PM10 Monitoring Sites")
+
+    assert filter_hits(hits) == hits[:2]
+    assert filter_hits(hits, kinds={"CHAPTER"}) == hits[2:]
+    assert filter_hits(hits, include_text_any=["Mean", " "]) == [hits[1]]
+    assert filter_hits(hits, exclude_text_any=["SITES"]) == [hits[1]]
+    assert filter_hits(hits, include_labels={" 1 ", ""}) == [hits[0]]
+
+
+def test_page_requests_params_json_matches_json_dumps():
+    hits = [
+        PdfIndexHit(kind="figure", page=7, label="2.1-1", text="사업 위치도"),
+        PdfIndexHit(kind="table", page=12, label="3.2/1", text='"인용" 표'),
+    ]
+    rows = build_pdf_page_data_requests(hits, pdf_path="a.pdf", src_id="S-01", priority_base=10)
+
+    assert [r["req_id"] for r in rows] == ["REQ-PDF-FIG-2_1-1-p007", "REQ-PDF-TBL-3_2_1-p012"]
+    assert [r["priority"] for r in rows] == [11, 12]
+    params = json.loads(rows[1]["params_json"])
+    assert rows[1]["params_json"] == json.dumps(params, ensure_ascii=False)
+    assert params["title"] == '<TBL 3.2/1> "인용" 표'
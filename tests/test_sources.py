@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+
+from eia_gen.models.sources import SourceEntry, SourceRegistry
+
+
+def _registry() -> SourceRegistry:
+    return SourceRegistry.model_validate(
+        {"version": 2, "sources": [{"source_id": "S-01", "kind": "report"}, {"id": "S-02"}]}
+    )
+
+
+def test_registry_lookup_by_id():
+    reg = _registry()
+    assert reg.has("S-01") and reg.has("S-02") and not reg.has("S-03")
+    assert reg.get("S-01") is reg.sources[0]
+    assert reg.get("S-01").type == "report"
+    assert reg.get("S-03") is None
+    assert reg.model_extra == {"version": 2}
+
+
+def test_registry_rejects_duplicate_ids():
+    with pytest.raises(ValueError, match="duplicate source id: S-01"):
+        SourceRegistry.model_validate([{"id": "S-01"}, {"source_id": "S-01"}])
+
+
+def test_registry_lookup_follows_copies_and_mutations():
+    reg = _registry()
+    assert not reg.model_copy(update={"sources": []}).has("S-01")
+
+    copied = reg.model_copy(deep=True)
+    assert copied.get("S-02") is copied.sources[1]
+
+    reg.sources.append(SourceEntry(id="S-03"))
+    assert reg.get("S-03") is reg.sources[2]
+
+    reg.sources = [SourceEntry(id="S-09")]
+    assert not reg.has("S-01")
+    assert reg.has("S-09")